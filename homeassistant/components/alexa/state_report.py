@@ -10,15 +10,14 @@ from typing import TYPE_CHECKING, cast
 import aiohttp
 import async_timeout
 
-from homeassistant.const import MATCH_ALL, STATE_ON
+from homeassistant.const import STATE_ON
 from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.event import async_track_state_change
-from homeassistant.helpers.significant_change import create_checker
+from homeassistant.helpers.significant_change import StateChanges, async_get_feed
 import homeassistant.util.dt as dt_util
 from homeassistant.util.json import JsonObjectType, json_loads_object
 
-from .const import API_CHANGE, DATE_FORMAT, DOMAIN, Cause
+from .const import API_CHANGE, DATE_FORMAT, Cause
 from .entities import ENTITY_ADAPTERS, AlexaEntity, generate_alexa_id
 from .errors import NoTokenAvailable, RequireRelink
 from .messages import AlexaResponse
@@ -38,39 +37,26 @@ async def async_enable_proactive_mode(hass, smart_home_config):
     # Validate we can get access token.
     await smart_home_config.async_get_access_token()
 
+    # Last reported properties, to filter changes which serialize the same
+    reported: dict[str, list[dict]] = {}
+
     @callback
-    def extra_significant_check(
-        hass: HomeAssistant,
-        old_state: str,
-        old_attrs: dict,
-        old_extra_arg: dict,
-        new_state: str,
-        new_attrs: dict,
-        new_extra_arg: dict,
-    ):
-        """Check if the serialized data has changed."""
-        return old_extra_arg is not None and old_extra_arg != new_extra_arg
+    def async_entity_filter(state: State) -> bool:
+        """Return if changes of an entity should be reported."""
+        if state.domain not in ENTITY_ADAPTERS:
+            return False
 
-    checker = await create_checker(hass, DOMAIN, extra_significant_check)
+        if not smart_home_config.should_expose(state.entity_id):
+            _LOGGER.debug("Not exposing %s because filtered by config", state.entity_id)
+            return False
+
+        return True
 
     async def async_entity_state_listener(
         changed_entity: str,
         old_state: State | None,
-        new_state: State | None,
+        new_state: State,
     ):
-        if not hass.is_running:
-            return
-
-        if not new_state:
-            return
-
-        if new_state.domain not in ENTITY_ADAPTERS:
-            return
-
-        if not smart_home_config.should_expose(changed_entity):
-            _LOGGER.debug("Not exposing %s because filtered by config", changed_entity)
-            return
-
         alexa_changed_entity: AlexaEntity = ENTITY_ADAPTERS[new_state.domain](
             hass, smart_home_config, new_state
         )
@@ -101,16 +87,24 @@ async def async_enable_proactive_mode(hass, smart_home_config):
 
         alexa_properties = list(alexa_changed_entity.serialize_properties())
 
-        if not checker.async_is_significant_change(
-            new_state, extra_arg=alexa_properties
-        ):
+        if reported.get(changed_entity) == alexa_properties:
             return
+        reported[changed_entity] = alexa_properties
 
         await async_send_changereport_message(
             hass, smart_home_config, alexa_changed_entity, alexa_properties
         )
 
-    return async_track_state_change(hass, MATCH_ALL, async_entity_state_listener)
+    @callback
+    def async_report_changes(changes: StateChanges) -> None:
+        """Report significant changes."""
+        for changed_entity, (old_state, new_state) in changes.items():
+            hass.async_create_task(
+                async_entity_state_listener(changed_entity, old_state, new_state)
+            )
+
+    feed = await async_get_feed(hass)
+    return feed.async_subscribe(async_entity_filter, async_report_changes)
 
 
 async def async_send_changereport_message(
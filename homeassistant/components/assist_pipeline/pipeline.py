@@ -260,6 +260,7 @@ class PipelineEvent:
 
 
 PipelineEventCallback = Callable[[PipelineEvent], None]
+PipelineAudioCallback = Callable[[bytes], None]
 
 
 @dataclass(frozen=True)
@@ -341,6 +342,8 @@ class PipelineRun:
     runner_data: Any | None = None
     intent_agent: str | None = None
     tts_audio_output: str | None = None
+    tts_audio_callback: PipelineAudioCallback | None = None
+    """Receives the text-to-speech audio as it is synthesized, ending with b""."""
 
     id: str = field(default_factory=ulid_util.ulid)
     stt_provider: stt.SpeechToTextEntity | stt.Provider = field(init=False)
@@ -599,6 +602,21 @@ class PipelineRun:
         )
 
         try:
+            if self.tts_audio_callback is not None:
+                # Stream audio as it is synthesized, the complete audio is
+                # cached afterwards so resolving the URL below is instant.
+                _extension, tts_chunks = await tts.async_stream_tts_audio(
+                    self.hass,
+                    self.tts_engine,
+                    tts_input,
+                    language=self.pipeline.tts_language,
+                    options=self.tts_options,
+                )
+                async for chunk in tts_chunks:
+                    if chunk:
+                        self.tts_audio_callback(chunk)
+                self.tts_audio_callback(b"")
+
             # Synthesize audio and get URL
             tts_media_id = tts_generate_media_source_id(
                 self.hass,
@@ -57,6 +57,7 @@ def async_register_websocket_api(hass: HomeAssistant) -> None:
                 vol.Optional("pipeline"): str,
                 vol.Optional("conversation_id"): vol.Any(str, None),
                 vol.Optional("timeout"): vol.Any(float, int),
+                vol.Optional("stream_tts_audio", default=False): bool,
             },
         ),
         cv.key_value_schemas(
@@ -101,6 +102,9 @@ async def websocket_run(
     end_stage = PipelineStage(msg["end_stage"])
     handler_id: int | None = None
     unregister_handler: Callable[[], None] | None = None
+    tts_handler_id: int | None = None
+    unregister_tts_handler: Callable[[], None] | None = None
+    tts_audio_callback: Callable[[bytes], None] | None = None
 
     # Arguments to PipelineInput
     input_args: dict[str, Any] = {
@@ -156,6 +160,21 @@ async def websocket_run(
         # Input to text-to-speech system
         input_args["tts_input"] = msg["input"]["text"]
 
+    if end_stage == PipelineStage.TTS and msg["stream_tts_audio"]:
+        # Audio is sent as binary messages prefixed with the id of a handler
+        # reserved for this run, an empty message marks the end of the audio.
+        (
+            tts_handler_id,
+            unregister_tts_handler,
+        ) = connection.async_register_binary_handler(_handle_unexpected_binary)
+        tts_audio_prefix = bytes((tts_handler_id,))
+
+        @callback
+        def send_tts_audio(chunk: bytes) -> None:
+            connection.send_message(tts_audio_prefix + chunk)
+
+        tts_audio_callback = send_tts_audio
+
     input_args["run"] = PipelineRun(
         hass,
         context=connection.context(msg),
@@ -165,8 +184,10 @@ async def websocket_run(
         event_callback=lambda event: connection.send_event(msg["id"], event),
         runner_data={
             "stt_binary_handler_id": handler_id,
+            "tts_binary_handler_id": tts_handler_id,
             "timeout": timeout,
         },
+        tts_audio_callback=tts_audio_callback,
     )
 
     pipeline_input = PipelineInput(**input_args)
@@ -201,6 +222,18 @@ async def websocket_run(
         if unregister_handler is not None:
             # Unregister binary handler
             unregister_handler()
+        if unregister_tts_handler is not None:
+            unregister_tts_handler()
+
+
+@callback
+def _handle_unexpected_binary(
+    _hass: HomeAssistant,
+    _connection: websocket_api.ActiveConnection,
+    data: bytes,
+) -> None:
+    """Ignore binary messages sent to the text-to-speech audio handler."""
+    _LOGGER.debug("Ignoring %s bytes sent to text-to-speech audio", len(data))
 
 
 @callback
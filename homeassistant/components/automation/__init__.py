@@ -5,6 +5,7 @@ import asyncio
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 import logging
+import time
 from typing import Any, Protocol, cast
 
 import voluptuous as vol
@@ -347,6 +348,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         self._blueprint_inputs = blueprint_inputs
         self._trace_config = trace_config
         self._attr_unique_id = automation_id
+        self.trigger_attach_time = 0.0
 
     @property
     def name(self) -> str:
@@ -666,16 +668,20 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
                 self._logger.error("Error rendering trigger variables: %s", err)
                 return None
 
-        return await async_initialize_triggers(
-            self.hass,
-            self._trigger_config,
-            self.async_trigger,
-            DOMAIN,
-            str(self.name),
-            log_cb,
-            home_assistant_start,
-            variables,
-        )
+        start = time.perf_counter()
+        try:
+            return await async_initialize_triggers(
+                self.hass,
+                self._trigger_config,
+                self.async_trigger,
+                DOMAIN,
+                str(self.name),
+                log_cb,
+                home_assistant_start,
+                variables,
+            )
+        finally:
+            self.trigger_attach_time = time.perf_counter() - start
 
 
 @dataclass(slots=True)
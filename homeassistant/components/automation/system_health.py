@@ -0,0 +1,54 @@
+"""Provide info to system health."""
+from typing import Any
+
+from homeassistant.components import system_health
+from homeassistant.components.homeassistant.triggers.state import (
+    async_get_state_trigger_index,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_component import EntityComponent
+
+from . import AutomationEntity
+from .const import DOMAIN
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info, "/config/automation")
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get info for the info page."""
+    component: EntityComponent[AutomationEntity] = hass.data[DOMAIN]
+    state_trigger_index = async_get_state_trigger_index(hass)
+    events = max(state_trigger_index.dispatched_events, 1)
+    scripts = [entity.action_script for entity in component.entities]
+    queued_runs_started = max(sum(script.queued_runs_started for script in scripts), 1)
+
+    return {
+        "trigger_attach_time": round(
+            sum(entity.trigger_attach_time for entity in component.entities) * 1000,
+            1,
+        ),
+        "state_trigger_events": state_trigger_index.dispatched_events,
+        "state_triggers_per_event": round(
+            state_trigger_index.invoked_listeners / events, 2
+        ),
+        "state_trigger_dispatch_time": round(
+            state_trigger_index.dispatch_time / events * 1000000, 1
+        ),
+        "queued_runs": sum(script.queued_runs for script in scripts),
+        "max_queue_depth": max(
+            (script.max_queue_depth for script in scripts), default=0
+        ),
+        "queue_wait_time": round(
+            sum(script.queue_wait_time for script in scripts)
+            / queued_runs_started
+            * 1000,
+            1,
+        ),
+        "dropped_runs": sum(script.dropped_runs for script in scripts),
+    }
@@ -8,6 +8,7 @@ from typing import Any
 from homeassistant.components.trace import (
     CONF_STORED_TRACES,
     ActionTrace,
+    async_finish_trace,
     async_store_trace,
 )
 from homeassistant.core import Context, HomeAssistant
@@ -67,4 +68,4 @@ def trace_automation(
         raise ex
     finally:
         if automation_id:
-            trace.finished()
+            async_finish_trace(hass, trace)
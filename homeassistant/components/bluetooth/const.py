@@ -40,6 +40,15 @@ FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS: Final = 60 * 15
 # than BlueZ's.
 CONNECTABLE_FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS: Final = 195
 
+# Repeated advertisements from the same source with the same data and
+# RSSI bucket are dropped for up to this many seconds once the advertising
+# interval of the device is known. It must stay well below the
+# TRACKER_BUFFERING_WOBBLE_SECONDS so the device does not go unavailable.
+ADVERTISEMENT_DEDUP_SECONDS: Final = 1.0
+
+# Width of the RSSI buckets in dBm for dropping repeated advertisements
+ADVERTISEMENT_DEDUP_RSSI_BUCKET: Final = 4
+
 
 # We must recover before we hit the 180s mark
 # where the device is removed from the stack
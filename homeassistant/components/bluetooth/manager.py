@@ -35,6 +35,8 @@ from .advertisement_tracker import (
 )
 from .base_scanner import BaseHaScanner, BluetoothScannerDevice
 from .const import (
+    ADVERTISEMENT_DEDUP_RSSI_BUCKET,
+    ADVERTISEMENT_DEDUP_SECONDS,
     FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS,
     UNAVAILABLE_TRACK_SECONDS,
 )
@@ -131,6 +133,11 @@ class BluetoothManager:
         ] = []
         self._all_history: dict[str, BluetoothServiceInfoBleak] = {}
         self._connectable_history: dict[str, BluetoothServiceInfoBleak] = {}
+        # Advertisements received, dropped without being matched, matched
+        # to callbacks or integrations, and dispatched to them
+        self._advertisement_counters: dict[str, int] = dict.fromkeys(
+            ("received", "dropped", "matched", "dispatched"), 0
+        )
         self._non_connectable_scanners: list[BaseHaScanner] = []
         self._connectable_scanners: list[BaseHaScanner] = []
         self._adapters: dict[str, AdapterDetails] = {}
@@ -173,6 +180,7 @@ class BluetoothManager:
                 service_info.as_dict() for service_info in self._all_history.values()
             ],
             "advertisement_tracker": self._advertisement_tracker.async_diagnostics(),
+            "advertisement_counters": self._advertisement_counters,
         }
 
     def _find_adapter_by_address(self, address: str) -> str | None:
@@ -407,6 +415,9 @@ class BluetoothManager:
         Callbacks from all the scanners arrive here.
         """
 
+        counters = self._advertisement_counters
+        counters["received"] += 1
+
         # Pre-filter noisy apple devices as they can account for 20-35% of the
         # traffic on a typical network.
         advertisement_data = service_info.advertisement
@@ -417,6 +428,7 @@ class BluetoothManager:
             and apple_data[0] not in APPLE_START_BYTES_WANTED
             and not advertisement_data.service_data
         ):
+            counters["dropped"] += 1
             return
 
         device = service_info.device
@@ -427,6 +439,27 @@ class BluetoothManager:
         old_connectable_service_info = connectable and connectable_history.get(address)
 
         source = service_info.source
+        old_service_info = all_history.get(address)
+        # Drop repeated advertisements from the source we already prefer
+        # before doing any other work. The history is still refreshed every
+        # ADVERTISEMENT_DEDUP_SECONDS to keep the device available, and only
+        # once the advertising interval of the device is known.
+        if (
+            old_service_info
+            and source == old_service_info.source
+            and (not connectable or old_connectable_service_info is old_service_info)
+            and service_info.time - old_service_info.time < ADVERTISEMENT_DEDUP_SECONDS
+            and service_info.rssi // ADVERTISEMENT_DEDUP_RSSI_BUCKET
+            == old_service_info.rssi // ADVERTISEMENT_DEDUP_RSSI_BUCKET
+            and address in self._advertisement_tracker.intervals
+            and service_info.manufacturer_data == old_service_info.manufacturer_data
+            and service_info.service_data == old_service_info.service_data
+            and service_info.service_uuids == old_service_info.service_uuids
+            and service_info.name == old_service_info.name
+        ):
+            counters["dropped"] += 1
+            return
+
         # This logic is complex due to the many combinations of scanners
         # that are supported.
         #
@@ -444,7 +477,7 @@ class BluetoothManager:
         #                       connectable scanner
         #
         if (
-            (old_service_info := all_history.get(address))
+            old_service_info
             and source != old_service_info.source
             and (scanner := self._sources.get(old_service_info.source))
             and scanner.scanning
@@ -477,10 +510,12 @@ class BluetoothManager:
                         )
                     )
                 ):
+                    counters["dropped"] += 1
                     return
 
                 connectable_history[address] = service_info
 
+            counters["dropped"] += 1
             return
 
         if connectable:
@@ -513,6 +548,7 @@ class BluetoothManager:
                 or service_info.name != old_service_info.name
             )
         ):
+            counters["dropped"] += 1
             return
 
         if not connectable and old_connectable_service_info:
@@ -549,7 +585,12 @@ class BluetoothManager:
             for callback_filters in self._bleak_callbacks:
                 _dispatch_bleak_callback(*callback_filters, device, advertisement_data)
 
-        for match in self._callback_index.match_callbacks(service_info):
+        matched_callbacks = self._callback_index.match_callbacks(service_info)
+        if matched_callbacks or matched_domains:
+            counters["matched"] += 1
+            counters["dispatched"] += len(matched_callbacks) + len(matched_domains)
+
+        for match in matched_callbacks:
             callback = match[CALLBACK]
             try:
                 callback(service_info, BluetoothChange.ADVERTISEMENT)
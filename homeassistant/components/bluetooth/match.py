@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from fnmatch import translate
 from functools import lru_cache
 import re
-from typing import TYPE_CHECKING, Final, Generic, TypedDict, TypeVar
+from typing import TYPE_CHECKING, Any, Final, Generic, TypedDict, TypeVar
 
 from lru import LRU  # pylint: disable=no-name-in-module
 
@@ -21,6 +21,7 @@ if TYPE_CHECKING:
 
 
 MAX_REMEMBER_ADDRESSES: Final = 2048
+MAX_MATCH_CACHE_SIZE: Final = 1024
 
 CALLBACK: Final = "callback"
 DOMAIN: Final = "domain"
@@ -172,6 +173,10 @@ class BluetoothMatcherIndexBase(Generic[_T]):
         self.service_uuid_set: set[str] = set()
         self.service_data_uuid_set: set[str] = set()
         self.manufacturer_id_set: set[int] = set()
+        # Matches by advertisement fingerprint, cleared when the index changes
+        self._match_cache: MutableMapping[tuple[Any, ...], list[_T]] = LRU(
+            MAX_MATCH_CACHE_SIZE
+        )
 
     def add(self, matcher: _T) -> bool:
         """Add a matcher to the index.
@@ -180,6 +185,7 @@ class BluetoothMatcherIndexBase(Generic[_T]):
 
         We put them in the bucket that they are most likely to match.
         """
+        self._match_cache.clear()
         # Local name is the cheapest to match since its just a dict lookup
         if LOCAL_NAME in matcher:
             self.local_name.setdefault(
@@ -212,6 +218,7 @@ class BluetoothMatcherIndexBase(Generic[_T]):
         Matchers only end up in one bucket, so once we have
         removed one, we are done.
         """
+        self._match_cache.clear()
         if LOCAL_NAME in matcher:
             self.local_name[_local_name_to_index_key(matcher[LOCAL_NAME])].remove(
                 matcher
@@ -239,7 +246,18 @@ class BluetoothMatcherIndexBase(Generic[_T]):
         self.manufacturer_id_set = set(self.manufacturer_id)
 
     def match(self, service_info: BluetoothServiceInfoBleak) -> list[_T]:
-        """Check for a match."""
+        """Check for a match.
+
+        Devices repeat the same few advertisements, so the matches are
+        cached by the advertisement fingerprint.
+        """
+        fingerprint = advertisement_fingerprint(service_info)
+        if (matches := self._match_cache.get(fingerprint)) is None:
+            matches = self._match_cache[fingerprint] = self._match(service_info)
+        return matches.copy()
+
+    def _match(self, service_info: BluetoothServiceInfoBleak) -> list[_T]:
+        """Check for a match without the cache."""
         matches = []
         if service_info.name and len(service_info.name) >= LOCAL_NAME_MIN_MATCH_LENGTH:
             for matcher in self.local_name.get(
@@ -348,6 +366,24 @@ class BluetoothCallbackMatcherIndex(
         return matches
 
 
+def advertisement_fingerprint(
+    service_info: BluetoothServiceInfoBleak,
+) -> tuple[Any, ...]:
+    """Return a hashable fingerprint of the advertisement fields used by matchers.
+
+    The address is not part of it since the index does not match on it.
+    """
+    advertisement_data = service_info.advertisement
+    return (
+        service_info.connectable,
+        service_info.name,
+        advertisement_data.local_name or service_info.device.name,
+        tuple(service_info.service_uuids),
+        tuple(service_info.service_data),
+        tuple(service_info.manufacturer_data.items()),
+    )
+
+
 def _local_name_to_index_key(local_name: str) -> str:
     """Convert a local name to an index.
 
@@ -12,6 +12,7 @@ from functools import partial
 import logging
 import os
 from random import SystemRandom
+import time
 from typing import Any, Final, cast, final
 
 from aiohttp import hdrs, web
@@ -119,6 +120,11 @@ _RND: Final = SystemRandom()
 
 MIN_STREAM_INTERVAL: Final = 0.5  # seconds
 
+# Images are shared between the clients requesting them within this time
+FRAME_CACHE_TTL: Final = MIN_STREAM_INTERVAL  # seconds
+# Image sizes with a cached frame per camera
+FRAME_CACHE_MAX_SIZES: Final = 4
+
 CAMERA_SERVICE_SNAPSHOT: Final = {vol.Required(ATTR_FILENAME): cv.template}
 
 CAMERA_SERVICE_PLAY_STREAM: Final = {
@@ -169,27 +175,35 @@ async def _async_get_image(
     """
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            if image_bytes := await camera.async_camera_image(
-                width=width, height=height
-            ):
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
-
+            # pylint: disable-next=protected-access
+            if image := await camera._async_get_frame(width, height):
                 return image
 
     raise HomeAssistantError("Unable to get image")
 
 
+async def _async_fetch_image(
+    camera: Camera, width: int | None, height: int | None
+) -> Image | None:
+    """Fetch an image from a camera and scale it in the executor."""
+    if not (image_bytes := await camera.async_camera_image(width=width, height=height)):
+        return None
+    content_type = camera.content_type
+    image = Image(content_type, image_bytes)
+    if (
+        width is not None
+        and height is not None
+        and ("jpeg" in content_type or "jpg" in content_type)
+    ):
+        return Image(
+            content_type,
+            await camera.hass.async_add_executor_job(
+                scale_jpeg_camera_image, image, width, height
+            ),
+        )
+    return image
+
+
 @bind_hass
 async def async_get_image(
     hass: HomeAssistant,
@@ -452,6 +466,10 @@ class Camera(Entity):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        self._frame_cache: dict[tuple[int | None, int | None], tuple[float, Image]] = {}
+        self._frame_fetches: dict[
+            tuple[int | None, int | None], asyncio.Task[Image | None]
+        ] = {}
 
     @property
     def entity_picture(self) -> str:
@@ -580,12 +598,66 @@ class Camera(Entity):
             partial(self.camera_image, width=width, height=height)
         )
 
+    @final
+    async def _async_get_frame(
+        self, width: int | None, height: int | None
+    ) -> Image | None:
+        """Return a recent image of the requested size.
+
+        Concurrent requests for the same size share a single fetch from the
+        camera and its result is reused for FRAME_CACHE_TTL seconds. Expired
+        frames are dropped when a frame is cached, and only the frames of the
+        last FRAME_CACHE_MAX_SIZES sizes are kept.
+        """
+        key = (width, height)
+        if (cached := self._frame_cache.get(key)) is not None:
+            if time.monotonic() - cached[0] < FRAME_CACHE_TTL:
+                return cached[1]
+            del self._frame_cache[key]
+
+        if (fetch := self._frame_fetches.get(key)) is None:
+            fetch = self._frame_fetches[key] = self.hass.async_create_task(
+                _async_fetch_image(self, width, height)
+            )
+
+            def _async_fetch_done(task: asyncio.Task[Image | None]) -> None:
+                """Cache the fetched image."""
+                del self._frame_fetches[key]
+                if (
+                    not task.cancelled()
+                    and task.exception() is None
+                    and (image := task.result()) is not None
+                ):
+                    now = time.monotonic()
+                    cache = self._frame_cache
+                    for cached_key in [
+                        cached_key
+                        for cached_key, (fetched, _) in cache.items()
+                        if now - fetched >= FRAME_CACHE_TTL
+                    ]:
+                        del cache[cached_key]
+                    cache.pop(key, None)
+                    cache[key] = (now, image)
+                    if len(cache) > FRAME_CACHE_MAX_SIZES:
+                        del cache[next(iter(cache))]
+
+            fetch.add_done_callback(_async_fetch_done)
+
+        # A client that times out or disconnects must not cancel the fetch
+        # for the other clients
+        return await asyncio.shield(fetch)
+
+    async def _async_get_frame_bytes(self) -> bytes | None:
+        """Return the bytes of a recent full size image."""
+        image = await self._async_get_frame(None, None)
+        return image.content if image else None
+
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
         """Generate an HTTP MJPEG stream from camera images."""
         return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
+            request, self._async_get_frame_bytes, self.content_type, interval
         )
 
     async def handle_async_mjpeg_stream(
@@ -3,17 +3,30 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, MutableMapping
 from dataclasses import dataclass
 import logging
 from pathlib import Path
 import re
 from typing import IO, Any
 
-from hassil.intents import Intents, ResponseType, SlotList, TextSlotList
-from hassil.recognize import RecognizeResult, recognize_all
-from hassil.util import merge_dict
+from hassil.expression import TextChunk
+from hassil.intents import (
+    Intents,
+    ResponseType,
+    SlotList,
+    TextSlotList,
+    TextSlotValue,
+)
+from hassil.recognize import (
+    PUNCTUATION,
+    WHITESPACE,
+    RecognizeResult,
+    recognize_all,
+)
+from hassil.util import merge_dict, normalize_text, normalize_whitespace
 from home_assistant_intents import get_domains_and_languages, get_intents
+from lru import LRU  # pylint: disable=no-name-in-module
 import yaml
 
 from homeassistant import core, setup
@@ -39,7 +52,8 @@ from .const import DEFAULT_EXPOSED_ATTRIBUTES, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 _DEFAULT_ERROR_TEXT = "Sorry, I couldn't understand that"
-_ENTITY_REGISTRY_UPDATE_FIELDS = ["aliases", "name", "original_name"]
+_ENTITY_REGISTRY_UPDATE_FIELDS = ["aliases", "area_id", "name", "original_name"]
+_RECOGNIZE_CACHE_SIZE = 256
 
 REGEX_TYPE = type(re.compile(""))
 
@@ -60,6 +74,60 @@ class LanguageIntents:
     loaded_components: set[str]
 
 
+@dataclass(slots=True)
+class ExposedEntity:
+    """Names and area of an exposed entity."""
+
+    names: list[tuple[str, str, dict[str, Any]]]
+    values: list[TextSlotValue]
+    area_id: str | None
+
+
+@dataclass(slots=True)
+class IndexedTextSlotList:
+    """Text slot list with the normalized text of each value."""
+
+    slot_list: TextSlotList
+    value_texts: list[str]
+
+    @classmethod
+    def from_values(cls, values: list[TextSlotValue]) -> IndexedTextSlotList:
+        """Create from slot values with plain text."""
+        return cls(
+            TextSlotList(values=values),
+            [
+                value.text_in.text.strip()
+                if isinstance(value.text_in, TextChunk)
+                else ""
+                for value in values
+            ],
+        )
+
+    def matchable(self, texts: tuple[str, ...], ignore_whitespace: bool) -> SlotList:
+        """Return the slot list without the values that can't match the texts.
+
+        hassil tries every value of a slot list wherever the list is referenced.
+        A value with plain text can only match if its text is part of the text
+        to recognize.
+        """
+        matched: dict[str, bool] = {}
+        values = []
+        for value_text, value in zip(self.value_texts, self.slot_list.values):
+            if (is_match := matched.get(value_text)) is None:
+                find_text = (
+                    WHITESPACE.sub("", value_text) if ignore_whitespace else value_text
+                )
+                is_match = matched[value_text] = any(
+                    find_text in text for text in texts
+                )
+            if is_match:
+                values.append(value)
+
+        if len(values) == len(self.slot_list.values):
+            return self.slot_list
+        return TextSlotList(values=values)
+
+
 def _get_language_variations(language: str) -> Iterable[str]:
     """Generate language codes with and without region."""
     yield language
@@ -108,7 +176,16 @@ class DefaultAgent(AbstractConversationAgent):
 
         # intent -> [sentences]
         self._config_intents: dict[str, Any] = {}
-        self._slot_lists: dict[str, SlotList] | None = None
+        self._slot_lists: dict[str, IndexedTextSlotList] | None = None
+        # entity_id -> exposed entity, None when all have to be rebuilt
+        self._exposed_entities: dict[str, ExposedEntity] | None = None
+        self._stale_entity_ids: set[str] = set()
+        # Incremented each time the slot lists are rebuilt
+        self._slot_lists_version = 0
+        # (language, normalized text, slot lists version) -> (intents, result)
+        self._recognize_cache: MutableMapping[
+            tuple[str, str, int], tuple[Intents, RecognizeResult | None]
+        ] = LRU(_RECOGNIZE_CACHE_SIZE)
 
     @property
     def supported_languages(self) -> list[str]:
@@ -168,12 +245,25 @@ class DefaultAgent(AbstractConversationAgent):
 
         slot_lists = self._make_slot_lists()
 
-        result = await self.hass.async_add_executor_job(
-            self._recognize,
-            user_input,
-            lang_intents,
-            slot_lists,
+        # Results only depend on the text hassil matches, the intents and
+        # the slot lists
+        cache_key = (
+            language,
+            normalize_text(user_input.text).strip(),
+            self._slot_lists_version,
         )
+        cached = self._recognize_cache.get(cache_key)
+        if cached is not None and cached[0] is lang_intents.intents:
+            result = cached[1]
+        else:
+            result = await self.hass.async_add_executor_job(
+                self._recognize,
+                user_input,
+                lang_intents,
+                slot_lists,
+            )
+            self._recognize_cache[cache_key] = (lang_intents.intents, result)
+
         if result is None:
             _LOGGER.debug("No intent was matched for '%s'", user_input.text)
             return _make_error_result(
@@ -238,13 +328,21 @@ class DefaultAgent(AbstractConversationAgent):
         self,
         user_input: ConversationInput,
         lang_intents: LanguageIntents,
-        slot_lists: dict[str, SlotList],
+        slot_lists: dict[str, IndexedTextSlotList],
     ) -> RecognizeResult | None:
         """Search intents for a match to user input."""
+        intents = lang_intents.intents
+        ignore_whitespace = intents.settings.ignore_whitespace
+        texts = _get_match_texts(user_input.text, intents)
+        matchable_slot_lists = {
+            name: slot_list.matchable(texts, ignore_whitespace)
+            for name, slot_list in slot_lists.items()
+        }
+
         # Prioritize matches with entity names above area names
         maybe_result: RecognizeResult | None = None
         for result in recognize_all(
-            user_input.text, lang_intents.intents, slot_lists=slot_lists
+            user_input.text, intents, slot_lists=matchable_slot_lists
         ):
             if "name" in result.entities:
                 return result
@@ -489,77 +587,103 @@ class DefaultAgent(AbstractConversationAgent):
     @core.callback
     def _async_handle_area_registry_changed(self, event: core.Event) -> None:
         """Clear area area cache when the area registry has changed."""
+        self._exposed_entities = None
         self._slot_lists = None
 
     @core.callback
     def _async_handle_entity_registry_changed(self, event: core.Event) -> None:
-        """Clear names list cache when an entity registry entry has changed."""
+        """Update the names of an entity when its registry entry has changed."""
         if event.data["action"] != "update" or not any(
             field in event.data["changes"] for field in _ENTITY_REGISTRY_UPDATE_FIELDS
         ):
             return
-        self._slot_lists = None
+        self._async_entity_changed(event.data["entity_id"])
 
     @core.callback
     def _async_handle_state_changed(self, event: core.Event) -> None:
-        """Clear names list cache when a state is added or removed from the state machine."""
+        """Update the names of an entity added to or removed from the state machine."""
         if event.data.get("old_state") and event.data.get("new_state"):
             return
-        self._slot_lists = None
+        self._async_entity_changed(event.data["entity_id"])
 
     @core.callback
     def _async_exposed_entities_updated(self) -> None:
         """Handle updated preferences."""
+        self._exposed_entities = None
         self._slot_lists = None
 
-    def _make_slot_lists(self) -> dict[str, SlotList]:
-        """Create slot lists with areas and entity names/aliases."""
-        if self._slot_lists is not None:
-            return self._slot_lists
+    @core.callback
+    def _async_entity_changed(self, entity_id: str) -> None:
+        """Rebuild the names of an entity when the slot lists are next used."""
+        self._stale_entity_ids.add(entity_id)
+        self._slot_lists = None
 
-        area_ids_with_entities: set[str] = set()
-        entity_registry = er.async_get(self.hass)
-        states = [
-            state
-            for state in self.hass.states.async_all()
-            if async_should_expose(self.hass, DOMAIN, state.entity_id)
-        ]
-        devices = dr.async_get(self.hass)
-
-        # Gather exposed entity names
-        entity_names = []
-        for state in states:
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
-
-            entity = entity_registry.async_get(state.entity_id)
-
-            if not entity:
-                # Default name
-                entity_names.append((state.name, state.name, context))
-                continue
+    def _make_exposed_entity(self, state: core.State) -> ExposedEntity | None:
+        """Create the names of an entity, None if it's not exposed."""
+        if not async_should_expose(self.hass, DOMAIN, state.entity_id):
+            return None
 
+        # Checked against "requires_context" and "excludes_context" in hassil
+        context = {"domain": state.domain}
+        if state.attributes:
+            # Include some attributes
+            for attr in DEFAULT_EXPOSED_ATTRIBUTES:
+                if attr not in state.attributes:
+                    continue
+                context[attr] = state.attributes[attr]
+
+        names: list[tuple[str, str, dict[str, Any]]] = []
+        area_id: str | None = None
+        if entity := er.async_get(self.hass).async_get(state.entity_id):
             if entity.aliases:
                 for alias in entity.aliases:
-                    entity_names.append((alias, alias, context))
-
-            # Default name
-            entity_names.append((state.name, state.name, context))
+                    names.append((alias, alias, context))
 
             if entity.area_id:
                 # Expose area too
-                area_ids_with_entities.add(entity.area_id)
+                area_id = entity.area_id
             elif entity.device_id:
                 # Check device for area as well
-                device = devices.async_get(entity.device_id)
+                device = dr.async_get(self.hass).async_get(entity.device_id)
                 if (device is not None) and device.area_id:
-                    area_ids_with_entities.add(device.area_id)
+                    area_id = device.area_id
+
+        # Default name
+        names.append((state.name, state.name, context))
+
+        return ExposedEntity(
+            names,
+            [TextSlotValue.from_tuple(name, allow_template=False) for name in names],
+            area_id,
+        )
+
+    def _make_slot_lists(self) -> dict[str, IndexedTextSlotList]:
+        """Create slot lists with areas and entity names/aliases."""
+        if self._slot_lists is not None:
+            return self._slot_lists
+
+        if self._exposed_entities is None:
+            self._exposed_entities = {}
+            for state in self.hass.states.async_all():
+                if exposed_entity := self._make_exposed_entity(state):
+                    self._exposed_entities[state.entity_id] = exposed_entity
+        else:
+            # Only rebuild the names of the entities that have changed
+            for entity_id in self._stale_entity_ids:
+                if (changed_state := self.hass.states.get(entity_id)) and (
+                    exposed_entity := self._make_exposed_entity(changed_state)
+                ):
+                    self._exposed_entities[entity_id] = exposed_entity
+                else:
+                    self._exposed_entities.pop(entity_id, None)
+        self._stale_entity_ids.clear()
+
+        exposed_entities = self._exposed_entities.values()
+        area_ids_with_entities = {
+            exposed_entity.area_id
+            for exposed_entity in exposed_entities
+            if exposed_entity.area_id
+        }
 
         # Gather areas from exposed entities
         areas = ar.async_get(self.hass)
@@ -574,13 +698,25 @@ class DefaultAgent(AbstractConversationAgent):
                 for alias in area.aliases:
                     area_names.append((alias, area.id))
 
-        _LOGGER.debug("Exposed areas: %s", area_names)
-        _LOGGER.debug("Exposed entities: %s", entity_names)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Exposed areas: %s", area_names)
+            _LOGGER.debug(
+                "Exposed entities: %s",
+                [name for entity in exposed_entities for name in entity.names],
+            )
 
         self._slot_lists = {
-            "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": TextSlotList.from_tuples(entity_names, allow_template=False),
+            "area": IndexedTextSlotList.from_values(
+                [
+                    TextSlotValue.from_tuple(area_name, allow_template=False)
+                    for area_name in area_names
+                ]
+            ),
+            "name": IndexedTextSlotList.from_values(
+                [value for entity in exposed_entities for value in entity.values]
+            ),
         }
+        self._slot_lists_version += 1
 
         return self._slot_lists
 
@@ -604,3 +740,27 @@ def _make_error_result(
     response.async_set_error(error_code, response_text)
 
     return ConversationResult(response, conversation_id)
+
+
+def _get_match_texts(text: str, intents: Intents) -> tuple[str, ...]:
+    """Return the texts hassil matches slot values against.
+
+    This mirrors the normalization of the input text in hassil.
+    """
+    text = normalize_text(text).strip()
+
+    # Skip words are removed longest first, since they may share prefixes
+    for skip_word in sorted(intents.skip_words, key=len, reverse=True):
+        skip_word = normalize_text(skip_word)
+        if intents.settings.ignore_whitespace:
+            text = text.replace(skip_word, "")
+        else:
+            text = re.sub(rf"\b{re.escape(skip_word)}\b", "", text)
+
+    if intents.settings.ignore_whitespace:
+        text = WHITESPACE.sub("", text)
+    else:
+        text = normalize_whitespace(text).strip()
+
+    # Punctuation is skipped when matching
+    return (text, PUNCTUATION.sub("", text))
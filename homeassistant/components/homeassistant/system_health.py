@@ -1,7 +1,17 @@
 """Provide info to system health."""
+from typing import Any
+
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import system_info
+from homeassistant.helpers.entity_platform import (
+    DATA_ENTITY_PLATFORM,
+    EntityPlatform,
+    PollMetrics,
+)
+
+# Polling platforms listed, overrunning platforms first, then the slowest
+REPORTED_POLLING_PLATFORMS = 3
 
 
 @callback
@@ -30,4 +40,61 @@ async def system_health_info(hass):
         "arch": info.get("arch"),
         "timezone": info.get("timezone"),
         "config_dir": hass.config.config_dir,
+        **_polling_info(hass),
+    }
+
+
+def _polling_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Return the poll metrics of the entity platforms.
+
+    Besides the totals, the platforms overrunning their scan interval and
+    then the slowest platforms are listed.
+    """
+    platforms: dict[str, list[EntityPlatform]] = hass.data.get(DATA_ENTITY_PLATFORM, {})
+    # Platforms set up for several config entries are reported together
+    by_key: dict[str, PollMetrics] = {}
+    for platforms_for_name in platforms.values():
+        for platform in platforms_for_name:
+            poll_metrics = platform.poll_metrics
+            if not poll_metrics.polls and not poll_metrics.overruns:
+                continue
+            key = f"{platform.domain}.{platform.platform_name}"
+            if (combined := by_key.get(key)) is None:
+                combined = by_key[key] = PollMetrics()
+            combined.polls += poll_metrics.polls
+            combined.overruns += poll_metrics.overruns
+            combined.total_duration += poll_metrics.total_duration
+            combined.max_duration = max(
+                combined.max_duration, poll_metrics.max_duration
+            )
+
+    metrics = by_key.values()
+    polls = sum(poll_metrics.polls for poll_metrics in metrics)
+    info: dict[str, Any] = {
+        "polls": polls,
+        "poll_overruns": sum(poll_metrics.overruns for poll_metrics in metrics),
+        "poll_duration": round(
+            sum(poll_metrics.total_duration for poll_metrics in metrics)
+            / max(polls, 1)
+            * 1000,
+            1,
+        ),
+        "max_poll_duration": round(
+            max((poll_metrics.max_duration for poll_metrics in metrics), default=0)
+            * 1000,
+            1,
+        ),
     }
+
+    slowest = sorted(
+        by_key.items(),
+        key=lambda item: (item[1].overruns, item[1].average_duration or 0),
+        reverse=True,
+    )[:REPORTED_POLLING_PLATFORMS]
+    for rank, (key, poll_metrics) in enumerate(slowest, 1):
+        info[f"polling_platform_{rank}"] = (
+            f"{key}: average {(poll_metrics.average_duration or 0) * 1000:.1f} ms,"
+            f" max {poll_metrics.max_duration * 1000:.1f} ms,"
+            f" {poll_metrics.overruns} overruns"
+        )
+    return info
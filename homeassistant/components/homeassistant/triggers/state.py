@@ -1,8 +1,10 @@
 """Offer state listening automation rules."""
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
 from datetime import timedelta
 import logging
+import time
 
 import voluptuous as vol
 
@@ -37,6 +39,8 @@ CONF_TO = "to"
 CONF_NOT_FROM = "not_from"
 CONF_NOT_TO = "not_to"
 
+DATA_STATE_TRIGGER_INDEX = "state_trigger_index"
+
 BASE_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_PLATFORM): "state",
@@ -66,6 +70,133 @@ TRIGGER_ATTRIBUTE_SCHEMA = BASE_SCHEMA.extend(
 )
 
 
+class _EntityStateTriggers:
+    """State trigger listeners of an entity, indexed by the states they match."""
+
+    __slots__ = ("by_to_state", "by_from_state", "other", "unsub")
+
+    def __init__(self) -> None:
+        """Initialize the listeners."""
+        self.by_to_state: dict[str, list[Callable[[Event], None]]] = {}
+        self.by_from_state: dict[str, list[Callable[[Event], None]]] = {}
+        self.other: list[Callable[[Event], None]] = []
+        self.unsub: CALLBACK_TYPE | None = None
+
+
+class StateTriggerIndex:
+    """Dispatch state changes to the state triggers which can match them.
+
+    Triggers which only match given target states are indexed by those
+    states, or by their source states when only those are given, so a
+    state change only reaches triggers whose constraints can match it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._entities: dict[str, _EntityStateTriggers] = {}
+        self.dispatched_events = 0
+        self.invoked_listeners = 0
+        self.dispatch_time = 0.0
+
+    @callback
+    def async_add_listener(
+        self,
+        entity_ids: str | Iterable[str],
+        listener: Callable[[Event], None],
+        to_states: Iterable[str] | None,
+        from_states: Iterable[str] | None,
+    ) -> CALLBACK_TYPE:
+        """Add a listener for state changes of entities."""
+        # Listeners which match any state can't be indexed by state
+        if to_states is not None and MATCH_ALL in (to_states := set(to_states)):
+            to_states = None
+        if from_states is not None and MATCH_ALL in (from_states := set(from_states)):
+            from_states = None
+        lists: list[list[Callable[[Event], None]]] = []
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        entity_ids = {entity_id.lower() for entity_id in entity_ids}
+        for entity_id in entity_ids:
+            if (triggers := self._entities.get(entity_id)) is None:
+                triggers = self._entities[entity_id] = _EntityStateTriggers()
+                triggers.unsub = async_track_state_change_event(
+                    self.hass, entity_id, self._async_dispatch
+                )
+            if to_states is not None:
+                lists.extend(
+                    triggers.by_to_state.setdefault(state, []) for state in to_states
+                )
+            elif from_states is not None:
+                lists.extend(
+                    triggers.by_from_state.setdefault(state, [])
+                    for state in from_states
+                )
+            else:
+                lists.append(triggers.other)
+
+        for listeners in lists:
+            listeners.append(listener)
+
+        @callback
+        def async_remove() -> None:
+            """Remove the listener."""
+            for listeners in lists:
+                listeners.remove(listener)
+            for entity_id in entity_ids:
+                triggers = self._entities[entity_id]
+                for index in (triggers.by_to_state, triggers.by_from_state):
+                    for state in [state for state, lst in index.items() if not lst]:
+                        del index[state]
+                if (
+                    not triggers.by_to_state
+                    and not triggers.by_from_state
+                    and not triggers.other
+                ):
+                    assert triggers.unsub is not None
+                    triggers.unsub()
+                    del self._entities[entity_id]
+
+        return async_remove
+
+    @callback
+    def _async_dispatch(self, event: Event) -> None:
+        """Dispatch a state change to the listeners which can match it."""
+        start = time.perf_counter()
+        entity_id: str = event.data["entity_id"]
+        if (triggers := self._entities.get(entity_id)) is None:
+            return
+        listeners = list(triggers.other)
+        if (to_s := event.data.get("new_state")) is not None and (
+            to_listeners := triggers.by_to_state.get(to_s.state)
+        ):
+            listeners.extend(to_listeners)
+        if (from_s := event.data.get("old_state")) is not None and (
+            from_listeners := triggers.by_from_state.get(from_s.state)
+        ):
+            listeners.extend(from_listeners)
+
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while dispatching event for %s to %s", entity_id, listener
+                )
+
+        self.dispatched_events += 1
+        self.invoked_listeners += len(listeners)
+        self.dispatch_time += time.perf_counter() - start
+
+
+@callback
+def async_get_state_trigger_index(hass: HomeAssistant) -> StateTriggerIndex:
+    """Return the state trigger index."""
+    if (index := hass.data.get(DATA_STATE_TRIGGER_INDEX)) is None:
+        index = hass.data[DATA_STATE_TRIGGER_INDEX] = StateTriggerIndex(hass)
+    return index
+
+
 async def async_validate_trigger_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConfigType:
@@ -230,7 +361,16 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    # Only plain state matches are indexed, attribute values may be unhashable
+    to_states = from_states = None
+    if attribute is None and to_state is not None:
+        to_states = [to_state] if isinstance(to_state, str) else to_state
+    elif attribute is None and from_state is not None:
+        from_states = [from_state] if isinstance(from_state, str) else from_state
+
+    unsub = async_get_state_trigger_index(hass).async_add_listener(
+        entity_ids, state_automation_listener, to_states, from_states
+    )
 
     @callback
     def async_remove():
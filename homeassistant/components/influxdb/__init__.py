@@ -12,6 +12,7 @@ import time
 from typing import Any
 
 from influxdb import InfluxDBClient, exceptions
+from influxdb.line_protocol import make_lines
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
 from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
 from influxdb_client.rest import ApiException
@@ -38,6 +39,7 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
@@ -66,6 +68,7 @@ from .const import (
     CONF_PORT,
     CONF_PRECISION,
     CONF_RETRY_COUNT,
+    CONF_SPOOL_SIZE,
     CONF_SSL,
     CONF_SSL_CA_CERT,
     CONF_TAGS,
@@ -73,11 +76,13 @@ from .const import (
     CONF_TOKEN,
     CONF_USERNAME,
     CONF_VERIFY_SSL,
+    CONF_WRITE_WORKERS,
     CONNECTION_ERROR,
     DEFAULT_API_VERSION,
     DEFAULT_HOST_V2,
     DEFAULT_MEASUREMENT_ATTR,
     DEFAULT_SSL_V2,
+    DEFAULT_WRITE_WORKERS,
     DOMAIN,
     EVENT_NEW_STATE,
     INFLUX_CONF_FIELDS,
@@ -87,6 +92,7 @@ from .const import (
     INFLUX_CONF_TAGS,
     INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    LINE_PROTOCOL_PRECISION,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
@@ -95,12 +101,14 @@ from .const import (
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_DIR,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .spool import InfluxSpool, InfluxSpoolWriter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -186,6 +194,10 @@ _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
         vol.Optional(CONF_COMPONENT_CONFIG_DOMAIN, default={}): vol.Schema(
             {cv.string: _CUSTOMIZE_ENTITY_SCHEMA}
         ),
+        vol.Optional(CONF_SPOOL_SIZE): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(CONF_WRITE_WORKERS, default=DEFAULT_WRITE_WORKERS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=8)
+        ),
     }
 )
 
@@ -327,6 +339,7 @@ class InfluxClient:
 
     data_repositories: list[str]
     write: Callable[[str], None]
+    write_lines: Callable[[bytes], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
 
@@ -353,16 +366,17 @@ def get_influx_connection(  # noqa: C901
         query_api = influx.query_api()
         initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
         write_api = influx.write_api(write_options=initial_write_mode)
+        lines_write_api = None
 
-        def write_v2(json):
-            """Write data to V2 influx."""
+        def _write_v2(api, json):
+            """Write data to V2 influx with the given write API."""
             data = {"bucket": bucket, "record": json}
 
             if precision is not None:
                 data["write_precision"] = precision
 
             try:
-                write_api.write(**data)
+                api.write(**data)
             except (urllib3.exceptions.HTTPError, OSError) as exc:
                 raise ConnectionError(CONNECTION_ERROR % exc) from exc
             except ApiException as exc:
@@ -370,6 +384,17 @@ def get_influx_connection(  # noqa: C901
                     raise ValueError(WRITE_ERROR % (json, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
+        def write_v2(json):
+            """Write data to V2 influx."""
+            _write_v2(write_api, json)
+
+        def write_lines_v2(lines):
+            """Write line protocol to V2 influx and wait for the result."""
+            nonlocal lines_write_api
+            if lines_write_api is None:
+                lines_write_api = influx.write_api(write_options=SYNCHRONOUS)
+            _write_v2(lines_write_api, lines)
+
         def query_v2(query, _=None):
             """Query V2 influx."""
             try:
@@ -400,7 +425,7 @@ def get_influx_connection(  # noqa: C901
             else:
                 buckets = []
 
-        return InfluxClient(buckets, write_v2, query_v2, close_v2)
+        return InfluxClient(buckets, write_v2, write_lines_v2, query_v2, close_v2)
 
     # Else it's a V1 client
     if CONF_SSL_CA_CERT in conf and conf[CONF_VERIFY_SSL]:
@@ -446,6 +471,23 @@ def get_influx_connection(  # noqa: C901
                 raise ValueError(WRITE_ERROR % (json, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
+    def write_lines_v1(lines):
+        """Write line protocol to V1 influx."""
+        try:
+            influx.write_points(
+                lines.decode().splitlines(), time_precision=precision, protocol="line"
+            )
+        except (
+            requests.exceptions.RequestException,
+            exceptions.InfluxDBServerError,
+            OSError,
+        ) as exc:
+            raise ConnectionError(CONNECTION_ERROR % exc) from exc
+        except exceptions.InfluxDBClientError as exc:
+            if exc.code == CODE_INVALID_INPUTS:
+                raise ValueError(WRITE_ERROR % (lines, exc)) from exc
+            raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
+
     def query_v1(query, database=None):
         """Query V1 influx."""
         try:
@@ -472,7 +514,7 @@ def get_influx_connection(  # noqa: C901
     if test_read:
         databases = [db["name"] for db in query_v1(TEST_QUERY_V1)]
 
-    return InfluxClient(databases, write_v1, query_v1, close_v1)
+    return InfluxClient(databases, write_v1, write_lines_v1, query_v1, close_v1)
 
 
 def _retry_setup(hass: HomeAssistant, config: ConfigType) -> None:
@@ -493,13 +535,38 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    spool = None
+    writers: list[InfluxSpoolWriter] = []
+    if CONF_SPOOL_SIZE in conf:
+        spool = InfluxSpool(
+            hass.config.path(STORAGE_DIR, SPOOL_DIR), conf[CONF_SPOOL_SIZE] * 1024**2
+        )
+        spool.load()
+        writers = [
+            InfluxSpoolWriter(spool, influx.write_lines, index)
+            for index in range(conf[CONF_WRITE_WORKERS])
+        ]
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        spool,
+        LINE_PROTOCOL_PRECISION.get(conf.get(CONF_PRECISION)),
+    )
     instance.start()
+    for writer in writers:
+        writer.start()
 
     def shutdown(event):
         """Shut down the thread."""
         instance.queue.put(None)
         instance.join()
+        if spool is not None:
+            # Batches that are not written yet stay in the spool
+            spool.close()
+            for writer in writers:
+                writer.join()
         influx.close()
 
     hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, shutdown)
@@ -510,13 +577,17 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(
+        self, hass, influx, event_to_json, max_tries, spool=None, precision=None
+    ):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue = queue.Queue()
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.spool = spool
+        self.precision = precision
         self.write_errors = 0
         self.shutdown = False
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
@@ -553,7 +624,8 @@ class InfluxThread(threading.Thread):
                     timestamp, event = item
                     age = time.monotonic() - timestamp
 
-                    if age < queue_seconds:
+                    # Events are only dropped when there is no spool to keep them
+                    if self.spool is not None or age < queue_seconds:
                         event_json = self.event_to_json(event)
                         if event_json:
                             json.append(event_json)
@@ -588,11 +660,18 @@ class InfluxThread(threading.Thread):
                         _LOGGER.error(err)
                     self.write_errors += len(json)
 
+    def spool_events(self, json):
+        """Encode preprocessed events as line protocol and add them to the spool."""
+        lines = make_lines({"points": json}, self.precision)
+        self.spool.append(lines.encode())
+
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
             count, json = self.get_events_json()
-            if json:
+            if json and self.spool is not None:
+                self.spool_events(json)
+            elif json:
                 self.write_to_influxdb(json)
             for _ in range(count):
                 self.queue.task_done()
@@ -0,0 +1,217 @@
+"""Disk spool for line protocol batches waiting to be written to InfluxDB."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import dataclass
+import logging
+import os
+import threading
+import time
+
+from .const import (
+    CAUGHT_UP_MESSAGE,
+    DOMAIN,
+    RETRY_DELAY,
+    SPOOL_FULL_MESSAGE,
+    SPOOL_MAX_BATCHES_PER_WRITE,
+    SPOOLING_MESSAGE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SPOOL_SUFFIX = ".lp"
+SPOOL_TMP_SUFFIX = ".tmp"
+
+
+@dataclass
+class SpoolBatch:
+    """A line protocol batch stored in the spool."""
+
+    path: str
+    size: int
+
+
+class InfluxSpool:
+    """A bounded write-ahead spool of line protocol batches.
+
+    Batches are appended by the InfluxThread and written by the
+    InfluxSpoolWriter threads. They stay on disk until they have been
+    written, so they survive InfluxDB outages and restarts. The oldest
+    batches are dropped when the spool grows beyond its maximum size.
+    """
+
+    def __init__(self, path: str, max_size: int) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self.max_size = max_size
+        self._pending: deque[SpoolBatch] = deque()
+        self._claimed = 0
+        self._size = 0
+        self._last_name = 0
+        self._condition = threading.Condition()
+        self._closed = threading.Event()
+        self._backlog_since: float | None = None
+        self._backlog_written = 0
+
+    @property
+    def size(self) -> int:
+        """Return the size of the batches in the spool."""
+        return self._size
+
+    def load(self) -> None:
+        """Load the batches left in the spool by a previous run."""
+        os.makedirs(self.path, exist_ok=True)
+        for name in sorted(os.listdir(self.path)):
+            path = os.path.join(self.path, name)
+            if name.endswith(SPOOL_TMP_SUFFIX):
+                os.unlink(path)
+            elif name.endswith(SPOOL_SUFFIX):
+                batch = SpoolBatch(path, os.path.getsize(path))
+                self._pending.append(batch)
+                self._size += batch.size
+        if self._pending:
+            _LOGGER.info(SPOOLING_MESSAGE, self._size)
+            self._backlog_since = time.monotonic()
+
+    def append(self, lines: bytes) -> None:
+        """Store a batch in the spool."""
+        with self._condition:
+            self._last_name = max(time.time_ns(), self._last_name + 1)
+            path = os.path.join(self.path, f"{self._last_name:020d}{SPOOL_SUFFIX}")
+        tmp_path = f"{path}{SPOOL_TMP_SUFFIX}"
+        with open(tmp_path, "wb") as fil:
+            fil.write(lines)
+        os.replace(tmp_path, path)
+
+        with self._condition:
+            self._pending.append(SpoolBatch(path, len(lines)))
+            self._size += len(lines)
+            dropped = 0
+            while self._size > self.max_size and len(self._pending) > 1:
+                batch = self._pending.popleft()
+                self._remove(batch)
+                dropped += batch.size
+            self._condition.notify()
+        if dropped:
+            _LOGGER.warning(SPOOL_FULL_MESSAGE, dropped)
+
+    def claim(self, max_batches: int) -> list[SpoolBatch] | None:
+        """Wait for and claim the oldest batches, return None once closed."""
+        with self._condition:
+            while not self._pending and not self._closed.is_set():
+                self._condition.wait()
+            if self._closed.is_set():
+                return None
+            batches = [
+                self._pending.popleft()
+                for _ in range(min(max_batches, len(self._pending)))
+            ]
+            self._claimed += len(batches)
+            return batches
+
+    def done(self, batches: list[SpoolBatch], written: bool) -> None:
+        """Remove written batches or put them back in the spool to retry."""
+        with self._condition:
+            self._claimed -= len(batches)
+            if not written:
+                self._pending.extendleft(reversed(batches))
+                if self._backlog_since is None:
+                    self._backlog_since = time.monotonic()
+                    self._backlog_written = 0
+                self._condition.notify_all()
+                return
+            for batch in batches:
+                self._remove(batch)
+            if self._backlog_since is not None:
+                self._backlog_written += sum(batch.size for batch in batches)
+                if not self._pending and not self._claimed:
+                    elapsed = time.monotonic() - self._backlog_since
+                    _LOGGER.info(
+                        CAUGHT_UP_MESSAGE,
+                        self._backlog_written,
+                        elapsed,
+                        self._backlog_written / max(elapsed, 0.001),
+                    )
+                    self._backlog_since = None
+            self._condition.notify_all()
+
+    def wait_closed(self, timeout: float) -> bool:
+        """Wait for the spool to close, return True if it is closed."""
+        return self._closed.wait(timeout)
+
+    def close(self) -> None:
+        """Stop handing out batches, the pending ones stay on disk."""
+        with self._condition:
+            self._closed.set()
+            self._condition.notify_all()
+
+    def block_till_done(self) -> None:
+        """Block till all batches are written."""
+        with self._condition:
+            while (self._pending or self._claimed) and not self._closed.is_set():
+                self._condition.wait()
+
+    def _remove(self, batch: SpoolBatch) -> None:
+        """Remove a batch from disk."""
+        self._size -= batch.size
+        with suppress(FileNotFoundError):
+            os.unlink(batch.path)
+
+
+class InfluxSpoolWriter(threading.Thread):
+    """A thread writing batches from the spool to InfluxDB."""
+
+    def __init__(
+        self, spool: InfluxSpool, write_lines: Callable[[bytes], None], index: int
+    ) -> None:
+        """Initialize the writer."""
+        threading.Thread.__init__(self, name=f"{DOMAIN}_writer_{index}")
+        self.spool = spool
+        self.write_lines = write_lines
+        # Number of batches combined in a single write, it doubles after each
+        # successful write to catch up quickly and halves after a failure
+        self.batches_per_write = 1
+        self.write_errors = 0
+
+    def run(self) -> None:
+        """Write batches until the spool is closed."""
+        while (batches := self.spool.claim(self.batches_per_write)) is not None:
+            self.write_batches(batches)
+
+    def write_batches(self, batches: list[SpoolBatch]) -> None:
+        """Write claimed batches to InfluxDB."""
+        try:
+            lines = b"".join(_read_batch(batch) for batch in batches)
+            self.write_lines(lines)
+        except ValueError as err:
+            if len(batches) > 1:
+                # Find the invalid batch by writing them one by one
+                self.batches_per_write = 1
+                self.spool.done(batches, False)
+                return
+            _LOGGER.error(err)
+            self.spool.done(batches, True)
+        except ConnectionError as err:
+            if not self.write_errors:
+                _LOGGER.error(err)
+            self.write_errors += 1
+            self.batches_per_write = max(self.batches_per_write // 2, 1)
+            self.spool.done(batches, False)
+            self.spool.wait_closed(RETRY_DELAY)
+        else:
+            self.write_errors = 0
+            self.batches_per_write = min(
+                self.batches_per_write * 2, SPOOL_MAX_BATCHES_PER_WRITE
+            )
+            self.spool.done(batches, True)
+
+
+def _read_batch(batch: SpoolBatch) -> bytes:
+    """Read a batch from disk."""
+    try:
+        with open(batch.path, "rb") as fil:
+            return fil.read()
+    except FileNotFoundError:
+        return b""
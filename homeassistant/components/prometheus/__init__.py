@@ -1,9 +1,11 @@
 """Support for Prometheus metrics export."""
 from contextlib import suppress
+import gzip
 import logging
 import string
+import time
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
 import voluptuous as vol
 
@@ -64,6 +66,10 @@ COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
 
 DEFAULT_NAMESPACE = "homeassistant"
 
+# Reuse the exposition of an unchanged registry for this many seconds, this
+# bounds how stale the process and platform metrics of a reused scrape can be
+SCRAPE_CACHE_MAX_AGE = 10
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.All(
@@ -90,8 +96,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(prometheus_client))
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -113,6 +117,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         override_metric,
         default_metric,
     )
+    hass.http.register_view(PrometheusView(prometheus_client, metrics))
 
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed)
     hass.bus.listen(
@@ -154,6 +159,8 @@ class PrometheusMetrics:
             self.metrics_prefix = ""
         self._metrics = {}
         self._climate_units = climate_units
+        # Incremented every time a metric is changed
+        self.generation = 0
 
     def handle_state_changed(self, event):
         """Listen for new messages on the bus, and add them to Prometheus."""
@@ -198,6 +205,7 @@ class PrometheusMetrics:
             "The last_updated timestamp",
         )
         last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
+        self.generation += 1
 
     def handle_entity_registry_updated(self, event):
         """Listen for deleted, disabled or renamed entities and remove them from the Prometheus Registry."""
@@ -236,6 +244,7 @@ class PrometheusMetrics:
                     )
                     with suppress(KeyError):
                         metric.remove(*sample.labels.values())
+        self.generation += 1
 
     def _handle_attributes(self, state):
         for key, value in state.attributes.items():
@@ -644,21 +653,84 @@ class PrometheusMetrics:
         metric.labels(**self._labels(state)).set(self.state_as_number(state))
 
 
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Return if an Accept-Encoding header accepts gzip.
+
+    An explicit gzip entry takes precedence over the * wildcard, and a q
+    value of 0 means the coding is not acceptable.
+    """
+    wildcard = False
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        name = name.strip().lower()
+        if name not in ("gzip", "*"):
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name == "gzip":
+            return quality > 0
+        wildcard = quality > 0
+    return wildcard
+
+
 class PrometheusView(HomeAssistantView):
     """Handle Prometheus requests."""
 
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli):
+    def __init__(self, prometheus_cli, metrics):
         """Initialize Prometheus view."""
         self.prometheus_cli = prometheus_cli
+        self._metrics = metrics
+        self._cache = {}
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
-        return web.Response(
-            body=self.prometheus_cli.generate_latest(self.prometheus_cli.REGISTRY),
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
+        encoder, content_type = self.prometheus_cli.exposition.choose_encoder(
+            request.headers.get(hdrs.ACCEPT)
         )
+        compress = _accepts_gzip(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+        key = (content_type, compress)
+        generation = self._metrics.generation
+        now = time.monotonic()
+
+        cached = self._cache.get(key)
+        if (
+            cached is not None
+            and cached[0] == generation
+            and now - cached[1] < SCRAPE_CACHE_MAX_AGE
+        ):
+            body = cached[2]
+        else:
+            # Generating the exposition of thousands of series takes long
+            # enough to block the event loop
+            body = await request.app["hass"].async_add_executor_job(
+                self._generate, encoder, compress
+            )
+            self._cache[key] = (generation, now, body)
+
+        headers = {}
+        if compress:
+            headers[hdrs.CONTENT_ENCODING] = "gzip"
+        if content_type == self.prometheus_cli.exposition.CONTENT_TYPE_LATEST:
+            return web.Response(
+                body=body, content_type=CONTENT_TYPE_TEXT_PLAIN, headers=headers
+            )
+        headers[hdrs.CONTENT_TYPE] = content_type
+        return web.Response(body=body, headers=headers)
+
+    def _generate(self, encoder, compress):
+        """Generate the exposition of the registry."""
+        body = encoder(self.prometheus_cli.REGISTRY)
+        if compress:
+            body = gzip.compress(body)
+        return body
@@ -34,7 +34,7 @@ from .const import (  # noqa: F401
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
-from .core import Recorder
+from .core import MAX_DB_EXECUTOR_WORKERS, Recorder
 from .services import async_register_services
 from .tasks import AddRecorderPlatformTask
 from .util import get_instance
@@ -52,6 +52,8 @@ DEFAULT_COMMIT_INTERVAL = 5
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
 CONF_DB_URL = "db_url"
+CONF_DB_READ_URL = "db_read_url"
+CONF_DB_EXECUTOR_WORKERS = "db_executor_workers"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
@@ -98,6 +100,10 @@ CONFIG_SCHEMA = vol.Schema(
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
                     vol.Optional(CONF_DB_URL): vol.All(cv.string, validate_db_url),
+                    vol.Optional(CONF_DB_READ_URL): vol.All(cv.string, validate_db_url),
+                    vol.Optional(
+                        CONF_DB_EXECUTOR_WORKERS, default=MAX_DB_EXECUTOR_WORKERS
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
@@ -145,6 +151,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
+    db_read_url = conf.get(CONF_DB_READ_URL)
+    db_executor_workers = conf[CONF_DB_EXECUTOR_WORKERS]
     exclude = conf[CONF_EXCLUDE]
     exclude_event_types: set[str] = set(exclude.get(CONF_EVENT_TYPES, []))
     if EVENT_STATE_CHANGED in exclude_event_types:
@@ -162,6 +170,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
         exclude_attributes_by_domain=exclude_attributes_by_domain,
+        db_read_url=db_read_url,
+        db_executor_workers=db_executor_workers,
     )
     instance.async_initialize()
     instance.async_register()
@@ -179,6 +179,8 @@ class Recorder(threading.Thread):
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
         exclude_attributes_by_domain: dict[str, set[str]],
+        db_read_url: str | None = None,
+        db_executor_workers: int = MAX_DB_EXECUTOR_WORKERS,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -192,6 +194,8 @@ class Recorder(threading.Thread):
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask] = queue.SimpleQueue()
         self.db_url = uri
+        self.db_read_url = db_read_url
+        self.db_executor_workers = db_executor_workers
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
         self.database_engine: DatabaseEngine | None = None
@@ -204,6 +208,7 @@ class Recorder(threading.Thread):
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        self.read_engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
@@ -229,6 +234,7 @@ class Recorder(threading.Thread):
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
@@ -274,6 +280,17 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_session(self) -> Session:
+        """Get a new sqlalchemy session for read only queries.
+
+        Queries from the database executor use the read database if one is
+        configured. The recorder thread always reads from the database it
+        writes to.
+        """
+        if self._get_read_session is None or threading.get_ident() == self.thread_id:
+            return self.get_session()
+        return self._get_read_session()
+
     def queue_task(self, task: RecorderTask) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
@@ -287,14 +304,15 @@ class Recorder(threading.Thread):
         """Start the executor."""
         self._db_executor = DBInterruptibleThreadPoolExecutor(
             thread_name_prefix=DB_WORKER_PREFIX,
-            max_workers=MAX_DB_EXECUTOR_WORKERS,
+            max_workers=self.db_executor_workers,
             shutdown_hook=self._shutdown_pool,
         )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
-        if self.engine and hasattr(self.engine.pool, "shutdown"):
-            self.engine.pool.shutdown()
+        for engine in (self.engine, self.read_engine):
+            if engine and hasattr(engine.pool, "shutdown"):
+                engine.pool.shutdown()
 
     @callback
     def async_initialize(self) -> None:
@@ -1353,19 +1371,30 @@ class Recorder(threading.Thread):
             self.database_engine = database_engine
         self._completed_first_database_setup = True
 
-    def _setup_connection(self) -> None:
-        """Ensure database is ready to fly."""
+    def _setup_read_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific connection settings for the read database."""
+        assert self.read_engine is not None
+        setup_connection_for_dialect(
+            self, self.read_engine.dialect.name, dbapi_connection, False
+        )
+
+    def _engine_kwargs(self, db_url: str) -> dict[str, Any]:
+        """Return the create_engine arguments for a database url."""
         kwargs: dict[str, Any] = {}
-        self._completed_first_database_setup = False
+        # Pool size must accommodate Recorder thread + All db executors
+        pool_size = self.db_executor_workers + 1
 
-        if self.db_url == SQLITE_URL_PREFIX or ":memory:" in self.db_url:
+        if db_url == SQLITE_URL_PREFIX or ":memory:" in db_url:
             kwargs["connect_args"] = {"check_same_thread": False}
             kwargs["poolclass"] = MutexPool
             MutexPool.pool_lock = threading.RLock()
             kwargs["pool_reset_on_return"] = None
-        elif self.db_url.startswith(SQLITE_URL_PREFIX):
+        elif db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["poolclass"] = RecorderPool
-        elif self.db_url.startswith(
+            kwargs["pool_size"] = pool_size
+        elif db_url.startswith(
             (
                 MARIADB_URL_PREFIX,
                 MARIADB_PYMYSQL_URL_PREFIX,
@@ -1374,7 +1403,7 @@ class Recorder(threading.Thread):
             )
         ):
             kwargs["connect_args"] = {"charset": "utf8mb4"}
-            if self.db_url.startswith((MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)):
+            if db_url.startswith((MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)):
                 # If they have configured MySQLDB but don't have
                 # the MySQLDB module installed this will throw
                 # an ImportError which we suppress here since
@@ -1383,9 +1412,18 @@ class Recorder(threading.Thread):
                 with contextlib.suppress(ImportError):
                     kwargs["connect_args"]["conv"] = build_mysqldb_conv()
 
-        # Disable extended logging for non SQLite databases
-        if not self.db_url.startswith(SQLITE_URL_PREFIX):
+        if not db_url.startswith(SQLITE_URL_PREFIX):
+            # Disable extended logging for non SQLite databases
             kwargs["echo"] = False
+            if pool_size > POOL_SIZE:
+                kwargs["pool_size"] = pool_size
+
+        return kwargs
+
+    def _setup_connection(self) -> None:
+        """Ensure database is ready to fly."""
+        self._completed_first_database_setup = False
+        kwargs = self._engine_kwargs(self.db_url)
 
         if self._using_file_sqlite:
             validate_or_move_away_sqlite_database(self.db_url)
@@ -1398,12 +1436,28 @@ class Recorder(threading.Thread):
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
+        if self.db_read_url:
+            self.read_engine = create_engine(
+                self.db_read_url, **self._engine_kwargs(self.db_read_url), future=True
+            )
+            sqlalchemy_event.listen(
+                self.read_engine, "connect", self._setup_read_connection
+            )
+            self._get_read_session = scoped_session(
+                sessionmaker(bind=self.read_engine, future=True)
+            )
+            _LOGGER.debug("Connected to recorder read database")
+
     def _close_connection(self) -> None:
         """Close the connection."""
         if self.engine:
             self.engine.dispose()
             self.engine = None
+        if self.read_engine:
+            self.read_engine.dispose()
+            self.read_engine = None
         self._get_session = None
+        self._get_read_session = None
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
@@ -0,0 +1,38 @@
+"""Provide info to system health."""
+from typing import Any
+
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_component import EntityComponent
+
+from . import ScriptEntity
+from .const import DOMAIN
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info, "/config/script")
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get info for the info page."""
+    component: EntityComponent[ScriptEntity] = hass.data[DOMAIN]
+    scripts = [entity.script for entity in component.entities]
+    queued_runs_started = max(sum(script.queued_runs_started for script in scripts), 1)
+
+    return {
+        "queued_runs": sum(script.queued_runs for script in scripts),
+        "max_queue_depth": max(
+            (script.max_queue_depth for script in scripts), default=0
+        ),
+        "queue_wait_time": round(
+            sum(script.queue_wait_time for script in scripts)
+            / queued_runs_started
+            * 1000,
+            1,
+        ),
+        "dropped_runs": sum(script.dropped_runs for script in scripts),
+    }
@@ -8,6 +8,7 @@ from typing import Any
 from homeassistant.components.trace import (
     CONF_STORED_TRACES,
     ActionTrace,
+    async_finish_trace,
     async_store_trace,
 )
 from homeassistant.core import Context, HomeAssistant
@@ -42,4 +43,4 @@ def trace_script(
         raise ex
     finally:
         if item_id:
-            trace.finished()
+            async_finish_trace(hass, trace)
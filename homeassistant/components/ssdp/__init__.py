@@ -6,15 +6,18 @@ from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass, field
 from datetime import timedelta
 from enum import Enum
+from http import HTTPStatus
 from ipaddress import IPv4Address, IPv6Address
 import logging
 import socket
 from time import time
-from typing import Any
+from typing import Any, cast
 from urllib.parse import urljoin
 import xml.etree.ElementTree as ET
 
+import aiohttp
 from async_upnp_client.aiohttp import AiohttpSessionRequester
+from async_upnp_client.client import UpnpRequester
 from async_upnp_client.const import (
     AddressTupleVXType,
     DeviceIcon,
@@ -23,6 +26,7 @@ from async_upnp_client.const import (
     SsdpSource,
 )
 from async_upnp_client.description_cache import DescriptionCache
+from async_upnp_client.exceptions import UpnpResponseError
 from async_upnp_client.server import (
     SSDP_SEARCH_RESPONDER_OPTION_ALWAYS_REPLY_WITH_ROOT_DEVICE,
     SSDP_SEARCH_RESPONDER_OPTIONS,
@@ -53,6 +57,7 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.instance_id import async_get as async_get_instance_id
 from homeassistant.helpers.network import NoURLAvailableError, get_url
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.system_info import async_get_system_info
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import async_get_ssdp, bind_hass
@@ -64,6 +69,13 @@ UPNP_SERVER_MIN_PORT = 40000
 UPNP_SERVER_MAX_PORT = 40100
 SCAN_INTERVAL = timedelta(minutes=2)
 
+STORAGE_KEY = "ssdp.descriptions"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 60
+# Stored descriptions of devices not seen for this long are dropped
+STORAGE_MAX_AGE = timedelta(days=30)
+MAX_CONCURRENT_DESCRIPTION_FETCHES = 8
+
 IPV4_BROADCAST = IPv4Address("255.255.255.255")
 
 # Attributes for accessing info from SSDP response
@@ -239,7 +251,7 @@ class IntegrationMatchers:
     def __init__(self) -> None:
         """Init optimized integration matching."""
         self._match_by_key: dict[
-            str, dict[str, list[tuple[str, dict[str, str]]]]
+            str, dict[str, list[tuple[str, tuple[tuple[str, str], ...]]]]
         ] | None = None
 
     @core_callback
@@ -250,16 +262,17 @@ class IntegrationMatchers:
 
         Here we convert the primary match keys into their own
         dicts so we can do lookups of the primary match
-        key to find the match dict.
+        key to find the match dict. The keys of the match dicts
+        are lowercased up front so matching does not have to.
         """
         self._match_by_key = {}
         for key in PRIMARY_MATCH_KEYS:
-            matchers_by_key = self._match_by_key[key] = {}
+            matchers_by_key = self._match_by_key[key.lower()] = {}
             for domain, matchers in integration_matchers.items():
                 for matcher in matchers:
                     if match_value := matcher.get(key):
                         matchers_by_key.setdefault(match_value, []).append(
-                            (domain, matcher)
+                            (domain, tuple((k.lower(), v) for k, v in matcher.items()))
                         )
 
     @core_callback
@@ -267,17 +280,81 @@ class IntegrationMatchers:
         """Find domains matching the passed CaseInsensitiveDict."""
         assert self._match_by_key is not None
         domains = set()
+        get_lower = info_with_desc.get_lower
         for key, matchers_by_key in self._match_by_key.items():
-            if not (match_value := info_with_desc.get(key)):
+            if not (match_value := get_lower(key)):
                 continue
             for domain, matcher in matchers_by_key.get(match_value, []):
                 if domain in domains:
                     continue
-                if all(info_with_desc.get(k) == v for (k, v) in matcher.items()):
+                if all(get_lower(k) == v for (k, v) in matcher):
                     domains.add(domain)
         return domains
 
 
+class PersistentDescriptionCache(DescriptionCache):
+    """Description cache which stores descriptions with their ETag.
+
+    After a restart the stored descriptions are revalidated with a
+    conditional request, so only changed descriptions are downloaded
+    again. The number of concurrent fetches is bounded to avoid a burst
+    of requests on networks with many devices.
+    """
+
+    def __init__(self, hass: HomeAssistant, requester: UpnpRequester) -> None:
+        """Initialize the cache."""
+        super().__init__(requester)
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._stored: dict[str, dict[str, Any]] = {}
+        self._fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DESCRIPTION_FETCHES)
+
+    async def async_load(self) -> None:
+        """Load the stored descriptions."""
+        stored = await self._store.async_load() or {}
+        oldest = time() - STORAGE_MAX_AGE.total_seconds()
+        self._stored = {
+            location: description
+            for location, description in stored.items()
+            if description["last_seen"] > oldest
+        }
+
+    @core_callback
+    def _async_data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the descriptions to store."""
+        return self._stored
+
+    async def _async_fetch_description(self, location: str) -> str | None:
+        """Download a description from location, unless it is unchanged."""
+        stored = self._stored.get(location)
+        headers = {"If-None-Match": stored["etag"]} if stored else None
+        try:
+            async with self._fetch_semaphore:
+                (
+                    status,
+                    response_headers,
+                    body,
+                ) = await self._requester.async_http_request("GET", location, headers)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Error fetching %s: %s", location, err)
+            return None
+
+        if status == HTTPStatus.NOT_MODIFIED and stored:
+            stored["last_seen"] = time()
+            self._store.async_delay_save(self._async_data_to_save, STORAGE_SAVE_DELAY)
+            return cast(str, stored["xml"])
+        if status != HTTPStatus.OK:
+            raise UpnpResponseError(status=status, headers=response_headers)
+
+        if etag := response_headers.get("ETag"):
+            self._stored[location] = {"etag": etag, "xml": body, "last_seen": time()}
+        elif not self._stored.pop(location, None):
+            return body
+        self._store.async_delay_save(self._async_data_to_save, STORAGE_SAVE_DELAY)
+        return body
+
+
 class Scanner:
     """Class to manage SSDP searching and SSDP advertisements."""
 
@@ -289,7 +366,7 @@ class Scanner:
         self._cancel_scan: Callable[[], None] | None = None
         self._ssdp_listeners: list[SsdpListener] = []
         self._callbacks: list[tuple[SsdpCallback, dict[str, str]]] = []
-        self._description_cache: DescriptionCache | None = None
+        self._description_cache: PersistentDescriptionCache | None = None
         self.integration_matchers = integration_matchers
 
     @property
@@ -376,7 +453,8 @@ class Scanner:
         """Start the scanners."""
         session = async_get_clientsession(self.hass, verify_ssl=False)
         requester = AiohttpSessionRequester(session, True, 10)
-        self._description_cache = DescriptionCache(requester)
+        self._description_cache = PersistentDescriptionCache(self.hass, requester)
+        await self._description_cache.async_load()
 
         await self._async_start_ssdp_listeners()
 
@@ -36,6 +36,9 @@ MAX_TIMESTAMP_GAP = 30  # seconds - anything from 10 to 50000 is probably reason
 MAX_MISSING_DTS = 6  # Number of packets missing DTS to allow
 SOURCE_TIMEOUT = 30  # Timeout for reading stream source
 
+MAX_SNAPSHOT_SIZES = 4  # Number of image sizes kept ready for snapshots
+SNAPSHOT_SIZE_TIMEOUT = 60  # Seconds an image size is kept ready after a request
+
 STREAM_RESTART_INCREMENT = 10  # Increase wait_timeout by this amount each retry
 STREAM_RESTART_RESET_TIME = 300  # Reset wait_timeout after this many seconds
 
@@ -7,6 +7,8 @@ from collections.abc import Callable, Coroutine, Iterable
 import datetime
 from enum import IntEnum
 import logging
+import threading
+import time
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
@@ -22,12 +24,14 @@ from homeassistant.util.decorator import Registry
 from .const import (
     ATTR_STREAMS,
     DOMAIN,
+    MAX_SNAPSHOT_SIZES,
     SEGMENT_DURATION_ADJUSTER,
+    SNAPSHOT_SIZE_TIMEOUT,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
 
 if TYPE_CHECKING:
-    from av import CodecContext, Packet
+    from av import CodecContext, Packet, VideoFrame
 
     from homeassistant.components.camera import DynamicStreamSettings
 
@@ -102,6 +106,9 @@ class Segment:
     hls_num_parts_rendered: int = attr.ib(default=0)
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = attr.ib(default=False)
+    # Joined part data shared by all requests until the next part is added
+    _data: bytes = attr.ib(default=b"", init=False)
+    _data_num_parts: int = attr.ib(default=0, init=False)
 
     def __attrs_post_init__(self) -> None:
         """Run after init."""
@@ -140,7 +147,17 @@ class Segment:
 
     def get_data(self) -> bytes:
         """Return reconstructed data for all parts as bytes, without init."""
-        return b"".join([part.data for part in self.parts])
+        if self._data_num_parts != len(self.parts):
+            self._data = b"".join([part.data for part in self.parts])
+            self._data_num_parts = len(self.parts)
+        return self._data
+
+    def get_data_view(self) -> memoryview:
+        """Return the data for all parts as a memoryview, without init.
+
+        Slicing the view does not copy the data.
+        """
+        return memoryview(self.get_data())
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
@@ -421,11 +438,13 @@ class KeyFrameConverter:
 
     An overview of the thread and state interaction:
         the worker thread sets a packet
+        the snapshot stage of the worker decodes the packet once and encodes
+            images in the sizes requested recently
         get_image is called from the main asyncio loop
-        get_image schedules _generate_image in an executor thread
-        _generate_image will try to create an image from the packet
-        _generate_image will clear the packet, so there will only be one attempt per packet
-    If successful, self._image will be updated and returned by get_image
+        get_image returns the image from memory when it is ready, otherwise
+            it schedules _generate_image in an executor thread
+        _decode_keyframe will clear the packet, so there will only be one attempt per packet
+    If successful, the images of the keyframe will be updated and returned by get_image
     If unsuccessful, get_image will return the previous image
     """
 
@@ -445,8 +464,15 @@ class KeyFrameConverter:
         self.packet: Packet = None
         self._hass = hass
         self._image: bytes | None = None
+        # Images of the last decoded keyframe by requested width and height
+        self._images: dict[tuple[int | None, int | None], bytes] = {}
+        # Time of the last request for each image size
+        self._image_sizes: dict[tuple[int | None, int | None], float] = {}
+        self._frame: VideoFrame | None = None
         self._turbojpeg = TurboJPEGSingleton.instance()
         self._lock = asyncio.Lock()
+        # Serializes decoding between the snapshot stage and executor threads
+        self._decode_lock = threading.Lock()
         self._codec_context: CodecContext | None = None
         self._stream_settings = stream_settings
         self._dynamic_stream_settings = dynamic_stream_settings
@@ -475,16 +501,14 @@ class KeyFrameConverter:
         """Transform image to a given orientation."""
         return TRANSFORM_IMAGE_FUNCTION[orientation](image)
 
-    def _generate_image(self, width: int | None, height: int | None) -> None:
-        """Generate the keyframe image.
+    def _decode_keyframe(self) -> bool:
+        """Decode the latest keyframe packet, return True if there is a new frame.
 
-        This is run in an executor thread, but since it is called within an
-        the asyncio lock from the main thread, there will only be one entry
-        at a time per instance.
+        This is called with the decode lock held.
         """
 
         if not (self._turbojpeg and self.packet and self._codec_context):
-            return
+            return False
         packet = self.packet
         self.packet = None
         for _ in range(2):  # Retry once if codec context needs to be flushed
@@ -502,19 +526,68 @@ class KeyFrameConverter:
                 self._codec_context.open()
         else:
             _LOGGER.debug("Unable to decode keyframe")
+            return False
+        if not frames:
+            return False
+        self._frame = frames[0]
+        self._images = {}
+        return True
+
+    def _encode_image(
+        self, frame: VideoFrame, width: int | None, height: int | None
+    ) -> bytes:
+        """Encode a decoded keyframe as a jpeg in the given size."""
+        # Keyframes are only decoded when turbojpeg is available
+        assert self._turbojpeg
+        if width and height:
+            if self._dynamic_stream_settings.orientation >= 5:
+                frame = frame.reformat(width=height, height=width)
+            else:
+                frame = frame.reformat(width=width, height=height)
+        bgr_array = self.transform_image(
+            frame.to_ndarray(format="bgr24"),
+            self._dynamic_stream_settings.orientation,
+        )
+        return bytes(self._turbojpeg.encode(bgr_array))
+
+    def generate_images(self) -> None:
+        """Decode a new keyframe and encode it in the recently requested sizes.
+
+        This is run by the snapshot stage of the worker, so images are ready
+        before they are requested. Nothing is decoded while no images are
+        requested.
+        """
+
+        now = time.monotonic()
+        sizes = [
+            size
+            for size, requested in list(self._image_sizes.items())
+            if now - requested < SNAPSHOT_SIZE_TIMEOUT
+        ]
+        if not sizes:
             return
-        if frames:
-            frame = frames[0]
-            if width and height:
-                if self._dynamic_stream_settings.orientation >= 5:
-                    frame = frame.reformat(width=height, height=width)
-                else:
-                    frame = frame.reformat(width=width, height=height)
-            bgr_array = self.transform_image(
-                frame.to_ndarray(format="bgr24"),
-                self._dynamic_stream_settings.orientation,
-            )
-            self._image = bytes(self._turbojpeg.encode(bgr_array))
+        with self._decode_lock:
+            if not self._decode_keyframe() or not (frame := self._frame):
+                return
+            self._images = {size: self._encode_image(frame, *size) for size in sizes}
+
+    def _generate_image(self, width: int | None, height: int | None) -> None:
+        """Generate the keyframe image.
+
+        This is run in an executor thread, but since it is called within an
+        the asyncio lock from the main thread, there will only be one entry
+        at a time per instance.
+        """
+
+        with self._decode_lock:
+            self._decode_keyframe()
+            if (image := self._images.get((width, height))) is None:
+                if not (frame := self._frame):
+                    return
+                image = self._images[(width, height)] = self._encode_image(
+                    frame, width, height
+                )
+            self._image = image
 
     async def async_get_image(
         self,
@@ -523,6 +596,17 @@ class KeyFrameConverter:
     ) -> bytes | None:
         """Fetch an image from the Stream and return it as a jpeg in bytes."""
 
+        size = (width, height)
+        # Keep the most recently requested sizes ready for the next keyframes
+        self._image_sizes.pop(size, None)
+        self._image_sizes[size] = time.monotonic()
+        while len(self._image_sizes) > MAX_SNAPSHOT_SIZES:
+            del self._image_sizes[next(iter(self._image_sizes))]
+
+        if self.packet is None and (image := self._images.get(size)) is not None:
+            self._image = image
+            return image
+
         # Use a lock to ensure only one thread is working on the keyframe at a time
         async with self._lock:
             await self._hass.async_add_executor_job(self._generate_image, width, height)
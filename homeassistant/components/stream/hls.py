@@ -4,7 +4,7 @@ from __future__ import annotations
 from http import HTTPStatus
 from typing import TYPE_CHECKING, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 
 from homeassistant.core import HomeAssistant, callback
 
@@ -43,6 +43,37 @@ def async_setup_hls(hass: HomeAssistant) -> str:
     return "/api/hls/{}/master_playlist.m3u8"
 
 
+def media_segment_response(
+    request: web.Request, data: bytes | memoryview
+) -> web.Response:
+    """Return a response with the media data or the requested byte range of it."""
+    headers = {
+        "Content-Type": "video/iso.segment",
+        hdrs.ACCEPT_RANGES: "bytes",
+    }
+    if hdrs.RANGE not in request.headers:
+        return web.Response(body=data, headers=headers)
+    size = len(data)
+    try:
+        start, stop, _ = request.http_range.indices(size)
+    except ValueError:
+        # Serve the whole data when the range can't be parsed
+        return web.Response(body=data, headers=headers)
+    if start >= stop:
+        headers[hdrs.CONTENT_RANGE] = f"bytes */{size}"
+        return web.Response(
+            body=None,
+            headers=headers,
+            status=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE,
+        )
+    headers[hdrs.CONTENT_RANGE] = f"bytes {start}-{stop - 1}/{size}"
+    return web.Response(
+        body=memoryview(data)[start:stop],
+        headers=headers,
+        status=HTTPStatus.PARTIAL_CONTENT,
+    )
+
+
 @PROVIDERS.register(HLS_PROVIDER)
 class HlsStreamOutput(StreamOutput):
     """Represents HLS Output formats."""
@@ -63,6 +94,8 @@ class HlsStreamOutput(StreamOutput):
             deque_maxlen=MAX_SEGMENTS,
         )
         self._target_duration = stream_settings.min_segment_duration
+        # Rendered playlist shared by all viewers, reset when it changes
+        self.playlist: bytes | None = None
 
     @property
     def name(self) -> str:
@@ -73,6 +106,7 @@ class HlsStreamOutput(StreamOutput):
         """Handle cleanup."""
         super().cleanup()
         self._segments.clear()
+        self.playlist = None
 
     @property
     def target_duration(self) -> float:
@@ -92,6 +126,12 @@ class HlsStreamOutput(StreamOutput):
             max((s.duration for s in self._segments), default=segment.duration)
             or self.stream_settings.min_segment_duration
         )
+        self.playlist = None
+
+    def part_put(self) -> None:
+        """Set event signalling the latest part segment."""
+        self.playlist = None
+        super().part_put()
 
     def discontinuity(self) -> None:
         """Fix incomplete segment at end of deque."""
@@ -108,6 +148,7 @@ class HlsStreamOutput(StreamOutput):
                 )
             else:
                 self._segments.pop()
+        self.playlist = None
 
 
 class HlsMasterPlaylistView(StreamView):
@@ -231,6 +272,13 @@ class HlsPlaylistView(StreamView):
 
         return "\n".join(playlist) + "\n"
 
+    @classmethod
+    def render_cached(cls, track: HlsStreamOutput) -> bytes:
+        """Return the encoded HLS playlist, rendering it only after a change."""
+        if track.playlist is None:
+            track.playlist = cls.render(track).encode("utf-8")
+        return track.playlist
+
     @staticmethod
     def bad_request(blocking: bool, target_duration: float) -> web.Response:
         """Return a HTTP Bad Request response."""
@@ -324,7 +372,7 @@ class HlsPlaylistView(StreamView):
                 return self.not_found(blocking_request, track.target_duration)
 
         response = web.Response(
-            body=self.render(track).encode("utf-8"),
+            body=self.render_cached(track),
             headers={
                 "Content-Type": FORMAT_CONTENT_TYPE[HLS_PROVIDER],
             },
@@ -387,12 +435,7 @@ class HlsPartView(StreamView):
             await track.part_recv(timeout=track.stream_settings.hls_part_timeout)
         if int(part_num) >= len(segment.parts):
             return web.HTTPRequestRangeNotSatisfiable()
-        return web.Response(
-            body=segment.parts[int(part_num)].data,
-            headers={
-                "Content-Type": "video/iso.segment",
-            },
-        )
+        return media_segment_response(request, segment.parts[int(part_num)].data)
 
 
 class HlsSegmentView(StreamView):
@@ -424,9 +467,4 @@ class HlsSegmentView(StreamView):
                 body=None,
                 status=HTTPStatus.NOT_FOUND,
             )
-        return web.Response(
-            body=segment.get_data(),
-            headers={
-                "Content-Type": "video/iso.segment",
-            },
-        )
+        return media_segment_response(request, segment.get_data_view())
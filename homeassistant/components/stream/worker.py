@@ -7,7 +7,7 @@ import contextlib
 import datetime
 from io import SEEK_END, BytesIO
 import logging
-from threading import Event
+from threading import Event, Thread
 from typing import Any, cast
 
 import attr
@@ -471,6 +471,49 @@ class TimestampValidator:
         return True
 
 
+class KeyFrameSnapshotStage(Thread):
+    """Decode new keyframes for snapshots in the background.
+
+    The worker hands each video keyframe to the stage, which decodes the
+    latest one once and keeps images ready in the KeyFrameConverter. Keyframes
+    that arrive while the previous one is decoded replace it.
+    """
+
+    def __init__(self, keyframe_converter: KeyFrameConverter) -> None:
+        """Initialize KeyFrameSnapshotStage."""
+        super().__init__(name="stream_snapshot")
+        self._keyframe_converter = keyframe_converter
+        self._event = Event()
+        self._closed = False
+
+    def put(self, packet: av.Packet) -> None:
+        """Set the latest keyframe packet and wake up the stage."""
+        self._keyframe_converter.packet = packet
+        self._event.set()
+
+    def run(self) -> None:
+        """Generate images for new keyframes until closed."""
+        while True:
+            self._event.wait()
+            self._event.clear()
+            if self._closed:
+                return
+            try:
+                self._keyframe_converter.generate_images()
+            except av.AVError as ex:
+                _LOGGER.debug("Unable to generate snapshot: %s", ex)
+            except Exception:  # pylint: disable=broad-except
+                # Keep the stage running so later keyframes still produce
+                # snapshots
+                _LOGGER.exception("Unexpected error generating snapshot")
+
+    def close(self) -> None:
+        """Stop the stage and wait for it to finish."""
+        self._closed = True
+        self._event.set()
+        self.join()
+
+
 def is_keyframe(packet: av.Packet) -> Any:
     """Return true if the packet is a keyframe."""
     return packet.is_keyframe
@@ -610,7 +653,12 @@ def stream_worker(
     # Mux the first keyframe, then proceed through the rest of the packets
     muxer.mux_packet(first_keyframe)
 
-    with contextlib.closing(container), contextlib.closing(muxer):
+    snapshot_stage = KeyFrameSnapshotStage(keyframe_converter)
+    snapshot_stage.start()
+
+    with contextlib.closing(container), contextlib.closing(muxer), contextlib.closing(
+        snapshot_stage
+    ):
         while not quit_event.is_set():
             try:
                 packet = next(container_packets)
@@ -624,4 +672,4 @@ def stream_worker(
             muxer.mux_packet(packet)
 
             if packet.is_keyframe and is_video(packet):
-                keyframe_converter.packet = packet
+                snapshot_stage.put(packet)
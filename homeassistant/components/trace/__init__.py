@@ -11,7 +11,6 @@ from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.limited_size_dict import LimitedSizeDict
@@ -20,9 +19,11 @@ from . import websocket_api
 from .const import (
     CONF_STORED_TRACES,
     DATA_TRACE,
+    DATA_TRACE_ELEMENTS,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
     DEFAULT_STORED_TRACES,
+    MAX_STORED_TRACE_ELEMENTS,
 )
 from .models import ActionTrace, BaseTrace, RestoredTrace
 
@@ -50,10 +51,9 @@ def _get_data(hass: HomeAssistant) -> TraceData:
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_ELEMENTS] = 0
     websocket_api.async_setup(hass)
-    store = Store[dict[str, list]](
-        hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
-    )
+    store = Store[dict[str, list]](hass, STORAGE_VERSION, STORAGE_KEY)
     hass.data[DATA_TRACE_STORE] = store
 
     async def _async_store_traces_at_stop(_: Event) -> None:
@@ -82,6 +82,14 @@ async def async_get_trace(
     return _get_data(hass)[key][run_id].as_extended_dict()
 
 
+async def async_get_trace_json(hass: HomeAssistant, key: str, run_id: str) -> str:
+    """Return the requested trace as JSON."""
+    # Restore saved traces if not done
+    await async_restore_traces(hass)
+
+    return _get_data(hass)[key][run_id].as_extended_json()
+
+
 async def async_list_contexts(
     hass: HomeAssistant, key: str | None
 ) -> dict[str, dict[str, str]]:
@@ -148,7 +156,57 @@ def async_store_trace(
             traces[key] = LimitedSizeDict(size_limit=stored_traces)
         else:
             traces[key].size_limit = stored_traces
-        traces[key][trace.run_id] = trace
+        traces_for_key = traces[key]
+        # Make room for the new trace here, so the removed traces are
+        # subtracted from the stored trace elements
+        while traces_for_key and len(traces_for_key) >= stored_traces:
+            _async_remove_oldest_trace(hass, traces_for_key)
+        traces_for_key[trace.run_id] = trace
+
+
+@callback
+def async_finish_trace(hass: HomeAssistant, trace: ActionTrace) -> None:
+    """Finish a trace and count its elements against the trace budget."""
+    trace.finished()
+    if (traces_for_key := _get_data(hass).get(trace.key)) and traces_for_key.get(
+        trace.run_id
+    ) is trace:
+        hass.data[DATA_TRACE_ELEMENTS] += trace.num_elements
+        _async_enforce_trace_budget(hass)
+
+
+@callback
+def _async_remove_oldest_trace(
+    hass: HomeAssistant, traces_for_key: LimitedSizeDict[str, BaseTrace]
+) -> None:
+    """Remove the oldest trace of a script or automation."""
+    _, trace = traces_for_key.popitem(last=False)
+    hass.data[DATA_TRACE_ELEMENTS] -= trace.num_elements
+
+
+@callback
+def _async_enforce_trace_budget(hass: HomeAssistant) -> None:
+    """Remove the oldest traces until the stored traces fit the budget.
+
+    Only finished traces count against the budget, and the newest trace of
+    each script or automation is always kept.
+    """
+    traces = _get_data(hass)
+    while hass.data[DATA_TRACE_ELEMENTS] > MAX_STORED_TRACE_ELEMENTS:
+        candidates = [
+            traces_for_key
+            for traces_for_key in traces.values()
+            if len(traces_for_key) > 1
+        ]
+        if not candidates:
+            break
+        oldest = min(
+            candidates,
+            key=lambda traces_for_key: next(
+                iter(traces_for_key.values())
+            ).timestamp_start,
+        )
+        _async_remove_oldest_trace(hass, oldest)
 
 
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
@@ -159,6 +217,7 @@ def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> No
         traces[key] = LimitedSizeDict()
     traces[key][trace.run_id] = trace
     traces[key].move_to_end(trace.run_id, last=False)
+    hass.data[DATA_TRACE_ELEMENTS] += trace.num_elements
 
 
 async def async_restore_traces(hass: HomeAssistant) -> None:
@@ -192,3 +251,5 @@ async def async_restore_traces(hass: HomeAssistant) -> None:
                 _LOGGER.exception("Failed to restore trace")
                 continue
             _async_store_restored_trace(hass, trace)
+
+    _async_enforce_trace_budget(hass)
@@ -2,6 +2,8 @@
 
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE = "trace"
+DATA_TRACE_ELEMENTS = "trace_elements"  # Trace elements of the stored traces
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+MAX_STORED_TRACE_ELEMENTS = 10000  # Trace elements stored across all traces
@@ -7,6 +7,7 @@ import datetime as dt
 from typing import Any
 
 from homeassistant.core import Context
+from homeassistant.helpers.json import json_dumps_extended, json_fragment
 from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_get,
@@ -15,6 +16,7 @@ from homeassistant.helpers.trace import (
     trace_set_child_id,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads_object
 import homeassistant.util.uuid as uuid_util
 
 
@@ -24,18 +26,28 @@ class BaseTrace(abc.ABC):
     context: Context
     key: str
     run_id: str
+    timestamp_start: dt.datetime
 
     def as_dict(self) -> dict[str, Any]:
         """Return an dictionary version of this ActionTrace for saving."""
         return {
-            "extended_dict": self.as_extended_dict(),
-            "short_dict": self.as_short_dict(),
+            "extended_dict": json_fragment(self.as_extended_json()),
+            "short_dict": json_fragment(json_dumps_extended(self.as_short_dict())),
         }
 
+    @property
+    @abc.abstractmethod
+    def num_elements(self) -> int:
+        """Return the number of trace elements, used to budget trace memory."""
+
     @abc.abstractmethod
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
 
+    def as_extended_json(self) -> str:
+        """Return a JSON version of the extended dictionary."""
+        return json_dumps_extended(self.as_extended_dict())
+
     @abc.abstractmethod
     def as_short_dict(self) -> dict[str, Any]:
         """Return a brief dictionary version of this ActionTrace."""
@@ -63,9 +75,10 @@ class ActionTrace(BaseTrace):
         self._script_execution: str | None = None
         self.run_id: str = uuid_util.random_uuid_hex()
         self._timestamp_finish: dt.datetime | None = None
-        self._timestamp_start: dt.datetime = dt_util.utcnow()
+        self.timestamp_start: dt.datetime = dt_util.utcnow()
         self.key = f"{self._domain}.{item_id}"
-        self._dict: dict[str, Any] | None = None
+        self._json: str | None = None
+        self._num_elements = 0
         self._short_dict: dict[str, Any] | None = None
         if trace_id_get():
             trace_set_child_id(self.key, self.run_id)
@@ -84,11 +97,20 @@ class ActionTrace(BaseTrace):
         self._timestamp_finish = dt_util.utcnow()
         self._state = "stopped"
         self._script_execution = script_execution_get()
+        if self._trace:
+            self._num_elements = sum(
+                len(trace_list) for trace_list in self._trace.values()
+            )
+
+    @property
+    def num_elements(self) -> int:
+        """Return the number of trace elements once the trace has finished."""
+        return self._num_elements
 
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
-        if self._dict:
-            return self._dict
+        if self._json is not None:
+            return json_loads_object(self._json)
 
         result = dict(self.as_short_dict())
 
@@ -105,10 +127,24 @@ class ActionTrace(BaseTrace):
                 "context": self.context,
             }
         )
+        return result
+
+    def as_extended_json(self) -> str:
+        """Return a JSON version of the extended dictionary of this ActionTrace.
+
+        Once execution has stopped, the JSON is kept instead of the trace
+        elements, which is much more compact.
+        """
+        if self._json is not None:
+            return self._json
+
+        result = super().as_extended_json()
 
         if self._state == "stopped":
-            # Execution has stopped, save the result
-            self._dict = result
+            self._json = result
+            self._trace = None
+            self._config = None
+            self._blueprint_inputs = None
         return result
 
     def as_short_dict(self) -> dict[str, Any]:
@@ -128,7 +164,7 @@ class ActionTrace(BaseTrace):
             "state": self._state,
             "script_execution": self._script_execution,
             "timestamp": {
-                "start": self._timestamp_start,
+                "start": self.timestamp_start,
                 "finish": self._timestamp_finish,
             },
             "domain": domain,
@@ -158,8 +194,19 @@ class RestoredTrace(BaseTrace):
         self.context = context
         self.key = f"{extended_dict['domain']}.{extended_dict['item_id']}"
         self.run_id = extended_dict["run_id"]
+        self.timestamp_start = dt_util.parse_datetime(
+            short_dict["timestamp"]["start"]
+        ) or dt.datetime.min.replace(tzinfo=dt.timezone.utc)
         self._dict = extended_dict
         self._short_dict = short_dict
+        self._num_elements = sum(
+            len(trace_list) for trace_list in extended_dict["trace"].values()
+        )
+
+    @property
+    def num_elements(self) -> int:
+        """Return the number of trace elements."""
+        return self._num_elements
 
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this RestoredTrace."""
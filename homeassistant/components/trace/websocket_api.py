@@ -1,5 +1,4 @@
 """Websocket API for automation."""
-import json
 from typing import Any
 
 import voluptuous as vol
@@ -12,7 +11,6 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
-from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.script import (
     SCRIPT_BREAKPOINT_HIT,
     SCRIPT_DEBUG_CONTINUE_ALL,
@@ -65,17 +63,15 @@ async def websocket_trace_get(
     run_id = msg["run_id"]
 
     try:
-        requested_trace = await trace.async_get_trace(hass, key, run_id)
+        requested_trace = await trace.async_get_trace_json(hass, key, run_id)
     except KeyError:
         connection.send_error(
             msg["id"], websocket_api.ERR_NOT_FOUND, "The trace could not be found"
         )
         return
 
-    message = websocket_api.messages.result_message(msg["id"], requested_trace)
-
     connection.send_message(
-        json.dumps(message, cls=ExtendedJSONEncoder, allow_nan=False)
+        websocket_api.messages.construct_result_message(msg["id"], requested_trace)
     )
 
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Mapping
+from collections.abc import AsyncGenerator, AsyncIterable, Mapping
 from datetime import datetime
 from functools import partial
 import hashlib
@@ -13,7 +13,7 @@ import logging
 import mimetypes
 import os
 import re
-from typing import Any, TypedDict, final
+from typing import Any, TypedDict, cast, final
 
 from aiohttp import web
 import mutagen
@@ -42,10 +42,12 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import save_json
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import UNDEFINED, ConfigType
 from homeassistant.util import dt as dt_util, language as language_util
+from homeassistant.util.json import load_json
 
 from .const import (
     ATTR_CACHE,
@@ -55,12 +57,17 @@ from .const import (
     CONF_BASE_URL,
     CONF_CACHE,
     CONF_CACHE_DIR,
+    CONF_CACHE_MAX_SIZE,
+    CONF_MEMORY_MAX_SIZE,
     CONF_TIME_MEMORY,
     DATA_TTS_MANAGER,
     DEFAULT_CACHE,
     DEFAULT_CACHE_DIR,
+    DEFAULT_CACHE_MAX_SIZE,
+    DEFAULT_MEMORY_MAX_SIZE,
     DEFAULT_TIME_MEMORY,
     DOMAIN,
+    TtsAudioStreamType,
     TtsAudioType,
 )
 from .helper import get_engine_instance
@@ -71,6 +78,7 @@ from .models import Voice
 __all__ = [
     "async_default_engine",
     "async_get_media_source_audio",
+    "async_stream_tts_audio",
     "async_support_options",
     "ATTR_AUDIO_OUTPUT",
     "CONF_LANG",
@@ -80,6 +88,7 @@ __all__ = [
     "PLATFORM_SCHEMA_BASE",
     "PLATFORM_SCHEMA",
     "Provider",
+    "TtsAudioStreamType",
     "TtsAudioType",
     "Voice",
 ]
@@ -104,6 +113,8 @@ _RE_VOICE_FILE = re.compile(
     r"([a-f0-9]{40})_([^_]+)_([^_]+)_(tts\.[a-z0-9_]+)\.[a-z0-9]{3,4}"
 )
 KEY_PATTERN = "{0}_{1}_{2}_{3}"
+# Index of the cache dir, so it does not need to be listed on startup
+CACHE_INDEX_FILE = "index.json"
 
 SCHEMA_SERVICE_CLEAR_CACHE = vol.Schema({})
 
@@ -184,6 +195,20 @@ async def async_get_media_source_audio(
     )
 
 
+async def async_stream_tts_audio(
+    hass: HomeAssistant,
+    engine: str,
+    message: str,
+    language: str | None = None,
+    options: dict | None = None,
+) -> tuple[str, AsyncGenerator[bytes, None]]:
+    """Get TTS audio as extension and a stream of chunks."""
+    manager: SpeechManager = hass.data[DATA_TTS_MANAGER]
+    return await manager.async_stream_tts_audio(
+        engine, message, language=language, options=options
+    )
+
+
 @callback
 def async_get_text_to_speech_languages(hass: HomeAssistant) -> set[str]:
     """Return a set with the union of languages supported by tts engines."""
@@ -214,6 +239,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     use_cache: bool = conf.get(CONF_CACHE, DEFAULT_CACHE)
     cache_dir: str = conf.get(CONF_CACHE_DIR, DEFAULT_CACHE_DIR)
     time_memory: int = conf.get(CONF_TIME_MEMORY, DEFAULT_TIME_MEMORY)
+    cache_max_size: int = conf.get(CONF_CACHE_MAX_SIZE, DEFAULT_CACHE_MAX_SIZE)
+    memory_max_size: int = conf.get(CONF_MEMORY_MAX_SIZE, DEFAULT_MEMORY_MAX_SIZE)
     base_url: str | None = conf.get(CONF_BASE_URL)
     if base_url is not None:
         _LOGGER.warning(
@@ -222,7 +249,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
     hass.data[BASE_URL_KEY] = base_url
 
-    tts = SpeechManager(hass, use_cache, cache_dir, time_memory, base_url)
+    tts = SpeechManager(
+        hass,
+        use_cache,
+        cache_dir,
+        time_memory,
+        base_url,
+        cache_max_size * 1024 * 1024,
+        memory_max_size * 1024 * 1024,
+    )
 
     try:
         await tts.async_init_cache()
@@ -376,6 +411,17 @@ class TextToSpeechEntity(RestoreEntity):
             message=message, language=language, options=options
         )
 
+    @final
+    async def internal_async_stream_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> TtsAudioStreamType:
+        """Process an audio stream to TTS service as a stream of chunks."""
+        self.__last_tts_loaded = dt_util.utcnow().isoformat()
+        self.async_write_ha_state()
+        return await self.async_stream_tts_audio(
+            message=message, language=language, options=options
+        )
+
     def get_tts_audio(
         self, message: str, language: str, options: dict[str, Any]
     ) -> TtsAudioType:
@@ -393,6 +439,27 @@ class TextToSpeechEntity(RestoreEntity):
             partial(self.get_tts_audio, message, language, options=options)
         )
 
+    async def async_stream_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> TtsAudioStreamType:
+        """Load tts audio from the engine as a stream of chunks.
+
+        Engines which synthesize audio incrementally can override this to
+        return chunks as they are synthesized. By default the audio is
+        returned as a single chunk.
+        """
+        extension, data = await self.async_get_tts_audio(
+            message=message, language=language, options=options
+        )
+        if data is None:
+            return extension, None
+        return extension, _async_single_chunk(data)
+
+
+async def _async_single_chunk(data: bytes) -> AsyncGenerator[bytes, None]:
+    """Return data as a stream of a single chunk."""
+    yield data
+
 
 def _hash_options(options: dict) -> str:
     """Hashes an options dictionary."""
@@ -405,7 +472,12 @@ def _hash_options(options: dict) -> str:
 
 
 class SpeechManager:
-    """Representation of a speech store."""
+    """Representation of a speech store.
+
+    The file and memory caches are kept in least recently used order and
+    the least recently used voices are evicted when a cache grows beyond
+    its size in bytes.
+    """
 
     def __init__(
         self,
@@ -414,6 +486,8 @@ class SpeechManager:
         cache_dir: str,
         time_memory: int,
         base_url: str | None,
+        cache_max_size: int = DEFAULT_CACHE_MAX_SIZE * 1024 * 1024,
+        memory_max_size: int = DEFAULT_MEMORY_MAX_SIZE * 1024 * 1024,
     ) -> None:
         """Initialize a speech store."""
         self.hass = hass
@@ -423,8 +497,16 @@ class SpeechManager:
         self.cache_dir = cache_dir
         self.time_memory = time_memory
         self.base_url = base_url
+        self.cache_max_size = cache_max_size
+        self.memory_max_size = memory_max_size
         self.file_cache: dict[str, str] = {}
         self.mem_cache: dict[str, TTSCache] = {}
+        self._file_cache_sizes: dict[str, int] = {}
+        self._file_cache_size = 0
+        self._mem_cache_size = 0
+        self._cache_index_lock = asyncio.Lock()
+        # Running synthesis by cache key, to share it between identical requests
+        self._synthesis_tasks: dict[str, asyncio.Task[str]] = {}
 
     async def async_init_cache(self) -> None:
         """Init config folder and load file cache."""
@@ -437,28 +519,29 @@ class SpeechManager:
 
         try:
             cache_files = await self.hass.async_add_executor_job(
-                _get_cache_files, self.cache_dir
+                _load_cache_files, self.cache_dir
             )
         except OSError as err:
             raise HomeAssistantError(f"Can't read cache dir {err}") from err
 
-        if cache_files:
-            self.file_cache.update(cache_files)
+        for cache_key, filename, size in cache_files:
+            self.file_cache[cache_key] = filename
+            self._file_cache_sizes[cache_key] = size
+            self._file_cache_size += size
+
+        if self._file_cache_size > self.cache_max_size:
+            await self._async_update_cache_dir(self._async_evict_from_file_cache())
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
         self.mem_cache = {}
+        self._mem_cache_size = 0
 
-        def remove_files() -> None:
-            """Remove files from filesystem."""
-            for filename in self.file_cache.values():
-                try:
-                    os.remove(os.path.join(self.cache_dir, filename))
-                except OSError as err:
-                    _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
-
-        await self.hass.async_add_executor_job(remove_files)
+        filenames = list(self.file_cache.values())
         self.file_cache = {}
+        self._file_cache_sizes = {}
+        self._file_cache_size = 0
+        await self._async_update_cache_dir(filenames)
 
     @callback
     def async_register_legacy_engine(
@@ -524,8 +607,8 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # Is speech already in memory
-        if cache_key in self.mem_cache:
-            filename = self.mem_cache[cache_key]["filename"]
+        if cached := self._async_get_from_memcache(cache_key):
+            filename = cached["filename"]
         # Is file store in file cache
         elif use_cache and cache_key in self.file_cache:
             filename = self.file_cache[cache_key]
@@ -560,7 +643,7 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # If we have the file, load it into memory if necessary
-        if cache_key not in self.mem_cache:
+        if not self._async_get_from_memcache(cache_key):
             if use_cache and cache_key in self.file_cache:
                 await self._async_file_to_mem(cache_key)
             else:
@@ -575,6 +658,89 @@ class SpeechManager:
             cached = self.mem_cache[cache_key]
         return extension, cached["voice"]
 
+    async def async_stream_tts_audio(
+        self,
+        engine: str,
+        message: str,
+        cache: bool | None = None,
+        language: str | None = None,
+        options: dict | None = None,
+    ) -> tuple[str, AsyncGenerator[bytes, None]]:
+        """Fetch TTS audio as a stream of chunks.
+
+        Audio which is cached, or from an engine which can't stream, is
+        returned as a single chunk. Streamed audio is cached once complete.
+        """
+        if (engine_instance := get_engine_instance(self.hass, engine)) is None:
+            raise HomeAssistantError(f"Provider {engine} not found")
+
+        language, options = self.process_options(engine_instance, language, options)
+        cache_key = self._generate_cache_key(message, language, options, engine)
+        use_cache = cache if cache is not None else self.use_cache
+
+        if (
+            isinstance(engine_instance, Provider)
+            or ATTR_AUDIO_OUTPUT in options
+            or cache_key in self.mem_cache
+            or cache_key in self._synthesis_tasks
+            or (use_cache and cache_key in self.file_cache)
+        ):
+            extension, data = await self.async_get_tts_audio(
+                engine, message, cache, language, options
+            )
+            return extension, _async_single_chunk(data)
+
+        if engine_instance.name is None or engine_instance.name is UNDEFINED:
+            raise HomeAssistantError("TTS engine name is not set.")
+        engine_name = engine_instance.name
+
+        (
+            stream_extension,
+            chunks,
+        ) = await engine_instance.internal_async_stream_tts_audio(
+            message, language, options
+        )
+        if chunks is None or stream_extension is None:
+            raise HomeAssistantError(f"No TTS from {engine_name} for '{message}'")
+        filename = self._voice_filename(engine_instance, cache_key, stream_extension)
+        audio_chunks: AsyncIterable[bytes] = chunks
+        voice_language: str = language
+
+        async def stream_and_cache() -> AsyncGenerator[bytes, None]:
+            """Forward the chunks and cache the complete audio."""
+            data = []
+            async for chunk in audio_chunks:
+                data.append(chunk)
+                yield chunk
+
+            voice = b"".join(data)
+            if filename.endswith(".mp3"):
+                voice = self.write_tags(
+                    filename, voice, engine_name, message, voice_language, options
+                )
+            self._async_store_to_memcache(cache_key, filename, voice)
+            if use_cache:
+                self.hass.async_create_task(
+                    self._async_save_tts_audio(cache_key, filename, voice)
+                )
+
+        return stream_extension, stream_and_cache()
+
+    @staticmethod
+    def _voice_filename(
+        engine_instance: TextToSpeechEntity | Provider, cache_key: str, extension: str
+    ) -> str:
+        """Return a validated filename for a voice."""
+        filename = f"{cache_key}.{extension}".lower()
+
+        if not _RE_VOICE_FILE.match(filename) and not _RE_LEGACY_VOICE_FILE.match(
+            filename
+        ):
+            raise HomeAssistantError(
+                f"TTS filename '{filename}' from {engine_instance.name} is invalid!"
+            )
+        return filename
+
     @callback
     def _generate_cache_key(
         self,
@@ -627,16 +793,8 @@ class SpeechManager:
                     f"No TTS from {engine_instance.name} for '{message}'"
                 )
 
-            # Create file infos
-            filename = f"{cache_key}.{extension}".lower()
-
-            # Validate filename
-            if not _RE_VOICE_FILE.match(filename) and not _RE_LEGACY_VOICE_FILE.match(
-                filename
-            ):
-                raise HomeAssistantError(
-                    f"TTS filename '{filename}' from {engine_instance.name} is invalid!"
-                )
+            # Create and validate file infos
+            filename = self._voice_filename(engine_instance, cache_key, extension)
 
             # Save to memory
             if extension == "mp3":
@@ -652,19 +810,31 @@ class SpeechManager:
 
             return filename
 
-        audio_task = self.hass.async_create_task(get_tts_data())
+        # Identical requests share a running synthesis
+        if (audio_task := self._synthesis_tasks.get(cache_key)) is None:
+            audio_task = self._synthesis_tasks[cache_key] = self.hass.async_create_task(
+                get_tts_data()
+            )
+
+            def synthesis_done(future: asyncio.Future) -> None:
+                """Forget the finished synthesis."""
+                if self._synthesis_tasks.get(cache_key) is future:
+                    del self._synthesis_tasks[cache_key]
+
+            audio_task.add_done_callback(synthesis_done)
 
         if expected_extension is None:
-            return await audio_task
+            return await asyncio.shield(audio_task)
 
-        def handle_error(_future: asyncio.Future) -> None:
+        def handle_error(future: asyncio.Future) -> None:
             """Handle error."""
-            if audio_task.exception():
-                self.mem_cache.pop(cache_key, None)
+            if future.exception():
+                self._async_remove_from_memcache(cache_key)
 
         audio_task.add_done_callback(handle_error)
 
         filename = f"{cache_key}.{expected_extension}".lower()
+        self._async_remove_from_memcache(cache_key)
         self.mem_cache[cache_key] = {
             "filename": filename,
             "voice": b"",
@@ -688,9 +858,58 @@ class SpeechManager:
 
         try:
             await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[cache_key] = filename
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+            return
+
+        removed = self._async_remove_from_file_cache(cache_key)
+        if removed == filename:
+            self._file_cache_size -= self._file_cache_sizes.pop(cache_key, 0)
+            removed = None
+        self.file_cache[cache_key] = filename
+        self._file_cache_sizes[cache_key] = len(data)
+        self._file_cache_size += len(data)
+        evicted = self._async_evict_from_file_cache(cache_key)
+        if removed:
+            evicted.append(removed)
+        await self._async_update_cache_dir(evicted)
+
+    @callback
+    def _async_remove_from_file_cache(self, cache_key: str) -> str | None:
+        """Remove a voice from the file cache and return its filename."""
+        if (filename := self.file_cache.pop(cache_key, None)) is not None:
+            self._file_cache_size -= self._file_cache_sizes.pop(cache_key, 0)
+        return filename
+
+    @callback
+    def _async_evict_from_file_cache(self, keep_key: str | None = None) -> list[str]:
+        """Evict least recently used voices until the file cache fits its size.
+
+        Return the filenames of the evicted voices.
+        """
+        evicted = []
+        for cache_key in list(self.file_cache):
+            if self._file_cache_size <= self.cache_max_size:
+                break
+            if cache_key != keep_key and (
+                filename := self._async_remove_from_file_cache(cache_key)
+            ):
+                evicted.append(filename)
+        return evicted
+
+    async def _async_update_cache_dir(self, remove: list[str]) -> None:
+        """Remove files from the cache dir and write its index.
+
+        This method is a coroutine.
+        """
+        index = [
+            [cache_key, filename, self._file_cache_sizes[cache_key]]
+            for cache_key, filename in self.file_cache.items()
+        ]
+        async with self._cache_index_lock:
+            await self.hass.async_add_executor_job(
+                _update_cache_dir, self.cache_dir, remove, index
+            )
 
     async def _async_file_to_mem(self, cache_key: str) -> None:
         """Load voice from file cache into memory.
@@ -710,26 +929,53 @@ class SpeechManager:
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[cache_key]
+            self._async_remove_from_file_cache(cache_key)
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
+        # Mark the voice as most recently used
+        if cache_key in self.file_cache:
+            self.file_cache[cache_key] = self.file_cache.pop(cache_key)
         self._async_store_to_memcache(cache_key, filename, data)
 
+    @callback
+    def _async_get_from_memcache(self, cache_key: str) -> TTSCache | None:
+        """Get data from memcache and mark it as most recently used."""
+        if (cached := self.mem_cache.pop(cache_key, None)) is not None:
+            self.mem_cache[cache_key] = cached
+        return cached
+
+    @callback
+    def _async_remove_from_memcache(self, cache_key: str) -> None:
+        """Remove data from memcache."""
+        if (cached := self.mem_cache.pop(cache_key, None)) is not None:
+            self._mem_cache_size -= len(cached["voice"])
+
     @callback
     def _async_store_to_memcache(
         self, cache_key: str, filename: str, data: bytes
     ) -> None:
         """Store data to memcache and set timer to remove it."""
-        self.mem_cache[cache_key] = {
+        self._async_remove_from_memcache(cache_key)
+        cached: TTSCache = {
             "filename": filename,
             "voice": data,
             "pending": None,
         }
+        self.mem_cache[cache_key] = cached
+        self._mem_cache_size += len(data)
+
+        # Evict the least recently used voices to fit the memory size
+        for evict_key in list(self.mem_cache):
+            if self._mem_cache_size <= self.memory_max_size:
+                break
+            if evict_key != cache_key and not self.mem_cache[evict_key]["pending"]:
+                self._async_remove_from_memcache(evict_key)
 
         @callback
         def async_remove_from_mem(_: datetime) -> None:
             """Cleanup memcache."""
-            self.mem_cache.pop(cache_key, None)
+            if self.mem_cache.get(cache_key) is cached:
+                self._async_remove_from_memcache(cache_key)
 
         async_call_later(
             self.hass,
@@ -755,7 +1001,7 @@ class SpeechManager:
             record.group(1), record.group(2), record.group(3), record.group(4)
         )
 
-        if cache_key not in self.mem_cache:
+        if not self._async_get_from_memcache(cache_key):
             if cache_key not in self.file_cache:
                 raise HomeAssistantError(f"{cache_key} not in cache!")
             await self._async_file_to_mem(cache_key)
@@ -830,6 +1076,42 @@ def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     return cache_dir
 
 
+def _load_cache_files(cache_dir: str) -> list[tuple[str, str, int]]:
+    """Return the cached files and their size, least recently used first.
+
+    The files are read from the cache index, the cache dir is only listed
+    when there is no valid index.
+    """
+    try:
+        index = load_json(os.path.join(cache_dir, CACHE_INDEX_FILE), None)
+    except HomeAssistantError:
+        index = None
+    if isinstance(index, list):
+        return [
+            (cache_key, filename, size)
+            for cache_key, filename, size in cast(list[list], index)
+        ]
+
+    return [
+        (cache_key, filename, os.path.getsize(os.path.join(cache_dir, filename)))
+        for cache_key, filename in _get_cache_files(cache_dir).items()
+    ]
+
+
+def _update_cache_dir(cache_dir: str, remove: list[str], index: list[list]) -> None:
+    """Remove files from the cache dir and write its index."""
+    for filename in remove:
+        try:
+            os.remove(os.path.join(cache_dir, filename))
+        except OSError as err:
+            _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+
+    try:
+        save_json(os.path.join(cache_dir, CACHE_INDEX_FILE), index, atomic_writes=True)
+    except HomeAssistantError as err:
+        _LOGGER.error("Can't write cache index: %s", err)
+
+
 def _get_cache_files(cache_dir: str) -> dict[str, str]:
     """Return a dict of given engine files."""
     cache = {}
@@ -1,4 +1,6 @@
 """Text-to-speech constants."""
+from collections.abc import AsyncIterable
+
 ATTR_CACHE = "cache"
 ATTR_LANGUAGE = "language"
 ATTR_MESSAGE = "message"
@@ -7,11 +9,16 @@ ATTR_OPTIONS = "options"
 CONF_BASE_URL = "base_url"
 CONF_CACHE = "cache"
 CONF_CACHE_DIR = "cache_dir"
+CONF_CACHE_MAX_SIZE = "cache_max_size"
 CONF_FIELDS = "fields"
+CONF_MEMORY_MAX_SIZE = "memory_max_size"
 CONF_TIME_MEMORY = "time_memory"
 
 DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
+# Cache sizes in MiB
+DEFAULT_CACHE_MAX_SIZE = 1024
+DEFAULT_MEMORY_MAX_SIZE = 32
 DEFAULT_TIME_MEMORY = 300
 
 DOMAIN = "tts"
@@ -19,3 +26,4 @@ DOMAIN = "tts"
 DATA_TTS_MANAGER = "tts_manager"
 
 TtsAudioType = tuple[str | None, bytes | None]
+TtsAudioStreamType = tuple[str | None, AsyncIterable[bytes] | None]
@@ -56,7 +56,9 @@ class AuthPhase:
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
+        send_message: Callable[
+            [bytes | str | dict[str, Any] | Callable[[], str]], None
+        ],
         cancel_ws: CALLBACK_TYPE,
         request: Request,
     ) -> None:
@@ -63,6 +63,13 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f'[{self.extra["connid"]}] {msg}', kwargs
 
 
+def _loggable_message(message: Any) -> Any:
+    """Return a message to log, binary messages are logged by their size."""
+    if isinstance(message, bytes):
+        return f"<{len(message)} bytes of binary data>"
+    return message
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
@@ -98,6 +105,7 @@ class WebSocketHandler:
         message_queue = self._message_queue
         logger = self._logger
         send_str = self.wsock.send_str
+        send_bytes = self.wsock.send_bytes
         loop = self.hass.loop
         debug = logger.debug
         # Exceptions if Socket disconnected or cancelled by connection handler
@@ -114,6 +122,13 @@ class WebSocketHandler:
                         return
 
                     messages_remaining -= 1
+
+                    # Binary messages are never coalesced
+                    if isinstance(process, bytes):
+                        debug("Sending %s bytes", len(process))
+                        await send_bytes(process)
+                        continue
+
                     message = process if isinstance(process, str) else process()
 
                     if (
@@ -126,7 +141,9 @@ class WebSocketHandler:
                         continue
 
                     messages: list[str] = [message]
-                    while messages_remaining:
+                    while messages_remaining and not isinstance(
+                        message_queue[0], bytes
+                    ):
                         # A None message is used to signal the end of the connection
                         if (process := message_queue.popleft()) is None:
                             return
@@ -151,7 +168,9 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | dict[str, Any] | Callable[[], str]) -> None:
+    def _send_message(
+        self, message: bytes | str | dict[str, Any] | Callable[[], str]
+    ) -> None:
         """Send a message to the client.
 
         Closes connection if the client is not reading the messages.
@@ -177,7 +196,7 @@ class WebSocketHandler:
                 ),
                 self.description,
                 MAX_PENDING_MSG,
-                message,
+                _loggable_message(message),
             )
             self._cancel()
             return
@@ -215,7 +234,7 @@ class WebSocketHandler:
             self.description,
             PENDING_MSG_PEAK,
             PENDING_MSG_PEAK_TIME,
-            self._message_queue[-1],
+            _loggable_message(self._message_queue[-1]),
         )
         self._cancel()
 
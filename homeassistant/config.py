@@ -10,7 +10,7 @@ from pathlib import Path
 import re
 import shutil
 from types import ModuleType
-from typing import Any
+from typing import Any, cast
 from urllib.parse import urlparse
 
 from awesomeversion import AwesomeVersion
@@ -65,7 +65,7 @@ from .loader import ComponentProtocol, Integration, IntegrationNotFound
 from .requirements import RequirementsNotFound, async_get_integration_with_requirements
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
-from .util.yaml import SECRET_YAML, Secrets, load_yaml
+from .util.yaml import SECRET_YAML, Secrets, YamlCache, load_yaml
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -76,6 +76,7 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
+DATA_YAML_CACHE = "yaml_cache"
 
 AUTOMATION_CONFIG_PATH = "automations.yaml"
 SCRIPT_CONFIG_PATH = "scripts.yaml"
@@ -405,14 +406,23 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
         load_yaml_config_file,
         hass.config.path(YAML_CONFIG_FILE),
         secrets,
+        async_get_yaml_cache(hass),
     )
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
     return config
 
 
+@callback
+def async_get_yaml_cache(hass: HomeAssistant) -> YamlCache:
+    """Return the cache of parsed configuration YAML files."""
+    if (cache := hass.data.get(DATA_YAML_CACHE)) is None:
+        cache = hass.data[DATA_YAML_CACHE] = YamlCache()
+    return cast(YamlCache, cache)
+
+
 def load_yaml_config_file(
-    config_path: str, secrets: Secrets | None = None
+    config_path: str, secrets: Secrets | None = None, cache: YamlCache | None = None
 ) -> dict[Any, Any]:
     """Parse a YAML configuration file.
 
@@ -420,7 +430,11 @@ def load_yaml_config_file(
 
     This method needs to run in an executor.
     """
-    conf_dict = load_yaml(config_path, secrets)
+    if cache is None:
+        conf_dict = load_yaml(config_path, secrets)
+    else:
+        with cache.activate():
+            conf_dict = load_yaml(config_path, secrets)
 
     if not isinstance(conf_dict, dict):
         msg = (
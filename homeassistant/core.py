@@ -91,6 +91,7 @@ from .util.async_ import (
 from .util.json import JsonObjectType
 from .util.read_only_dict import ReadOnlyDict
 from .util.timeout import TimeoutManager
+from .util.timer_wheel import TimerWheel
 from .util.unit_system import (
     _CONF_UNIT_SYSTEM_IMPERIAL,
     _CONF_UNIT_SYSTEM_US_CUSTOMARY,
@@ -316,6 +317,8 @@ class HomeAssistant:
         self._stopped: asyncio.Event | None = None
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
+        # Scheduler for the timers of the event helpers
+        self.timer_wheel = TimerWheel(self.loop)
         self._stop_future: concurrent.futures.Future[None] | None = None
 
     @property
@@ -846,7 +849,7 @@ class HomeAssistant:
         """Cancel timer handles marked as cancellable."""
         # pylint: disable-next=protected-access
         handles: Iterable[asyncio.TimerHandle] = self.loop._scheduled  # type: ignore[attr-defined]
-        for handle in handles:
+        for handle in (*handles, *self.timer_wheel.handles()):
             if (
                 not handle.cancelled()
                 and (args := handle._args)  # pylint: disable=protected-access
@@ -17,6 +17,7 @@ from homeassistant.config import (  # type: ignore[attr-defined]
     CORE_CONFIG_SCHEMA,
     YAML_CONFIG_FILE,
     _format_config_error,
+    async_get_yaml_cache,
     config_per_platform,
     extract_domain_configs,
     load_yaml_config_file,
@@ -101,6 +102,7 @@ async def async_check_ha_config_file(  # noqa: C901
             load_yaml_config_file,
             config_path,
             yaml_loader.Secrets(Path(hass.config.config_dir)),
+            async_get_yaml_cache(hass),
         )
     except FileNotFoundError:
         return result.add_error(f"File not found: {config_path}")
@@ -7,9 +7,11 @@ from collections.abc import Callable, Container, Generator
 from contextlib import contextmanager
 from datetime import datetime, time as dt_time, timedelta
 import functools as ft
+import operator
 import re
 import sys
 from typing import Any, Protocol, cast
+from weakref import WeakValueDictionary
 
 import voluptuous as vol
 
@@ -95,6 +97,23 @@ INPUT_ENTITY_ID = re.compile(
 )
 
 
+class _CheckCache:
+    """Result of a condition check and the State objects it was computed from."""
+
+    __slots__ = ("states", "result", "trace", "__weakref__")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.states: tuple[State | None, ...] = ()
+        self.result = False
+        self.trace: dict[str, Any] | None = None
+
+
+# Caches of state based condition checks, identical checks in different
+# conditions share the same cache while any of the conditions exists
+_CHECK_CACHES: WeakValueDictionary[tuple[Any, ...], _CheckCache] = WeakValueDictionary()
+
+
 class ConditionProtocol(Protocol):
     """Define the format of device_condition modules.
 
@@ -183,6 +202,50 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     return wrapper
 
 
+def _get_check_cache(*key: Any) -> _CheckCache | None:
+    """Return the shared cache of a condition check, None if it can't be cached."""
+    try:
+        if (cache := _CHECK_CACHES.get(key)) is None:
+            cache = _CHECK_CACHES[key] = _CheckCache()
+    except TypeError:
+        return None
+    return cache
+
+
+def _async_cached_check(
+    hass: HomeAssistant,
+    cache: _CheckCache | None,
+    entity_ids: tuple[str, ...],
+    check: Callable[..., tuple[bool, dict[str, Any] | None]],
+    *args: Any,
+) -> bool:
+    """Run a condition check unless the states of its entities are unchanged.
+
+    States are never changed in place, so a check computed from the same
+    State objects gives the same result and trace.
+    """
+    if cache is None:
+        result, trace = check(hass, *args)
+    else:
+        get_state = hass.states.get
+        if cache.states and all(
+            map(operator.is_, cache.states, map(get_state, entity_ids))
+        ):
+            result = cache.result
+            trace = cache.trace
+        else:
+            states = tuple(map(get_state, entity_ids))
+            # Errors are not cached, they are raised again on the next check
+            result, trace = check(hass, *args)
+            cache.states = states
+            cache.result = result
+            cache.trace = trace
+
+    if trace is not None:
+        condition_trace_set_result(result, **trace)
+    return result
+
+
 async def _async_get_condition_platform(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionProtocol | None:
@@ -361,7 +424,7 @@ def numeric_state(
     ).result()
 
 
-def async_numeric_state(  # noqa: C901
+def async_numeric_state(
     hass: HomeAssistant,
     entity: None | str | State,
     below: float | str | None = None,
@@ -371,6 +434,24 @@ def async_numeric_state(  # noqa: C901
     attribute: str | None = None,
 ) -> bool:
     """Test a numeric state condition."""
+    result, trace = _async_numeric_state_result(
+        hass, entity, below, above, value_template, variables, attribute
+    )
+    if trace is not None:
+        condition_trace_set_result(result, **trace)
+    return result
+
+
+def _async_numeric_state_result(  # noqa: C901
+    hass: HomeAssistant,
+    entity: None | str | State,
+    below: float | str | None,
+    above: float | str | None,
+    value_template: Template | None,
+    variables: TemplateVarsType,
+    attribute: str | None,
+) -> tuple[bool, dict[str, Any] | None]:
+    """Test a numeric state condition, return the result and its trace."""
     if entity is None:
         raise ConditionErrorMessage("numeric_state", "no entity specified")
 
@@ -383,11 +464,9 @@ def async_numeric_state(  # noqa: C901
         entity_id = entity.entity_id
 
     if attribute is not None and attribute not in entity.attributes:
-        condition_trace_set_result(
-            False,
-            message=f"attribute '{attribute}' of entity {entity_id} does not exist",
-        )
-        return False
+        return False, {
+            "message": f"attribute '{attribute}' of entity {entity_id} does not exist"
+        }
 
     value: Any = None
     if value_template is None:
@@ -407,11 +486,9 @@ def async_numeric_state(  # noqa: C901
 
     # Known states or attribute values that never match the numeric condition
     if value in (None, STATE_UNAVAILABLE, STATE_UNKNOWN):
-        condition_trace_set_result(
-            False,
-            message=f"value '{value}' is non-numeric and treated as False",
-        )
-        return False
+        return False, {
+            "message": f"value '{value}' is non-numeric and treated as False"
+        }
 
     try:
         fvalue = float(value)
@@ -431,15 +508,13 @@ def async_numeric_state(  # noqa: C901
                 STATE_UNAVAILABLE,
                 STATE_UNKNOWN,
             ):
-                return False
+                return False, None
             try:
                 if fvalue >= float(below_entity.state):
-                    condition_trace_set_result(
-                        False,
-                        state=fvalue,
-                        wanted_state_below=float(below_entity.state),
-                    )
-                    return False
+                    return False, {
+                        "state": fvalue,
+                        "wanted_state_below": float(below_entity.state),
+                    }
             except (ValueError, TypeError) as ex:
                 raise ConditionErrorMessage(
                     "numeric_state",
@@ -449,8 +524,7 @@ def async_numeric_state(  # noqa: C901
                     ),
                 ) from ex
         elif fvalue >= below:
-            condition_trace_set_result(False, state=fvalue, wanted_state_below=below)
-            return False
+            return False, {"state": fvalue, "wanted_state_below": below}
 
     if above is not None:
         if isinstance(above, str):
@@ -462,15 +536,13 @@ def async_numeric_state(  # noqa: C901
                 STATE_UNAVAILABLE,
                 STATE_UNKNOWN,
             ):
-                return False
+                return False, None
             try:
                 if fvalue <= float(above_entity.state):
-                    condition_trace_set_result(
-                        False,
-                        state=fvalue,
-                        wanted_state_above=float(above_entity.state),
-                    )
-                    return False
+                    return False, {
+                        "state": fvalue,
+                        "wanted_state_above": float(above_entity.state),
+                    }
             except (ValueError, TypeError) as ex:
                 raise ConditionErrorMessage(
                     "numeric_state",
@@ -480,11 +552,9 @@ def async_numeric_state(  # noqa: C901
                     ),
                 ) from ex
         elif fvalue <= above:
-            condition_trace_set_result(False, state=fvalue, wanted_state_above=above)
-            return False
+            return False, {"state": fvalue, "wanted_state_above": above}
 
-    condition_trace_set_result(True, state=fvalue)
-    return True
+    return True, {"state": fvalue}
 
 
 def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
@@ -495,6 +565,21 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
     above = config.get(CONF_ABOVE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
 
+    # Checks without a template only depend on the states of their entities
+    input_entity_ids = tuple(
+        threshold for threshold in (below, above) if isinstance(threshold, str)
+    )
+    checks = [
+        (
+            entity_id,
+            (entity_id, *input_entity_ids),
+            None
+            if value_template is not None
+            else _get_check_cache("numeric_state", entity_id, attribute, below, above),
+        )
+        for entity_id in entity_ids
+    ]
+
     @trace_condition_function
     def if_numeric_state(
         hass: HomeAssistant, variables: TemplateVarsType = None
@@ -504,11 +589,14 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
             value_template.hass = hass
 
         errors = []
-        for index, entity_id in enumerate(entity_ids):
+        for index, (entity_id, check_entity_ids, cache) in enumerate(checks):
             try:
                 with trace_path(["entity_id", str(index)]), trace_condition(variables):
-                    if not async_numeric_state(
+                    if not _async_cached_check(
                         hass,
+                        cache,
+                        check_entity_ids,
+                        _async_numeric_state_result,
                         entity_id,
                         below,
                         above,
@@ -545,6 +633,37 @@ def state(
 
     Async friendly.
     """
+    is_state, trace = _state_result(hass, entity, req_state, attribute)
+
+    if for_period is None or not is_state:
+        condition_trace_set_result(is_state, **trace)
+        return is_state
+
+    if isinstance(entity, str):
+        entity = hass.states.get(entity)
+    assert isinstance(entity, State)
+    value = trace["state"]
+
+    try:
+        for_period = cv.positive_time_period(render_complex(for_period, variables))
+    except TemplateError as ex:
+        raise ConditionErrorMessage("state", f"template error: {ex}") from ex
+    except vol.Invalid as ex:
+        raise ConditionErrorMessage("state", f"schema error: {ex}") from ex
+
+    duration = dt_util.utcnow() - cast(timedelta, for_period)
+    duration_ok = duration > entity.last_changed
+    condition_trace_set_result(duration_ok, state=value, duration=duration)
+    return duration_ok
+
+
+def _state_result(
+    hass: HomeAssistant,
+    entity: None | str | State,
+    req_state: Any,
+    attribute: str | None,
+) -> tuple[bool, dict[str, Any]]:
+    """Test if state matches requirements, return the result and its trace."""
     if entity is None:
         raise ConditionErrorMessage("state", "no entity specified")
 
@@ -557,11 +676,9 @@ def state(
         entity_id = entity.entity_id
 
     if attribute is not None and attribute not in entity.attributes:
-        condition_trace_set_result(
-            False,
-            message=f"attribute '{attribute}' of entity {entity_id} does not exist",
-        )
-        return False
+        return False, {
+            "message": f"attribute '{attribute}' of entity {entity_id} does not exist"
+        }
 
     assert isinstance(entity, State)
 
@@ -589,21 +706,7 @@ def state(
         if is_state:
             break
 
-    if for_period is None or not is_state:
-        condition_trace_set_result(is_state, state=value, wanted_state=state_value)
-        return is_state
-
-    try:
-        for_period = cv.positive_time_period(render_complex(for_period, variables))
-    except TemplateError as ex:
-        raise ConditionErrorMessage("state", f"template error: {ex}") from ex
-    except vol.Invalid as ex:
-        raise ConditionErrorMessage("state", f"schema error: {ex}") from ex
-
-    duration = dt_util.utcnow() - cast(timedelta, for_period)
-    duration_ok = duration > entity.last_changed
-    condition_trace_set_result(duration_ok, state=value, duration=duration)
-    return duration_ok
+    return is_state, {"state": value, "wanted_state": state_value}
 
 
 def state_from_config(config: ConfigType) -> ConditionCheckerType:
@@ -617,18 +720,54 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
     if not isinstance(req_states, list):
         req_states = [req_states]
 
+    # Checks without a duration only depend on the states of their entities
+    input_entity_ids = tuple(
+        req_state
+        for req_state in req_states
+        if isinstance(req_state, str) and INPUT_ENTITY_ID.match(req_state) is not None
+    )
+    checks = [
+        (
+            entity_id,
+            (entity_id, *input_entity_ids),
+            None if for_period is not None
+            # Equal states of different types, like 1 and True, trace differently
+            else _get_check_cache(
+                "state", entity_id, attribute, *((type(v), v) for v in req_states)
+            ),
+        )
+        for entity_id in entity_ids
+    ]
+
     @trace_condition_function
     def if_state(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Test if condition."""
         template_attach(hass, for_period)
         errors = []
         result: bool = match != ENTITY_MATCH_ANY
-        for index, entity_id in enumerate(entity_ids):
+        for index, (entity_id, check_entity_ids, cache) in enumerate(checks):
             try:
                 with trace_path(["entity_id", str(index)]), trace_condition(variables):
-                    if state(
-                        hass, entity_id, req_states, for_period, attribute, variables
-                    ):
+                    if cache is None:
+                        is_state = state(
+                            hass,
+                            entity_id,
+                            req_states,
+                            for_period,
+                            attribute,
+                            variables,
+                        )
+                    else:
+                        is_state = _async_cached_check(
+                            hass,
+                            cache,
+                            check_entity_ids,
+                            _state_result,
+                            entity_id,
+                            req_states,
+                            attribute,
+                        )
+                    if is_state:
                         result = True
                     elif match == ENTITY_MATCH_ALL:
                         return False
@@ -943,22 +1082,54 @@ def zone(
     )
 
 
+def _zone_result(
+    hass: HomeAssistant,
+    zone_ent: None | str | State,
+    entity: None | str | State,
+) -> tuple[bool, None]:
+    """Test if zone-condition matches, return the result without a trace."""
+    return zone(hass, zone_ent, entity), None
+
+
 def zone_from_config(config: ConfigType) -> ConditionCheckerType:
     """Wrap action method with zone based condition."""
     entity_ids = config.get(CONF_ENTITY_ID, [])
     zone_entity_ids = config.get(CONF_ZONE, [])
 
+    # The checks only depend on the states of the entity and the zone
+    checks = [
+        (
+            entity_id,
+            [
+                (
+                    zone_entity_id,
+                    (zone_entity_id, entity_id),
+                    _get_check_cache("zone", zone_entity_id, entity_id),
+                )
+                for zone_entity_id in zone_entity_ids
+            ],
+        )
+        for entity_id in entity_ids
+    ]
+
     @trace_condition_function
     def if_in_zone(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Test if condition."""
         errors = []
 
         all_ok = True
-        for entity_id in entity_ids:
+        for entity_id, zone_checks in checks:
             entity_ok = False
-            for zone_entity_id in zone_entity_ids:
+            for zone_entity_id, check_entity_ids, cache in zone_checks:
                 try:
-                    if zone(hass, zone_entity_id, entity_id):
+                    if _async_cached_check(
+                        hass,
+                        cache,
+                        check_entity_ids,
+                        _zone_result,
+                        zone_entity_id,
+                        entity_id,
+                    ):
                         entity_ok = True
                 except ConditionErrorMessage as ex:
                     errors.append(
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum, auto
 import functools as ft
+from itertools import repeat
 import logging
 import math
 import sys
@@ -33,7 +34,14 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     EntityCategory,
 )
-from homeassistant.core import CALLBACK_TYPE, Context, Event, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    DOMAIN as HA_DOMAIN,
+    Context,
+    Event,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError, NoEntitySpecifiedError
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util, ensure_unique_string, slugify
@@ -55,6 +63,9 @@ DATA_ENTITY_SOURCE = "entity_info"
 SOURCE_CONFIG_ENTRY = "config_entry"
 SOURCE_PLATFORM_CONFIG = "platform_config"
 
+# Entity registry option overriding the minimum interval between state writes
+CONF_MIN_WRITE_INTERVAL = "min_write_interval"
+
 # Used when converting float states to string: limit precision according to machine
 # epsilon to make the string representation readable
 FLOAT_PRECISION = abs(int(math.floor(math.log10(abs(sys.float_info.epsilon))))) - 1
@@ -270,6 +281,9 @@ class Entity(ABC):
     # Process updates in parallel
     parallel_updates: asyncio.Semaphore | None = None
 
+    # Budget of updates in the executor shared by all entity platforms
+    executor_budget: asyncio.Semaphore | None = None
+
     # Entry in the entity registry
     registry_entry: er.RegistryEntry | None = None
 
@@ -282,15 +296,53 @@ class Entity(ABC):
     _context: Context | None = None
     _context_set: datetime | None = None
 
+    # Minimum seconds between state writes, writes in between are coalesced
+    # into a single write at the end of the interval
+    _min_write_interval: float | None = None
+    _last_write = -math.inf
+    _delayed_write: asyncio.TimerHandle | None = None
+
     # If entity is added to an entity platform
     _platform_state = EntityPlatformState.NOT_ADDED
 
+    # Properties the static state attributes are derived from. The static
+    # attributes are cached unless a subclass overrides one of these properties
+    # without listing it. The cache is keyed by the values of their _attr_
+    # attributes set on the instance, so setting one invalidates it.
+    _static_attribute_properties: frozenset[str] = frozenset(
+        {
+            "attribution",
+            "capability_attributes",
+            "device_class",
+            "entity_picture",
+            "has_entity_name",
+            "icon",
+            "name",
+            "supported_features",
+            "translation_key",
+            "use_device_name",
+        }
+    )
+    _static_attributes_cacheable = True
+    _static_attribute_names: tuple[str, ...] = (
+        "entity_description",
+        *sorted(f"_attr_{prop}" for prop in _static_attribute_properties),
+    )
+    # Instance values of the static attribute names, cached capability
+    # attributes and static attributes, and the registry entry they were
+    # calculated with
+    _static_attributes: tuple[
+        tuple[Any, ...], Mapping[str, Any] | None, dict[str, Any]
+    ] | None = None
+    _static_attributes_entry: er.RegistryEntry | None = None
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
     _attr_available: bool = True
     _attr_capability_attributes: Mapping[str, Any] | None = None
     _attr_context_recent_time: timedelta = timedelta(seconds=5)
+    _attr_min_write_interval: timedelta | None = None
     _attr_device_class: str | None
     _attr_device_info: DeviceInfo | None = None
     _attr_entity_category: EntityCategory | None
@@ -309,6 +361,28 @@ class Entity(ABC):
     _attr_unique_id: str | None = None
     _attr_unit_of_measurement: str | None
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Find the static attribute properties of the subclass."""
+        super().__init_subclass__(**kwargs)
+        static_properties: set[str] = set()
+        for klass in cls.__mro__:
+            static_properties.update(
+                klass.__dict__.get("_static_attribute_properties", ())
+            )
+        cls._static_attribute_names = (
+            "entity_description",
+            *sorted(f"_attr_{prop}" for prop in static_properties),
+        )
+        cls._static_attributes_cacheable = all(
+            prop
+            in next(
+                klass.__dict__.get("_static_attribute_properties", ())
+                for klass in cls.__mro__
+                if prop in klass.__dict__
+            )
+            for prop in static_properties
+        )
+
     @property
     def should_poll(self) -> bool:
         """Return True if entity has to be polled for state.
@@ -555,6 +629,16 @@ class Entity(ABC):
         """Time that a context is considered recent."""
         return self._attr_context_recent_time
 
+    @property
+    def min_write_interval(self) -> timedelta | None:
+        """Return the minimum interval between state writes, if any.
+
+        State writes within the interval are coalesced and the latest state is
+        written at the end of it. Can be overridden by the user through the
+        entity registry options.
+        """
+        return self._attr_min_write_interval
+
     @property
     def entity_registry_enabled_default(self) -> bool:
         """Return if the entity should be enabled when first added.
@@ -701,6 +785,36 @@ class Entity(ABC):
             return f"{state:.{FLOAT_PRECISION}}"
         return str(state)
 
+    def _calculate_static_attributes(
+        self, entry: er.RegistryEntry | None
+    ) -> dict[str, Any]:
+        """Calculate the state attributes which rarely change."""
+        attr: dict[str, Any] = {}
+
+        if (attribution := self.attribution) is not None:
+            attr[ATTR_ATTRIBUTION] = attribution
+
+        if (
+            device_class := (entry and entry.device_class) or self.device_class
+        ) is not None:
+            attr[ATTR_DEVICE_CLASS] = str(device_class)
+
+        if (entity_picture := self.entity_picture) is not None:
+            attr[ATTR_ENTITY_PICTURE] = entity_picture
+
+        if (icon := (entry and entry.icon) or self.icon) is not None:
+            attr[ATTR_ICON] = icon
+
+        if (
+            name := (entry and entry.name) or self._friendly_name_internal()
+        ) is not None:
+            attr[ATTR_FRIENDLY_NAME] = name
+
+        if (supported_features := self.supported_features) is not None:
+            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+
+        return attr
+
     def _friendly_name_internal(self) -> str | None:
         """Return the friendly name.
 
@@ -748,10 +862,37 @@ class Entity(ABC):
                 )
             return
 
+        if self._min_write_interval:
+            now = hass.loop.time()
+            if (next_write := self._last_write + self._min_write_interval) > now:
+                if self._delayed_write is None:
+                    self._delayed_write = hass.loop.call_at(
+                        next_write, self._async_delayed_write
+                    )
+                return
+            self._last_write = now
+
         start = timer()
 
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
+        static_attributes: dict[str, Any] | None = None
+        static_key: tuple[Any, ...] = ()
+        if self._static_attributes_cacheable:
+            static_key = tuple(
+                map(
+                    self.__dict__.get,
+                    self._static_attribute_names,
+                    repeat(UNDEFINED),
+                )
+            )
+        if (
+            (cached := self._static_attributes) is not None
+            and self._static_attributes_entry is entry
+            and cached[0] == static_key
+        ):
+            _, capability_attributes, static_attributes = cached
+        else:
+            capability_attributes = self.capability_attributes
+        attr = dict(capability_attributes) if capability_attributes else {}
 
         available = self.available  # only call self.available once per update cycle
         state = self._stringify_state(available)
@@ -765,27 +906,16 @@ class Entity(ABC):
         if assumed_state := self.assumed_state:
             attr[ATTR_ASSUMED_STATE] = assumed_state
 
-        if (attribution := self.attribution) is not None:
-            attr[ATTR_ATTRIBUTION] = attribution
-
-        if (
-            device_class := (entry and entry.device_class) or self.device_class
-        ) is not None:
-            attr[ATTR_DEVICE_CLASS] = str(device_class)
-
-        if (entity_picture := self.entity_picture) is not None:
-            attr[ATTR_ENTITY_PICTURE] = entity_picture
-
-        if (icon := (entry and entry.icon) or self.icon) is not None:
-            attr[ATTR_ICON] = icon
-
-        if (
-            name := (entry and entry.name) or self._friendly_name_internal()
-        ) is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
-
-        if (supported_features := self.supported_features) is not None:
-            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+        if static_attributes is None:
+            static_attributes = self._calculate_static_attributes(entry)
+            if self._static_attributes_cacheable:
+                self._static_attributes = (
+                    static_key,
+                    capability_attributes,
+                    static_attributes,
+                )
+                self._static_attributes_entry = entry
+        attr.update(static_attributes)
 
         end = timer()
 
@@ -813,6 +943,27 @@ class Entity(ABC):
 
         hass.states.async_set(entity_id, state, attr, self.force_update, self._context)
 
+    @callback
+    def _async_delayed_write(self) -> None:
+        """Write the state coalesced at the end of the minimum write interval."""
+        self._delayed_write = None
+        self._last_write = -math.inf
+        self._async_write_ha_state()
+
+    @callback
+    def _async_read_min_write_interval(self) -> None:
+        """Read the minimum write interval from the registry options or entity."""
+        interval: float | None = None
+        if (
+            self.registry_entry
+            and (options := self.registry_entry.options.get(HA_DOMAIN))
+            and (seconds := options.get(CONF_MIN_WRITE_INTERVAL)) is not None
+        ):
+            interval = float(seconds)
+        elif (min_write_interval := self.min_write_interval) is not None:
+            interval = min_write_interval.total_seconds()
+        self._min_write_interval = interval or None
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -886,7 +1037,11 @@ class Entity(ABC):
             if hasattr(self, "async_update"):
                 await self.async_update()
             elif hasattr(self, "update"):
-                await hass.async_add_executor_job(self.update)
+                if self.executor_budget:
+                    async with self.executor_budget:
+                        await hass.async_add_executor_job(self.update)
+                else:
+                    await hass.async_add_executor_job(self.update)
             else:
                 return
         finally:
@@ -945,6 +1100,7 @@ class Entity(ABC):
         self.hass = None  # type: ignore[assignment]
         self.platform = None  # type: ignore[assignment]
         self.parallel_updates = None
+        self.executor_budget = None
 
     async def add_to_platform_finish(self) -> None:
         """Finish adding an entity to a platform."""
@@ -1023,6 +1179,7 @@ class Entity(ABC):
             info["source"] = SOURCE_PLATFORM_CONFIG
 
         self.hass.data[DATA_ENTITY_SOURCE][self.entity_id] = info
+        self._async_read_min_write_interval()
 
         if self.registry_entry is not None:
             # This is an assert as it should never happen, but helps in tests
@@ -1047,6 +1204,10 @@ class Entity(ABC):
         if self.platform:
             self.hass.data[DATA_ENTITY_SOURCE].pop(self.entity_id)
 
+        if self._delayed_write is not None:
+            self._delayed_write.cancel()
+            self._delayed_write = None
+
     async def _async_registry_updated(self, event: Event) -> None:
         """Handle entity registry update."""
         data = event.data
@@ -1072,6 +1233,7 @@ class Entity(ABC):
 
         assert old is not None
         if self.registry_entry.entity_id == old.entity_id:
+            self._async_read_min_write_interval()
             self.async_registry_entry_updated()
             self.async_write_ha_state()
             return
@@ -1113,6 +1275,7 @@ class Entity(ABC):
             if "name" not in data["changes"] and "name_by_user" not in data["changes"]:
                 return
 
+            self._static_attributes = None
             self.async_write_ha_state()
 
         self._unsub_device_updates = async_track_device_registry_updated_event(
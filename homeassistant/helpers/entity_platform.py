@@ -4,10 +4,12 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from logging import Logger, getLogger
 from typing import TYPE_CHECKING, Any, Protocol
 from urllib.parse import urlparse
+import zlib
 
 import voluptuous as vol
 
@@ -20,6 +22,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     CALLBACK_TYPE,
     CoreState,
+    HassJob,
     HomeAssistant,
     ServiceCall,
     callback,
@@ -45,6 +48,7 @@ from .device_registry import DeviceRegistry
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later, async_track_time_interval
 from .issue_registry import IssueSeverity, async_create_issue
+from .singleton import singleton
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -60,6 +64,14 @@ PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+DATA_POLLING_SCHEDULER = "entity_platform_polling_scheduler"
+# The first poll of a platform is moved forward by up to this fraction
+# of its scan interval
+POLLING_JITTER = 0.5
+# Entity updates running in the executor at once for all platforms, leaves
+# room for other jobs in the executor
+MAX_PARALLEL_EXECUTOR_POLLS = 32
+
 _LOGGER = getLogger(__name__)
 
 
@@ -102,6 +114,89 @@ class EntityPlatformModule(Protocol):
         """Set up an integration platform from a config entry."""
 
 
+@dataclass
+class PollMetrics:
+    """Poll metrics of an entity platform."""
+
+    polls: int = 0
+    overruns: int = 0
+    last_duration: float | None = None
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+
+    @property
+    def average_duration(self) -> float | None:
+        """Return the average duration of a poll."""
+        if not self.polls:
+            return None
+        return self.total_duration / self.polls
+
+    def record(self, duration: float) -> None:
+        """Record the duration of a poll."""
+        self.polls += 1
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        self.total_duration += duration
+
+
+class EntityPollingScheduler:
+    """Schedule the polling of all entity platforms.
+
+    The first poll of a platform is moved forward by a jitter derived from
+    the platform, so platforms set up together with the same scan interval
+    do not poll at the same time. Entity updates running in the executor
+    share a global budget.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the polling scheduler."""
+        self.hass = hass
+        self.executor_budget = asyncio.Semaphore(MAX_PARALLEL_EXECUTOR_POLLS)
+
+    @callback
+    def async_track_polling(
+        self,
+        key: str,
+        action: Callable[[datetime], Coroutine[Any, Any, None]],
+        interval: timedelta,
+        name: str,
+    ) -> CALLBACK_TYPE:
+        """Call action every interval, starting at a jitter derived from key."""
+        hass = self.hass
+        unsub: CALLBACK_TYPE
+
+        @callback
+        def start_polling(now: datetime) -> None:
+            """Run the first poll and poll every interval from now on."""
+            nonlocal unsub
+            unsub = async_track_time_interval(hass, action, interval, name=name)
+            hass.async_create_task(action(now), name)
+
+        unsub = async_call_later(
+            hass,
+            interval * (1 - POLLING_JITTER * _polling_phase(key)),
+            HassJob(start_polling, name),
+        )
+
+        @callback
+        def remove_listener() -> None:
+            """Stop polling."""
+            unsub()
+
+        return remove_listener
+
+
+def _polling_phase(key: str) -> float:
+    """Return a phase between 0 and 1 that is the same on every run for key."""
+    return zlib.crc32(key.encode()) / 2**32
+
+
+@singleton(DATA_POLLING_SCHEDULER)
+def async_get_polling_scheduler(hass: HomeAssistant) -> EntityPollingScheduler:
+    """Return the entity polling scheduler."""
+    return EntityPollingScheduler(hass)
+
+
 class EntityPlatform:
     """Manage the entities for a single platform."""
 
@@ -136,6 +231,7 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        self.poll_metrics = PollMetrics()
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
@@ -500,11 +596,16 @@ class EntityPlatform:
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
+        key = f"{self.domain}.{self.platform_name}"
+        if self.config_entry:
+            key = f"{key}.{self.config_entry.entry_id}"
+        self._async_unsub_polling = async_get_polling_scheduler(
+            self.hass
+        ).async_track_polling(
+            key,
             self._update_entity_states,
             self.scan_interval,
-            name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
+            f"EntityPlatform poll {self.domain}.{self.platform_name}",
         )
 
     def _entity_id_already_exists(self, entity_id: str) -> tuple[bool, bool]:
@@ -539,6 +640,7 @@ class EntityPlatform:
             self,
             self._get_parallel_updates_semaphore(hasattr(entity, "update")),
         )
+        entity.executor_budget = async_get_polling_scheduler(self.hass).executor_budget
 
         # Update properties before we generate the entity_id
         if update_before_add:
@@ -857,13 +959,16 @@ class EntityPlatform:
         """Update the states of all the polling entities.
 
         To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+        in parallel and other entities sequential. Entities updating in the
+        executor also wait for the budget of executor updates shared by all
+        platforms, once they hold the parallel updates semaphore.
 
         This method must be run in the event loop.
         """
         if self._process_updates is None:
             self._process_updates = asyncio.Lock()
         if self._process_updates.locked():
+            self.poll_metrics.overruns += 1
             self.logger.warning(
                 "Updating %s %s took longer than the scheduled update interval %s",
                 self.platform_name,
@@ -873,23 +978,31 @@ class EntityPlatform:
             return
 
         async with self._process_updates:
-            if self._update_in_sequence or len(self.entities) <= 1:
-                # If we know we will update sequentially, we want to avoid scheduling
-                # the coroutines as tasks that will wait on the semaphore lock.
-                for entity in list(self.entities.values()):
-                    # If the entity is removed from hass during the previous
-                    # entity being updated, we need to skip updating the
-                    # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
-                return
+            start = self.hass.loop.time()
+            try:
+                await self._async_poll_entities()
+            finally:
+                self.poll_metrics.record(self.hass.loop.time() - start)
+
+    async def _async_poll_entities(self) -> None:
+        """Update the states of all the polling entities."""
+        if self._update_in_sequence or len(self.entities) <= 1:
+            # If we know we will update sequentially, we want to avoid scheduling
+            # the coroutines as tasks that will wait on the semaphore lock.
+            for entity in list(self.entities.values()):
+                # If the entity is removed from hass during the previous
+                # entity being updated, we need to skip updating the
+                # entity.
+                if entity.should_poll and entity.hass:
+                    await entity.async_update_ha_state(True)
+            return
 
-            if tasks := [
-                entity.async_update_ha_state(True)
-                for entity in self.entities.values()
-                if entity.should_poll
-            ]:
-                await asyncio.gather(*tasks)
+        if tasks := [
+            entity.async_update_ha_state(True)
+            for entity in self.entities.values()
+            if entity.should_poll
+        ]:
+            await asyncio.gather(*tasks)
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
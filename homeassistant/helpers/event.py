@@ -1346,6 +1346,7 @@ def async_track_point_in_utc_time(
     # having to figure out how to call the action every time its called.
     cancel_callback: asyncio.TimerHandle | None = None
     loop = hass.loop
+    timer_wheel = hass.timer_wheel
 
     @callback
     def run_action(job: HassJob[[datetime], Coroutine[Any, Any, None] | None]) -> None:
@@ -1359,7 +1360,7 @@ def async_track_point_in_utc_time(
         if (delta := (expected_fire_timestamp - time_tracker_timestamp())) > 0:
             _LOGGER.debug("Called %f seconds too early, rearming", delta)
 
-            cancel_callback = loop.call_at(loop.time() + delta, run_action, job)
+            cancel_callback = timer_wheel.call_at(loop.time() + delta, run_action, job)
             return
 
         hass.async_run_hass_job(job, utc_point_in_time)
@@ -1370,7 +1371,7 @@ def async_track_point_in_utc_time(
         else HassJob(action, f"track point in utc time {utc_point_in_time}")
     )
     delta = expected_fire_timestamp - time.time()
-    cancel_callback = loop.call_at(loop.time() + delta, run_action, job)
+    cancel_callback = timer_wheel.call_at(loop.time() + delta, run_action, job)
 
     @callback
     def unsub_point_in_time_listener() -> None:
@@ -1406,7 +1407,9 @@ def async_call_later(
         if isinstance(action, HassJob)
         else HassJob(action, f"call_later {delay}")
     )
-    cancel_callback = hass.loop.call_at(hass.loop.time() + delay, run_action, job)
+    cancel_callback = hass.timer_wheel.call_at(
+        hass.loop.time() + delay, run_action, job
+    )
 
     @callback
     def unsub_call_later_listener() -> None:
@@ -67,6 +67,9 @@ else:
     )
     """Dump json bytes."""
 
+json_fragment = orjson.Fragment
+"""Wrap encoded JSON to include it as is when dumping with orjson."""
+
 
 class ExtendedJSONEncoder(JSONEncoder):
     """JSONEncoder that supports Home Assistant objects and falls back to repr(o)."""
@@ -88,6 +91,45 @@ class ExtendedJSONEncoder(JSONEncoder):
             return {"__type": str(type(o)), "repr": repr(o)}
 
 
+def json_encoder_extended_default(obj: Any) -> Any:
+    """Convert objects like ExtendedJSONEncoder does.
+
+    Objects with a cached JSON representation, like states, are included as
+    is. Fall back to repr(obj).
+    """
+    if isinstance(obj, datetime.timedelta):
+        return {"__type": str(type(obj)), "total_seconds": obj.total_seconds()}
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return {"__type": str(type(obj)), "isoformat": obj.isoformat()}
+    if hasattr(obj, "as_dict_json"):
+        try:
+            return json_fragment(obj.as_dict_json())
+        except TypeError:
+            pass
+    try:
+        return json_encoder_default(obj)
+    except TypeError:
+        return {"__type": str(type(obj)), "repr": repr(obj)}
+
+
+def json_dumps_extended(data: Any) -> str:
+    """Dump json string, supporting the same objects as ExtendedJSONEncoder."""
+    try:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME,
+            default=json_encoder_extended_default,
+        ).decode("utf-8")
+    except TypeError:
+        # orjson can't encode everything the JSON encoder can, like integers
+        # exceeding 64 bits
+        return json.dumps(data, cls=ExtendedJSONEncoder, separators=(",", ":"))
+
+
 def _strip_null(obj: Any) -> Any:
     """Strip NUL from an object."""
     if isinstance(obj, str):
@@ -17,7 +17,7 @@ from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .storage import Store
 
 DATA_RESTORE_STATE = "restore_state"
@@ -33,6 +33,10 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long the periodic dump may be skipped when no stored state has changed,
+# this keeps the last seen time of the stored states reasonably current
+STATE_DUMP_MAX_SKIP = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -139,6 +143,11 @@ class RestoreStateData:
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The state, extra data and encoded extra data of each dumped entity
+        self._dumped_states: dict[
+            str, tuple[State, dict[str, Any] | None, bytes | None]
+        ] = {}
+        self._last_dump: datetime | None = None
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -213,18 +222,58 @@ class RestoreStateData:
 
         return stored_states
 
-    async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+    async def async_dump_states(self, skip_unchanged: bool = False) -> None:
+        """Save the current state machine to storage.
+
+        The JSON of each state is cached by the state, and the JSON of the
+        extra data is reused while the extra data is unchanged, so only
+        entities which changed since they were last dumped are encoded again.
+        """
+        now = dt_util.utcnow()
+        encoded_states: list[dict[str, Any]] = []
+        dumped_states: dict[str, tuple[State, dict[str, Any] | None, bytes | None]] = {}
+        previous_dump = self._dumped_states
+        changed = False
+        for stored_state in self.async_get_stored_states():
+            state = stored_state.state
+            extra_dict = (
+                stored_state.extra_data.as_dict() if stored_state.extra_data else None
+            )
+            dumped = previous_dump.get(state.entity_id)
+            if dumped is not None and dumped[1] == extra_dict:
+                extra_data = dumped[2]
+            else:
+                extra_data = json_bytes(extra_dict) if extra_dict is not None else None
+                changed = True
+            dumped_states[state.entity_id] = (state, extra_dict, extra_data)
+            if dumped is None or dumped[0] is not state:
+                changed = True
+            encoded_states.append(
+                {
+                    "state": json_fragment(state.as_dict_json()),
+                    "extra_data": json_fragment(extra_data) if extra_data else None,
+                    "last_seen": stored_state.last_seen,
+                }
+            )
+        changed = changed or len(previous_dump) != len(dumped_states)
+
+        if (
+            skip_unchanged
+            and not changed
+            and self._last_dump is not None
+            and now - self._last_dump < STATE_DUMP_MAX_SKIP
+        ):
+            _LOGGER.debug("Skipping dump of unchanged states")
+            return
+
         _LOGGER.debug("Dumping states")
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(encoded_states)
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+        self._dumped_states = dumped_states
+        self._last_dump = now
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -233,6 +282,9 @@ class RestoreStateData:
         async def _async_dump_states(*_: Any) -> None:
             await self.async_dump_states()
 
+        async def _async_dump_changed_states(*_: Any) -> None:
+            await self.async_dump_states(skip_unchanged=True)
+
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
@@ -241,7 +293,7 @@ class RestoreStateData:
         # Dump states periodically
         cancel_interval = async_track_time_interval(
             self.hass,
-            _async_dump_states,
+            _async_dump_changed_states,
             STATE_DUMP_INTERVAL,
             name="RestoreStateData dump states",
         )
@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import asynccontextmanager, suppress
 from contextvars import ContextVar
 from copy import copy
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial
 import itertools
@@ -1031,42 +1033,21 @@ class _ScriptRun:
 class _QueuedScriptRun(_ScriptRun):
     """Manage queued Script sequence run."""
 
-    lock_acquired = False
+    def _finish(self) -> None:
+        # Start the next queued run first, so the script doesn't stop running
+        self._script._async_start_queued_run()  # pylint: disable=protected-access
+        super()._finish()
 
-    async def async_run(self) -> None:
-        """Run script."""
-        # Wait for previous run, if any, to finish by attempting to acquire the script's
-        # shared lock. At the same time monitor if we've been told to stop.
-        lock_task = self._hass.async_create_task(
-            self._script._queue_lck.acquire()  # pylint: disable=protected-access
-        )
-        stop_task = self._hass.async_create_task(self._stop.wait())
-        try:
-            await asyncio.wait(
-                {lock_task, stop_task}, return_when=asyncio.FIRST_COMPLETED
-            )
-        except asyncio.CancelledError:
-            self._finish()
-            raise
-        else:
-            self.lock_acquired = lock_task.done() and not lock_task.cancelled()
-        finally:
-            lock_task.cancel()
-            stop_task.cancel()
 
-        # If we've been told to stop, then just finish up. Otherwise, we've acquired the
-        # lock so we can go ahead and start the run.
-        if self._stop.is_set():
-            self._finish()
-        else:
-            await super().async_run()
+@dataclass(slots=True)
+class _PendingScriptRun:
+    """A queued Script run waiting for the previous run to finish."""
 
-    def _finish(self) -> None:
-        # pylint: disable=protected-access
-        if self.lock_acquired:
-            self._script._queue_lck.release()
-            self.lock_acquired = False
-        super()._finish()
+    variables: dict[str, Any]
+    context: Context
+    queued_at: float
+    # Set to the run when it starts, or to None when it's stopped
+    start: asyncio.Future[_ScriptRun | None]
 
 
 @callback
@@ -1200,10 +1181,14 @@ class Script:
         self.last_triggered: datetime | None = None
 
         self._runs: list[_ScriptRun] = []
+        self._queue: deque[_PendingScriptRun] = deque()
         self.max_runs = max_runs
         self._max_exceeded = max_exceeded
-        if script_mode == SCRIPT_MODE_QUEUED:
-            self._queue_lck = asyncio.Lock()
+        # Diagnostics of queued and dropped runs
+        self.dropped_runs = 0
+        self.max_queue_depth = 0
+        self.queued_runs_started = 0
+        self.queue_wait_time = 0.0
         self._config_cache: dict[set[tuple], Callable[..., bool]] = {}
         self._repeat_script: dict[int, Script] = {}
         self._choose_data: dict[int, _ChooseData] = {}
@@ -1270,12 +1255,17 @@ class Script:
     @property
     def is_running(self) -> bool:
         """Return true if script is on."""
-        return len(self._runs) > 0
+        return len(self._runs) > 0 or len(self._queue) > 0
 
     @property
     def runs(self) -> int:
         """Return the number of current runs."""
-        return len(self._runs)
+        return len(self._runs) + len(self._queue)
+
+    @property
+    def queued_runs(self) -> int:
+        """Return the number of queued runs waiting to start."""
+        return len(self._queue)
 
     @property
     def supports_max(self) -> bool:
@@ -1454,6 +1444,7 @@ class Script:
             if self.script_mode == SCRIPT_MODE_SINGLE:
                 if self._max_exceeded != "SILENT":
                     self._log("Already running", level=LOGSEVERITY[self._max_exceeded])
+                self.dropped_runs += 1
                 script_execution_set("failed_single")
                 return
             if self.script_mode != SCRIPT_MODE_RESTART and self.runs == self.max_runs:
@@ -1462,6 +1453,7 @@ class Script:
                         "Maximum number of runs exceeded",
                         level=LOGSEVERITY[self._max_exceeded],
                     )
+                self.dropped_runs += 1
                 script_execution_set("failed_max_runs")
                 return
 
@@ -1502,27 +1494,46 @@ class Script:
             self._log("Disallowed recursion detected", level=logging.WARNING)
             return
 
-        if self.script_mode != SCRIPT_MODE_QUEUED:
-            cls = _ScriptRun
+        run: _ScriptRun | None = None
+        pending: _PendingScriptRun | None = None
+        if self.script_mode == SCRIPT_MODE_QUEUED and self._runs:
+            # Queue the run, it's only created when the previous run has finished
+            pending = _PendingScriptRun(
+                cast(dict, variables),
+                context,
+                self._hass.loop.time(),
+                self._hass.loop.create_future(),
+            )
+            self._queue.append(pending)
+            self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
         else:
-            cls = _QueuedScriptRun
-        run = cls(
-            self._hass, self, cast(dict, variables), context, self._log_exceptions
-        )
-        self._runs.append(run)
-        if self.script_mode == SCRIPT_MODE_RESTART:
-            # When script mode is SCRIPT_MODE_RESTART, first add the new run and then
-            # stop any other runs. If we stop other runs first, self.is_running will
-            # return false after the other script runs were stopped until our task
-            # resumes running.
-            self._log("Restarting")
-            await self.async_stop(update_state=False, spare=run)
+            if self.script_mode != SCRIPT_MODE_QUEUED:
+                cls = _ScriptRun
+            else:
+                cls = _QueuedScriptRun
+            run = cls(
+                self._hass, self, cast(dict, variables), context, self._log_exceptions
+            )
+            self._runs.append(run)
+            if self.script_mode == SCRIPT_MODE_RESTART:
+                # When script mode is SCRIPT_MODE_RESTART, first add the new run and
+                # then stop any other runs. If we stop other runs first,
+                # self.is_running will return false after the other script runs were
+                # stopped until our task resumes running.
+                self._log("Restarting")
+                await self.async_stop(update_state=False, spare=run)
 
         if started_action:
             self._hass.async_run_job(started_action)
         self.last_triggered = utcnow()
         self._changed()
 
+        if pending is not None:
+            run = await self._async_wait_queued_run(pending)
+        if run is None:
+            # The queued run was stopped before it started
+            return
+
         try:
             await asyncio.shield(run.async_run())
         except asyncio.CancelledError:
@@ -1530,6 +1541,43 @@ class Script:
             self._changed()
             raise
 
+    async def _async_wait_queued_run(
+        self, pending: _PendingScriptRun
+    ) -> _ScriptRun | None:
+        """Wait for a queued run to start."""
+        try:
+            return await pending.start
+        except asyncio.CancelledError:
+            if pending.start.cancelled():
+                # The queue may have been drained before the run resumed
+                with suppress(ValueError):
+                    self._queue.remove(pending)
+            elif (run := pending.start.result()) is not None:
+                # The run was started, but won't run
+                run._finish()  # pylint: disable=protected-access
+            self._changed()
+            raise
+
+    @callback
+    def _async_start_queued_run(self) -> None:
+        """Start the next queued run."""
+        while self._queue:
+            pending = self._queue.popleft()
+            if pending.start.done():
+                continue
+            run = _QueuedScriptRun(
+                self._hass,
+                self,
+                pending.variables,
+                pending.context,
+                self._log_exceptions,
+            )
+            self._runs.append(run)
+            self.queued_runs_started += 1
+            self.queue_wait_time += self._hass.loop.time() - pending.queued_at
+            pending.start.set_result(run)
+            return
+
     async def _async_stop(
         self, aws: list[asyncio.Task], update_state: bool, spare: _ScriptRun | None
     ) -> None:
@@ -1541,6 +1589,11 @@ class Script:
         self, update_state: bool = True, spare: _ScriptRun | None = None
     ) -> None:
         """Stop running script."""
+        # Queued runs are stopped before they start
+        while self._queue:
+            if not (pending := self._queue.popleft()).start.done():
+                pending.start.set_result(None)
+
         # Collect a list of script runs to stop. This must be done before calling
         # asyncio.shield as asyncio.shield yields to the event loop, which would cause
         # us to wait for script runs added after the call to async_stop.
@@ -25,20 +25,40 @@ level of significance.
 The following cases will never be passed to your function:
 - if either state is unknown/unavailable
 - state adding/removing
+
+Integrations reporting states to an external service can subscribe to the
+shared SignificantChangeFeed, which runs the significant change check once per
+state change for all subscribers and coalesces changes per entity.
 """
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
 from types import MappingProxyType
 from typing import Any
 
-from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import HomeAssistant, State, callback
-
+from homeassistant.const import (
+    EVENT_STATE_CHANGED,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HassJob,
+    HomeAssistant,
+    State,
+    callback,
+)
+
+from .event import async_call_later
 from .integration_platform import async_process_integration_platforms
 
 PLATFORM = "significant_change"
 DATA_FUNCTIONS = "significant_change"
+DATA_FEED = "significant_change_feed"
 CheckTypeFunc = Callable[
     [
         HomeAssistant,
@@ -50,6 +70,9 @@ CheckTypeFunc = Callable[
     bool | None,
 ]
 
+# Changes passed to feed subscribers, entity_id -> (old_state, new_state)
+StateChanges = dict[str, tuple[State | None, State]]
+
 ExtraCheckTypeFunc = Callable[
     [
         HomeAssistant,
@@ -74,6 +97,14 @@ async def create_checker(
     return SignificantlyChangedChecker(hass, extra_significant_check)
 
 
+async def async_get_feed(hass: HomeAssistant) -> SignificantChangeFeed:
+    """Return the shared significant change feed."""
+    await _initialize(hass)
+    if (feed := hass.data.get(DATA_FEED)) is None:
+        feed = hass.data[DATA_FEED] = SignificantChangeFeed(hass)
+    return feed
+
+
 # Marked as singleton so multiple calls all wait for same output.
 async def _initialize(hass: HomeAssistant) -> None:
     """Initialize the functions."""
@@ -235,3 +266,102 @@ class SignificantlyChangedChecker:
             extra_arg,
         )
         return True
+
+
+@dataclass(slots=True)
+class _FeedSubscription:
+    """A subscriber of the significant change feed."""
+
+    entity_filter: Callable[[State], bool]
+    action: Callable[[StateChanges], None]
+    window: float
+    pending: StateChanges = field(default_factory=dict)
+    unsub_flush: CALLBACK_TYPE | None = None
+
+
+class SignificantChangeFeed:
+    """Feed of significant state changes shared by integrations reporting states.
+
+    The significant change check runs once per state change, only for
+    entities at least one subscriber is interested in. Changes are collected
+    per entity during the window of a subscriber, so the subscriber gets the
+    state before the first and after the last significant change.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the feed."""
+        self.hass = hass
+        self._checker = SignificantlyChangedChecker(hass)
+        self._subscriptions: list[_FeedSubscription] = []
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        entity_filter: Callable[[State], bool],
+        action: Callable[[StateChanges], None],
+        window: float = 0,
+    ) -> CALLBACK_TYPE:
+        """Subscribe to significant changes of entities passing the filter.
+
+        With a window of 0 every significant change is passed on right away.
+        """
+        subscription = _FeedSubscription(entity_filter, action, window)
+        self._subscriptions.append(subscription)
+        if self._unsub_state_changed is None:
+            self._unsub_state_changed = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            self._subscriptions.remove(subscription)
+            if subscription.unsub_flush is not None:
+                subscription.unsub_flush()
+            if not self._subscriptions and self._unsub_state_changed is not None:
+                self._unsub_state_changed()
+                self._unsub_state_changed = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Pass a significant state change on to the interested subscribers."""
+        if not self.hass.is_running:
+            return
+        new_state: State | None = event.data["new_state"]
+        if new_state is None:
+            return
+        subscriptions = [
+            subscription
+            for subscription in self._subscriptions
+            if subscription.entity_filter(new_state)
+        ]
+        if not subscriptions or not self._checker.async_is_significant_change(
+            new_state
+        ):
+            return
+
+        entity_id = new_state.entity_id
+        old_state: State | None = event.data["old_state"]
+        for subscription in subscriptions:
+            if not subscription.window:
+                subscription.action({entity_id: (old_state, new_state)})
+                continue
+            if pending := subscription.pending.get(entity_id):
+                subscription.pending[entity_id] = (pending[0], new_state)
+            else:
+                subscription.pending[entity_id] = (old_state, new_state)
+            if subscription.unsub_flush is None:
+                subscription.unsub_flush = async_call_later(
+                    self.hass,
+                    subscription.window,
+                    HassJob(partial(self._async_flush, subscription)),
+                )
+
+    @callback
+    def _async_flush(self, subscription: _FeedSubscription, _now: datetime) -> None:
+        """Pass the changes collected during the window to a subscriber."""
+        subscription.unsub_flush = None
+        changes, subscription.pending = subscription.pending, {}
+        subscription.action(changes)
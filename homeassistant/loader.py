@@ -8,7 +8,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Iterable
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import functools as ft
 import importlib
 import logging
@@ -25,6 +25,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
+from .const import __version__
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.dhcp import DHCP
@@ -48,6 +49,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_CACHE = "integration_manifest_cache"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -63,6 +65,10 @@ MAX_LOAD_CONCURRENTLY = 4
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
+MANIFEST_CACHE_STORAGE_KEY = "core.integration_manifests"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 30
+
 
 class DHCPMatcherRequired(TypedDict, total=True):
     """Matcher for the dhcp integration for required fields."""
@@ -177,6 +183,161 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+def _copy_json(value: Any) -> Any:
+    """Return a copy of a JSON value that shares no dicts or lists with it."""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+@dataclass
+class _ManifestCacheUpdates:
+    """Cache entries read in the executor, merged into the cache in the loop."""
+
+    manifests: dict[str, dict[str, Any]] = field(default_factory=dict)
+    directories: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+class _ManifestCache:
+    """Persistent cache of parsed manifests and directory listings.
+
+    Entries are validated against the modification time and size of the
+    file or directory they were read from, so a restart only has to stat
+    them instead of listing directories and parsing every manifest.json.
+    The resolved dependency closure of each integration is stored as well
+    and used as a hint to load all dependencies in a single batch.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manifest cache."""
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            MANIFEST_CACHE_STORAGE_VERSION,
+            MANIFEST_CACHE_STORAGE_KEY,
+            atomic_writes=True,
+        )
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        self._changed = False
+        self._manifests: dict[str, dict[str, Any]] = {}
+        self._directories: dict[str, dict[str, Any]] = {}
+        self.dependencies: dict[str, list[str]] = {}
+
+    async def async_load(self) -> None:
+        """Load the cache from disk."""
+        # pylint: disable-next=import-outside-toplevel
+        from .exceptions import HomeAssistantError
+
+        async with self._load_lock:
+            if self._loaded:
+                return
+            try:
+                data = await self._store.async_load()
+            except HomeAssistantError as err:
+                _LOGGER.warning(
+                    "Unable to load the integration manifest cache: %s", err
+                )
+                data = None
+            self._loaded = True
+            if not data or data.get("ha_version") != __version__:
+                return
+            self._manifests = data["manifests"]
+            self._directories = data["directories"]
+            self.dependencies = data["dependencies"]
+
+    def get_manifest(
+        self, manifest_path: pathlib.Path, updates: _ManifestCacheUpdates
+    ) -> Manifest | None:
+        """Return the manifest at a path or None if it does not exist.
+
+        Runs in the executor, a manifest that is not cached is added to
+        updates. Raises the underlying exception if the manifest cannot be
+        parsed.
+        """
+        try:
+            stat = manifest_path.stat()
+        except OSError:
+            return None
+        key = str(manifest_path)
+        if (
+            (entry := self._manifests.get(key))
+            and entry["mtime"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+        ):
+            return cast(Manifest, _copy_json(entry["manifest"]))
+        manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+        updates.manifests[key] = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "manifest": _copy_json(manifest),
+        }
+        return manifest
+
+    def get_sub_directories(
+        self, path: pathlib.Path, updates: _ManifestCacheUpdates
+    ) -> list[str]:
+        """Return the names of all sub directories of a path.
+
+        Runs in the executor, a listing that is not cached is added to
+        updates.
+        """
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return []
+        key = str(path)
+        if (entry := self._directories.get(key)) and entry["mtime"] == mtime:
+            return list(entry["entries"])
+        entries = [entry.name for entry in path.iterdir() if entry.is_dir()]
+        updates.directories[key] = {"mtime": mtime, "entries": list(entries)}
+        return entries
+
+    def async_merge(self, updates: _ManifestCacheUpdates) -> None:
+        """Merge the entries read in the executor into the cache."""
+        if not updates.manifests and not updates.directories:
+            return
+        self._manifests.update(updates.manifests)
+        self._directories.update(updates.directories)
+        self._changed = True
+
+    def async_set_dependencies(self, domain: str, dependencies: set[str]) -> None:
+        """Store the resolved dependency closure of an integration."""
+        if set(self.dependencies.get(domain, ())) == dependencies:
+            return
+        self.dependencies[domain] = sorted(dependencies)
+        self._changed = True
+
+    def async_schedule_save(self) -> None:
+        """Schedule saving the cache if it has changed."""
+        if not self._changed:
+            return
+        self._changed = False
+        self._store.async_delay_save(self._data_to_save, MANIFEST_CACHE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {
+            "ha_version": __version__,
+            "manifests": dict(self._manifests),
+            "directories": dict(self._directories),
+            "dependencies": dict(self.dependencies),
+        }
+
+
+async def _async_get_manifest_cache(hass: HomeAssistant) -> _ManifestCache:
+    """Return the loaded manifest cache."""
+    if (cache := hass.data.get(DATA_MANIFEST_CACHE)) is None:
+        cache = hass.data[DATA_MANIFEST_CACHE] = _ManifestCache(hass)
+    await cache.async_load()
+    return cast(_ManifestCache, cache)
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -189,13 +350,17 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
+    manifest_cache = await _async_get_manifest_cache(hass)
+    cache_updates = _ManifestCacheUpdates()
+
+    def get_sub_directories(paths: list[str]) -> list[str]:
         """Return all sub directories in a set of paths."""
         return [
             entry
             for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
+            for entry in manifest_cache.get_sub_directories(
+                pathlib.Path(path), cache_updates
+            )
         ]
 
     dirs = await hass.async_add_executor_job(
@@ -206,8 +371,11 @@ async def _async_get_custom_components(
         _resolve_integrations_from_root,
         hass,
         custom_components,
-        [comp.name for comp in dirs],
+        dirs,
+        cache_updates,
     )
+    manifest_cache.async_merge(cache_updates)
+    manifest_cache.async_schedule_save()
     return {
         integration.domain: integration
         for integration in integrations.values()
@@ -546,17 +714,30 @@ class Integration:
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        cache_updates: _ManifestCacheUpdates | None = None,
     ) -> Integration | None:
-        """Resolve an integration from a root module."""
+        """Resolve an integration from a root module.
+
+        The manifest cache is only used when cache_updates is passed to
+        collect the manifests it does not have yet.
+        """
+        manifest_cache: _ManifestCache | None = hass.data.get(DATA_MANIFEST_CACHE)
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                if manifest_cache is not None and cache_updates is not None:
+                    manifest = manifest_cache.get_manifest(manifest_path, cache_updates)
+                    if manifest is None:
+                        continue
+                elif not manifest_path.is_file():
+                    continue
+                else:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
@@ -769,6 +950,14 @@ class Integration:
         if self._all_dependencies_resolved is not None:
             return self._all_dependencies_resolved
 
+        manifest_cache: _ManifestCache | None = self.hass.data.get(DATA_MANIFEST_CACHE)
+        if manifest_cache is not None and (
+            hint := manifest_cache.dependencies.get(self.domain)
+        ):
+            # Load the dependencies we resolved last time in a single batch,
+            # the walk below still validates them against the manifests.
+            await async_get_integrations(self.hass, hint)
+
         try:
             dependencies = await _async_component_dependencies(
                 self.hass, self.domain, self, set(), set()
@@ -776,6 +965,9 @@ class Integration:
             dependencies.discard(self.domain)
             self._all_dependencies = dependencies
             self._all_dependencies_resolved = True
+            if manifest_cache is not None:
+                manifest_cache.async_set_dependencies(self.domain, dependencies)
+                manifest_cache.async_schedule_save()
         except IntegrationNotFound as err:
             _LOGGER.error(
                 (
@@ -855,13 +1047,18 @@ class Integration:
 
 
 def _resolve_integrations_from_root(
-    hass: HomeAssistant, root_module: ModuleType, domains: list[str]
+    hass: HomeAssistant,
+    root_module: ModuleType,
+    domains: list[str],
+    cache_updates: _ManifestCacheUpdates | None = None,
 ) -> dict[str, Integration]:
     """Resolve multiple integrations from root."""
     integrations: dict[str, Integration] = {}
     for domain in domains:
         try:
-            integration = Integration.resolve_from_root(hass, root_module, domain)
+            integration = Integration.resolve_from_root(
+                hass, root_module, domain, cache_updates
+            )
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Error loading integration: %s", domain)
         else:
@@ -936,9 +1133,17 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
+        manifest_cache = await _async_get_manifest_cache(hass)
+        cache_updates = _ManifestCacheUpdates()
         integrations = await hass.async_add_executor_job(
-            _resolve_integrations_from_root, hass, components, list(needed)
+            _resolve_integrations_from_root,
+            hass,
+            components,
+            list(needed),
+            cache_updates,
         )
+        manifest_cache.async_merge(cache_updates)
+        manifest_cache.async_schedule_save()
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
@@ -6,19 +6,28 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import json
 import logging
+import os
+import random
+import statistics
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 from typing import TypeVar
 
-from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant import config_entries, core
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, EVENT_STATE_CHANGED
+from homeassistant.helpers import entity, recorder as recorder_helper
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -27,6 +36,8 @@ _CallableT = TypeVar("_CallableT", bound=Callable)
 
 BENCHMARKS: dict[str, Callable] = {}
 
+DATA_BENCHMARK_ARGS = "benchmark_args"
+
 
 def run(args):
     """Handle benchmark commandline script."""
@@ -36,6 +47,40 @@ def run(args):
     parser = argparse.ArgumentParser(description="Run a Home Assistant benchmark.")
     parser.add_argument("name", choices=BENCHMARKS)
     parser.add_argument("--script", choices=["benchmark"])
+    parser.add_argument(
+        "--db-url",
+        help="Database used by the recorder benchmarks (default: temporary SQLite)",
+    )
+    parser.add_argument(
+        "--entities",
+        type=int,
+        default=100,
+        help="Number of entities used by the recorder benchmarks",
+    )
+    parser.add_argument(
+        "--events",
+        type=int,
+        default=10**5,
+        help="Number of state changes used by the recorder benchmarks",
+    )
+    parser.add_argument(
+        "--attribute-churn",
+        type=float,
+        default=0.1,
+        help="Fraction of state changes that also change the attributes",
+    )
+    parser.add_argument(
+        "--rate",
+        type=int,
+        default=0,
+        help="State changes per second offered to the recorder (default: unlimited)",
+    )
+    parser.add_argument(
+        "--viewers",
+        type=int,
+        default=100,
+        help="Number of concurrent viewers used by the stream benchmarks",
+    )
 
     args = parser.parse_args()
 
@@ -44,12 +89,13 @@ def run(args):
 
     with suppress(KeyboardInterrupt):
         while True:
-            asyncio.run(run_benchmark(bench))
+            asyncio.run(run_benchmark(bench, args))
 
 
-async def run_benchmark(bench):
+async def run_benchmark(bench, args=None):
     """Run a benchmark."""
     hass = core.HomeAssistant()
+    hass.data[DATA_BENCHMARK_ARGS] = args
     runtime = await bench(hass)
     print(f"Benchmark {bench.__name__} done in {runtime}s")
     await hass.async_stop()
@@ -314,6 +360,349 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def entity_state_writes(hass):
+    """Write entity states and print the writes per second per entity type."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.binary_sensor import BinarySensorEntity
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor import SensorEntity
+
+    args = hass.data[DATA_BENCHMARK_ARGS]
+    entity_count = args.entities if args else 100
+    writes = args.events if args else 10**5
+
+    class DynamicIconSensor(SensorEntity):
+        """Sensor with an icon depending on its state."""
+
+        @property
+        def icon(self) -> str:
+            """Return the icon."""
+            return "mdi:flash" if self.native_value else "mdi:flash-off"
+
+    entity_types: dict[str, type[entity.Entity]] = {
+        "entity": entity.Entity,
+        "sensor": SensorEntity,
+        "binary_sensor": BinarySensorEntity,
+        "dynamic_icon_sensor": DynamicIconSensor,
+    }
+
+    start = timer()
+    for domain, entity_type in entity_types.items():
+        entities = []
+        for idx in range(entity_count):
+            ent = entity_type()
+            ent.hass = hass
+            ent.entity_id = f"{domain.split('_')[-1]}.power_{idx}"
+            ent._attr_name = f"Power {idx}"
+            ent._attr_icon = "mdi:flash"
+            ent._attr_attribution = "Benchmark"
+            ent._attr_extra_state_attributes = {"index": idx}
+            entities.append(ent)
+
+        type_start = timer()
+        for write in range(writes):
+            ent = entities[write % entity_count]
+            ent._attr_state = ent._attr_native_value = write
+            ent._attr_is_on = bool(write % 2)
+            ent._async_write_ha_state()
+        type_time = timer() - type_start
+        print(
+            f"{entity_type.__name__}: {writes / type_time:.0f} writes per second"
+            f" ({writes / type_time / entity_count:.0f} per entity)"
+        )
+
+    return timer() - start
+
+
+@benchmark
+async def schedule_timers(hass):
+    """Schedule, cancel and run 100k outstanding timers.
+
+    Timers are scheduled directly on the event loop, on the timer wheel and
+    with the event helpers, which use the timer wheel.
+    """
+    timers = 10**5
+    count = 0
+    loop = hass.loop
+    delays = [random.uniform(1, 2) for _ in range(timers)]
+
+    @core.callback
+    def listener(*_):
+        """Handle timer."""
+        nonlocal count
+        count += 1
+
+    def loop_call_later(delay):
+        """Schedule a timer on the event loop."""
+        return loop.call_at(loop.time() + delay, listener).cancel
+
+    def wheel_call_later(delay):
+        """Schedule a timer on the timer wheel."""
+        return hass.timer_wheel.call_at(loop.time() + delay, listener).cancel
+
+    def helper_call_later(delay):
+        """Schedule a timer with the event helpers."""
+        return async_call_later(hass, delay, listener)
+
+    start = timer()
+    for name, call_later in (
+        ("loop.call_at", loop_call_later),
+        ("timer_wheel.call_at", wheel_call_later),
+        ("async_call_later", helper_call_later),
+    ):
+        count = 0
+        schedule_start = timer()
+        cancels = [call_later(delay) for delay in delays]
+        schedule_time = timer() - schedule_start
+        heap_size = len(loop._scheduled)  # pylint: disable=protected-access
+        cancel_start = timer()
+        for cancel in cancels[::2]:
+            cancel()
+        cancel_time = timer() - cancel_start
+        while count < timers // 2:
+            await asyncio.sleep(0.1)
+        print(
+            f"{name}: scheduled {timers / schedule_time:.0f}/s,"
+            f" cancelled {timers / 2 / cancel_time:.0f}/s,"
+            f" {heap_size} loop timers"
+        )
+
+    return timer() - start
+
+
+async def _async_setup_recorder(hass, config_dir, db_url):
+    """Set up the recorder and start Home Assistant."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import recorder
+
+    hass.config.config_dir = config_dir
+    hass.config.skip_pip = True
+    entity.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    recorder_helper.async_initialize_recorder(hass)
+    config = {recorder.CONF_COMMIT_INTERVAL: 1}
+    if db_url:
+        config[recorder.CONF_DB_URL] = db_url
+    assert await async_setup_component(hass, recorder.DOMAIN, {recorder.DOMAIN: config})
+    await hass.async_start()
+    instance = recorder.get_instance(hass)
+    await instance.async_db_ready
+    await instance.async_block_till_done()
+    return instance
+
+
+def _database_size(instance):
+    """Return the size of the recorder database in bytes."""
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import text
+
+    engine = instance.engine
+    if engine.dialect.name == "sqlite":
+        database = engine.url.database
+        return sum(
+            os.path.getsize(path)
+            for path in (database, f"{database}-wal")
+            if os.path.exists(path)
+        )
+    if engine.dialect.name == "postgresql":
+        query = "SELECT pg_database_size(current_database())"
+    elif engine.dialect.name == "mysql":
+        query = (
+            "SELECT SUM(data_length + index_length) FROM information_schema.tables"
+            " WHERE table_schema = DATABASE()"
+        )
+    else:
+        return None
+    with engine.connect() as connection:
+        return int(connection.execute(text(query)).scalar() or 0)
+
+
+def _format_size(size):
+    """Format a size in bytes."""
+    return "unknown" if size is None else f"{size / 1024**2:.1f} MiB"
+
+
+async def _async_generate_state_changes(hass, args):
+    """Drive synthetic entities through the state machine."""
+    rnd = random.Random(0)
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(args.entities)]
+    attributes = {
+        entity_id: {"friendly_name": entity_id, "unit_of_measurement": "W"}
+        for entity_id in entity_ids
+    }
+    batch_start = timer()
+    for idx in range(args.events):
+        entity_id = entity_ids[idx % args.entities]
+        if rnd.random() < args.attribute_churn:
+            attributes[entity_id] = {
+                **attributes[entity_id],
+                "last_reading": rnd.random(),
+            }
+        hass.states.async_set(entity_id, str(idx), attributes[entity_id])
+        if (idx + 1) % args.entities:
+            continue
+        # Yield to the event loop once per round of entities so the
+        # recorder keeps receiving events while they are generated
+        delay = 0.0
+        if args.rate:
+            delay = batch_start + args.entities / args.rate - timer()
+        await asyncio.sleep(max(delay, 0))
+        batch_start = timer()
+
+
+@benchmark
+async def recorder_state_changes(hass):
+    """Record state changes and report the sustained throughput of the recorder.
+
+    Use --db-url to run against another database such as a local PostgreSQL.
+    """
+    args = hass.data[DATA_BENCHMARK_ARGS]
+    # The directory is removed once the recorder closed the database
+    config_dir = TemporaryDirectory()
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_CLOSE, lambda _: config_dir.cleanup()
+    )
+    instance = await _async_setup_recorder(hass, config_dir.name, args.db_url)
+    size_before = await instance.async_add_executor_job(_database_size, instance)
+    backlogs = []
+    flush_times = []
+
+    async def _async_sample_backlog():
+        while True:
+            backlogs.append(instance.backlog)
+            await asyncio.sleep(0.1)
+
+    async def _async_sample_flush_time():
+        while True:
+            flush_start = timer()
+            await instance.async_block_till_done()
+            flush_times.append(timer() - flush_start)
+            await asyncio.sleep(0.1)
+
+    samplers = [
+        asyncio.create_task(_async_sample_backlog()),
+        asyncio.create_task(_async_sample_flush_time()),
+    ]
+    start = timer()
+    await _async_generate_state_changes(hass, args)
+    await hass.async_block_till_done()
+    await instance.async_block_till_done()
+    runtime = timer() - start
+    for sampler in samplers:
+        sampler.cancel()
+
+    size_after = await instance.async_add_executor_job(_database_size, instance)
+    flush_times.sort()
+    print(f"Recorded {args.events / runtime:.0f} state changes per second")
+    if flush_times:
+        print(
+            f"Time to write the queued states over {len(flush_times)} samples:"
+            f" p50 {statistics.median(flush_times) * 1000:.1f}ms"
+            f" p95 {flush_times[int(len(flush_times) * 0.95)] * 1000:.1f}ms"
+            f" max {flush_times[-1] * 1000:.1f}ms"
+        )
+    print(
+        f"Peak queue backlog: {max(backlogs, default=0)}"
+        f" (limit {instance.max_backlog})"
+    )
+    print(f"Database size: {_format_size(size_before)} -> {_format_size(size_after)}")
+    return runtime
+
+
+@benchmark
+async def stream_hls_viewers(hass):
+    """Serve a low latency HLS stream to concurrent viewers.
+
+    Each viewer fetches the playlist and the new part whenever a part is
+    added, and the whole segment once it is complete.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.camera import DynamicStreamSettings
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.stream.core import (
+        IdleTimer,
+        Part,
+        Segment,
+        StreamSettings,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.stream.hls import HlsPlaylistView, HlsStreamOutput
+
+    args = hass.data[DATA_BENCHMARK_ARGS]
+    segments = 200
+    parts_per_segment = 4
+    part_duration = 0.5
+    part_data = os.urandom(32 * 1024)
+
+    async def _async_idle():
+        """Handle the stream going idle."""
+
+    idle_timer = IdleTimer(hass, 30, _async_idle)
+    track = HlsStreamOutput(
+        hass,
+        idle_timer,
+        StreamSettings(
+            ll_hls=True,
+            min_segment_duration=parts_per_segment * part_duration,
+            part_target_duration=part_duration,
+            hls_advance_part_limit=3,
+            hls_part_timeout=2 * part_duration,
+        ),
+        DynamicStreamSettings(),
+    )
+    start_time = dt_util.utcnow()
+    requests = 0
+    renders = 0
+    served = 0
+
+    start = timer()
+    for sequence in range(segments):
+        segment = Segment(
+            sequence=sequence,
+            init=b"",
+            stream_id=0,
+            start_time=start_time
+            + timedelta(seconds=sequence * parts_per_segment * part_duration),
+            stream_outputs=[track],
+        )
+        # Let the output store the segment
+        await asyncio.sleep(0)
+        for part_num in range(parts_per_segment):
+            segment.async_add_part(
+                Part(
+                    duration=part_duration,
+                    has_keyframe=not part_num,
+                    data=part_data,
+                ),
+                parts_per_segment * part_duration
+                if part_num == parts_per_segment - 1
+                else 0,
+            )
+            renders += track.playlist is None
+            for _ in range(args.viewers):
+                served += len(HlsPlaylistView.render_cached(track))
+                served += len(segment.parts[part_num].data)
+            requests += 2 * args.viewers
+        for _ in range(args.viewers):
+            served += len(segment.get_data_view())
+        requests += args.viewers
+    runtime = timer() - start
+
+    idle_timer.clear()
+    track.cleanup()
+    print(
+        f"Served {requests / runtime:.0f} requests per second"
+        f" ({_format_size(served / runtime)}/s) to {args.viewers} viewers"
+    )
+    print(f"Rendered {renders} playlists for {requests} requests")
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -0,0 +1,176 @@
+"""Bucketed timer scheduling on a single event loop timer.
+
+Timers due in the same tick are kept in one bucket and run together, so the
+event loop only holds a single timer for all of them. Cancelling a timer
+removes it from its bucket in O(1).
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from contextvars import Context, copy_context
+import heapq
+import math
+from typing import Any
+
+TIMER_WHEEL_TICK = 0.01
+
+
+class TimerWheelHandle(asyncio.TimerHandle):
+    """Timer handle of a timer scheduled on a timer wheel."""
+
+    __slots__ = ("_wheel", "_key")
+
+    def __init__(
+        self,
+        wheel: TimerWheel,
+        key: int,
+        when: float,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+        loop: asyncio.AbstractEventLoop,
+        context: Context | None = None,
+    ) -> None:
+        """Initialize the handle.
+
+        Outside of debug mode the initialization of asyncio.TimerHandle is
+        inlined, as a handle is created for every timer of the helpers.
+        """
+        if loop.get_debug():
+            super().__init__(when, callback, args, loop, context)
+        else:
+            self._context = context if context is not None else copy_context()
+            self._loop = loop
+            self._callback = callback
+            self._args = args
+            self._cancelled = False
+            self._repr = None
+            self._source_traceback = None
+            self._when = when
+            self._scheduled = False
+        self._wheel = wheel
+        self._key = key
+
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        if not self._cancelled:
+            self._wheel._remove(self)  # pylint: disable=protected-access
+        # The handle is not on the loop, so the loop does not need to know
+        asyncio.Handle.cancel(self)
+
+
+class TimerWheel:
+    """Schedule timers in buckets of a fixed tick."""
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, tick: float = TIMER_WHEEL_TICK
+    ) -> None:
+        """Initialize the timer wheel."""
+        self._loop = loop
+        self._tick = tick
+        self._buckets: dict[int, dict[int, TimerWheelHandle]] = {}
+        # Keys of the buckets in a heap, keys of removed buckets are
+        # dropped when they reach the top
+        self._keys: list[int] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_key: int | None = None
+
+    def __len__(self) -> int:
+        """Return the number of scheduled timers."""
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def call_at(
+        self,
+        when: float,
+        callback: Callable[..., Any],
+        *args: Any,
+        context: Context | None = None,
+    ) -> TimerWheelHandle:
+        """Run a callback at loop time when, or up to a tick later."""
+        key = math.ceil(when / self._tick)
+        handle = TimerWheelHandle(self, key, when, callback, args, self._loop, context)
+        if (bucket := self._buckets.get(key)) is None:
+            bucket = self._buckets[key] = {}
+            heapq.heappush(self._keys, key)
+            if self._timer_key is None or key < self._timer_key:
+                self._schedule(key)
+        bucket[id(handle)] = handle
+        return handle
+
+    def handles(self) -> list[TimerWheelHandle]:
+        """Return the scheduled timer handles."""
+        return [
+            handle for bucket in self._buckets.values() for handle in bucket.values()
+        ]
+
+    def run_due(self, now: float) -> None:
+        """Run the timers due at loop time now."""
+        ready: list[TimerWheelHandle] = []
+        tick = self._tick
+        keys = self._keys
+        while keys and (keys[0] - 1) * tick < now:
+            key = keys[0]
+            if (bucket := self._buckets.get(key)) is None:
+                heapq.heappop(keys)
+                continue
+            if key * tick <= now:
+                heapq.heappop(keys)
+                del self._buckets[key]
+                ready.extend(bucket.values())
+                continue
+            # The bucket is only partly due
+            for handle in [h for h in bucket.values() if h.when() <= now]:
+                del bucket[id(handle)]
+                ready.append(handle)
+            if not bucket:
+                heapq.heappop(keys)
+                del self._buckets[key]
+            break
+
+        ready.sort(key=asyncio.TimerHandle.when)
+        for handle in ready:
+            if not handle.cancelled():
+                handle._run()  # pylint: disable=protected-access
+
+        self._reschedule()
+
+    def _run(self) -> None:
+        """Run the due timers when the loop timer fires."""
+        self._timer = None
+        self._timer_key = None
+        self.run_due(self._loop.time())
+
+    def _schedule(self, key: int) -> None:
+        """Schedule the loop timer for the bucket with key."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer_key = key
+        self._timer = self._loop.call_at(key * self._tick, self._run)
+
+    def _reschedule(self) -> None:
+        """Schedule the loop timer for the first bucket."""
+        keys = self._keys
+        while keys and keys[0] not in self._buckets:
+            heapq.heappop(keys)
+        if not keys:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+                self._timer_key = None
+        elif keys[0] != self._timer_key:
+            self._schedule(keys[0])
+
+    def _remove(self, handle: TimerWheelHandle) -> None:
+        """Remove a cancelled timer from its bucket."""
+        key = handle._key  # pylint: disable=protected-access
+        if (bucket := self._buckets.get(key)) is None:
+            return
+        bucket.pop(id(handle), None)
+        if not bucket:
+            del self._buckets[key]
+            if not self._buckets:
+                self._reschedule()
+            elif len(self._keys) > 2 * len(self._buckets) + 100:
+                # Drop the keys of removed buckets
+                self._keys = list(self._buckets)
+                heapq.heapify(self._keys)
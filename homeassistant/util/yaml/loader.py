@@ -2,11 +2,16 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import copy
+from dataclasses import dataclass, field
 import fnmatch
 from io import StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
+import threading
 from typing import Any, TextIO, TypeVar, overload
 
 import yaml
@@ -33,6 +38,131 @@ _DictT = TypeVar("_DictT", bound=dict)
 
 _LOGGER = logging.getLogger(__name__)
 
+_FileSnapshot = tuple[int, int] | None
+
+
+def _snapshot(path: str) -> _FileSnapshot:
+    """Return the modification time and size of a path or None if missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@dataclass(slots=True)
+class _Dependencies:
+    """Files and directories a parsed YAML tree was built from."""
+
+    snapshots: dict[str, _FileSnapshot] = field(default_factory=dict)
+    cacheable: bool = True
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """A parsed YAML tree and the dependencies it was built from."""
+
+    value: JSON_TYPE
+    dependencies: dict[str, _FileSnapshot]
+
+    def is_valid(self) -> bool:
+        """Return if none of the dependencies changed."""
+        return all(
+            _snapshot(path) == snapshot for path, snapshot in self.dependencies.items()
+        )
+
+
+class YamlCache:
+    """Cache of parsed YAML trees.
+
+    Entries are keyed by file path and validated against the modification
+    time of every file, secrets.yaml and include directory they were built
+    from, so a reload only re-parses changed files and the files that
+    include them. Files using !env_var are never cached.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._entries: dict[tuple[str, Path | None], _CacheEntry] = {}
+        self._local = threading.local()
+
+    @contextmanager
+    def activate(self) -> Iterator[None]:
+        """Use the cache for all load_yaml calls in the current context.
+
+        Entries of files that were not loaded are removed afterwards, so
+        deleted files and files that are no longer included are dropped.
+        """
+        token = _ACTIVE_CACHE.set(self)
+        visited: set[tuple[str, Path | None]] = set()
+        self._local.visited = visited
+        try:
+            yield
+        finally:
+            _ACTIVE_CACHE.reset(token)
+            self._local.visited = None
+        for key in self._entries.keys() - visited:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._entries.clear()
+
+    @property
+    def _stack(self) -> list[_Dependencies]:
+        """Return the dependencies of the files being loaded by this thread."""
+        if (stack := getattr(self._local, "stack", None)) is None:
+            stack = self._local.stack = []
+        return stack
+
+    def track_dependency(self, path: str) -> None:
+        """Record that the file being loaded depends on a path."""
+        if stack := self._stack:
+            stack[-1].snapshots.setdefault(path, _snapshot(path))
+
+    def mark_uncacheable(self) -> None:
+        """Record that the file being loaded can not be cached."""
+        if stack := self._stack:
+            stack[-1].cacheable = False
+
+    def load(self, fname: str, secrets: Secrets | None) -> JSON_TYPE:
+        """Load a YAML file, re-using the parsed tree if nothing changed."""
+        stack = self._stack
+        config_dir = secrets.config_dir if secrets else None
+        key = (fname, config_dir)
+        if (visited := getattr(self._local, "visited", None)) is not None:
+            visited.add(key)
+
+        if (entry := self._entries.get(key)) is not None and entry.is_valid():
+            if visited is not None:
+                # The included files are not loaded again but still in use
+                visited.update((path, config_dir) for path in entry.dependencies)
+            if stack:
+                stack[-1].snapshots.update(entry.dependencies)
+                # Constructors add file references to the returned object
+                return copy.copy(entry.value)
+            return copy.deepcopy(entry.value)
+
+        dependencies = _Dependencies({fname: _snapshot(fname)})
+        stack.append(dependencies)
+        try:
+            value = _load_yaml(fname, secrets)
+        finally:
+            stack.pop()
+            if stack:
+                stack[-1].snapshots.update(dependencies.snapshots)
+                stack[-1].cacheable &= dependencies.cacheable
+
+        if not dependencies.cacheable or dependencies.snapshots[fname] is None:
+            return value
+        self._entries[key] = _CacheEntry(value, dependencies.snapshots)
+        if stack:
+            return copy.copy(value)
+        return copy.deepcopy(value)
+
+
+_ACTIVE_CACHE: ContextVar[YamlCache | None] = ContextVar("_ACTIVE_CACHE", default=None)
+
 
 class Secrets:
     """Store secrets while loading YAML."""
@@ -56,6 +186,8 @@ class Secrets:
                 # We went above the config dir
                 break
 
+            if (cache := _ACTIVE_CACHE.get()) is not None:
+                cache.track_dependency(str(secret_dir / SECRET_YAML))
             secrets = self._load_secret_yaml(secret_dir)
 
             if secret in secrets:
@@ -158,6 +290,13 @@ LoaderType = SafeLineLoader | SafeLoader
 
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
     """Load a YAML file."""
+    if (cache := _ACTIVE_CACHE.get()) is not None:
+        return cache.load(fname, secrets)
+    return _load_yaml(fname, secrets)
+
+
+def _load_yaml(fname: str, secrets: Secrets | None) -> JSON_TYPE:
+    """Read and parse a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
@@ -267,7 +406,11 @@ def _is_file_valid(name: str) -> bool:
 
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
+    if (cache := _ACTIVE_CACHE.get()) is not None:
+        cache.track_dependency(directory)
     for root, dirs, files in os.walk(directory, topdown=True):
+        if cache is not None:
+            cache.track_dependency(root)
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
@@ -373,6 +516,8 @@ def _construct_seq(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
 
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
+    if (cache := _ACTIVE_CACHE.get()) is not None:
+        cache.mark_uncacheable()
     args = node.value.split()
 
     # Check for a default value
@@ -11,6 +11,7 @@ from functools import lru_cache
 from io import StringIO
 import json
 import logging
+import math
 import os
 import pathlib
 import threading
@@ -65,7 +66,7 @@ from homeassistant.helpers import (
     storage,
 )
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_dumps
 from homeassistant.helpers.typing import ConfigType, StateType
 from homeassistant.setup import setup_component
 from homeassistant.util.async_ import run_callback_threadsafe
@@ -408,6 +409,18 @@ def _async_fire_time_changed(
     hass: HomeAssistant, utc_datetime: datetime | None, fire_all: bool
 ) -> None:
     timestamp = dt_util.utc_to_timestamp(utc_datetime)
+    with patch(
+        "homeassistant.helpers.event.time_tracker_utcnow",
+        return_value=utc_datetime,
+    ), patch(
+        "homeassistant.helpers.event.time_tracker_timestamp",
+        return_value=timestamp,
+    ):
+        mock_seconds_into_future = timestamp - time.time()
+        hass.timer_wheel.run_due(
+            math.inf if fire_all else hass.loop.time() + mock_seconds_into_future
+        )
+
     for task in list(hass.loop._scheduled):
         if not isinstance(task, asyncio.TimerHandle):
             continue
@@ -1240,7 +1253,14 @@ def mock_storage(
         # To ensure that the data can be serialized
         _LOGGER.debug("Writing data to %s: %s", store.key, data_to_write)
         raise_contains_mocks(data_to_write)
-        data[store.key] = json.loads(json.dumps(data_to_write, cls=store._encoder))
+        try:
+            dumped = json.dumps(data_to_write, cls=store._encoder)
+        except TypeError:
+            if store._encoder and store._encoder is not JSONEncoder:
+                raise
+            # Like save_json, dump with orjson which also embeds JSON fragments
+            dumped = json_dumps(data_to_write)
+        data[store.key] = json.loads(dumped)
 
     async def mock_remove(store: storage.Store) -> None:
         """Remove data."""
@@ -0,0 +1,40 @@
+"""Tests for automation system health."""
+from homeassistant.components import automation
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_system_health_info(hass: HomeAssistant) -> None:
+    """Test system health info endpoint."""
+    assert await async_setup_component(hass, "system_health", {})
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "state",
+                    "entity_id": "test.entity",
+                    "to": "world",
+                },
+                "action": {"event": "test_event"},
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("test.entity", "hello")
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, automation.DOMAIN)
+    assert info["trigger_attach_time"] >= 0
+    assert info["state_trigger_events"] == 2
+    assert info["state_triggers_per_event"] == 0.5
+    assert info["state_trigger_dispatch_time"] >= 0
+    assert info["queued_runs"] == 0
+    assert info["max_queue_depth"] == 0
+    assert info["queue_wait_time"] == 0
+    assert info["dropped_runs"] == 0
@@ -155,6 +155,12 @@ async def test_diagnostics(
                         "connection_slots": 2,
                     },
                 },
+                "advertisement_counters": {
+                    "received": 0,
+                    "dropped": 0,
+                    "matched": 0,
+                    "dispatched": 0,
+                },
                 "advertisement_tracker": {
                     "intervals": {},
                     "sources": {},
@@ -326,6 +332,12 @@ async def test_diagnostics_macos(
                         "vendor_id": "Unknown",
                     }
                 },
+                "advertisement_counters": {
+                    "received": 1,
+                    "dropped": 0,
+                    "matched": 0,
+                    "dispatched": 0,
+                },
                 "advertisement_tracker": {
                     "intervals": {},
                     "sources": {"44:44:33:11:23:45": "local"},
@@ -518,6 +530,12 @@ async def test_diagnostics_remote_adapter(
                         "vendor_id": "cc01",
                     }
                 },
+                "advertisement_counters": {
+                    "received": 2,
+                    "dropped": 1,
+                    "matched": 0,
+                    "dispatched": 0,
+                },
                 "advertisement_tracker": {
                     "intervals": {},
                     "sources": {"44:44:33:11:23:45": "esp32"},
@@ -24,7 +24,13 @@ from homeassistant.components.bluetooth import (
     async_track_unavailable,
     storage,
 )
-from homeassistant.components.bluetooth.const import UNAVAILABLE_TRACK_SECONDS
+from homeassistant.components.bluetooth.advertisement_tracker import (
+    ADVERTISING_TIMES_NEEDED,
+)
+from homeassistant.components.bluetooth.const import (
+    ADVERTISEMENT_DEDUP_SECONDS,
+    UNAVAILABLE_TRACK_SECONDS,
+)
 from homeassistant.components.bluetooth.manager import (
     FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS,
 )
@@ -1053,3 +1059,98 @@ async def test_debug_logging(
         "hci0",
     )
     assert "wohand_good_signal_hci0" not in caplog.text
+
+
+async def test_repeated_advertisements_are_dropped(
+    hass: HomeAssistant,
+    enable_bluetooth: None,
+    register_hci0_scanner: None,
+) -> None:
+    """Test repeated advertisements are dropped once the interval is known."""
+    address = "44:44:33:11:23:12"
+    manager = _get_manager()
+    counters = manager._advertisement_counters
+    device = generate_ble_device(address, "wohand", rssi=-60)
+    adv = generate_advertisement_data(local_name="wohand", rssi=-60)
+    start_time_monotonic = time.monotonic()
+
+    for i in range(ADVERTISING_TIMES_NEEDED):
+        inject_advertisement_with_time_and_source(
+            hass, device, adv, start_time_monotonic + i * 0.1, "hci0"
+        )
+    last_time = start_time_monotonic + (ADVERTISING_TIMES_NEEDED - 1) * 0.1
+    assert manager._all_history[address].time == last_time
+    received = counters["received"]
+    dropped = counters["dropped"]
+
+    # The same advertisement is dropped before the history is updated
+    inject_advertisement_with_time_and_source(
+        hass, device, adv, last_time + 0.1, "hci0"
+    )
+    assert manager._all_history[address].time == last_time
+    assert counters["received"] == received + 1
+    assert counters["dropped"] == dropped + 1
+
+    # A different RSSI bucket updates the history
+    adv_weaker = generate_advertisement_data(local_name="wohand", rssi=-80)
+    inject_advertisement_with_time_and_source(
+        hass, device, adv_weaker, last_time + 0.2, "hci0"
+    )
+    assert manager._all_history[address].time == last_time + 0.2
+
+    # The history is refreshed once the dedup window has passed
+    inject_advertisement_with_time_and_source(
+        hass,
+        device,
+        adv_weaker,
+        last_time + 0.2 + ADVERTISEMENT_DEDUP_SECONDS,
+        "hci0",
+    )
+    assert (
+        manager._all_history[address].time
+        == last_time + 0.2 + ADVERTISEMENT_DEDUP_SECONDS
+    )
+
+
+async def test_cached_matches_updated_when_callbacks_change(
+    hass: HomeAssistant,
+    enable_bluetooth: None,
+    register_hci0_scanner: None,
+) -> None:
+    """Test cached matches are not used after a callback is registered."""
+    manager = _get_manager()
+    counters = manager._advertisement_counters
+    callbacks = []
+
+    def _fake_subscriber(
+        service_info: BluetoothServiceInfo, change: BluetoothChange
+    ) -> None:
+        """Fake subscriber for the BleakScanner."""
+        callbacks.append((service_info, change))
+
+    adv = generate_advertisement_data(
+        local_name="wohand", manufacturer_data={1: b"\x01"}
+    )
+    inject_advertisement_with_source(
+        hass, generate_ble_device("44:44:33:11:23:12", "wohand"), adv, "hci0"
+    )
+    assert counters["matched"] == 0
+
+    cancel = bluetooth.async_register_callback(
+        hass,
+        _fake_subscriber,
+        {"manufacturer_id": 1},
+        BluetoothScanningMode.ACTIVE,
+    )
+    inject_advertisement_with_source(
+        hass, generate_ble_device("44:44:33:11:23:13", "wohand"), adv, "hci0"
+    )
+    cancel()
+
+    # The first device is replayed from the history when registering
+    assert [service_info.address for service_info, _ in callbacks] == [
+        "44:44:33:11:23:12",
+        "44:44:33:11:23:13",
+    ]
+    assert counters["matched"] == 1
+    assert counters["dispatched"] == 1
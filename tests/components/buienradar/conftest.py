@@ -12,3 +12,10 @@ def mock_setup_entry() -> Generator[AsyncMock, None, None]:
         "homeassistant.components.buienradar.async_setup_entry", return_value=True
     ) as mock_setup_entry:
         yield mock_setup_entry
+
+
+@pytest.fixture(autouse=True)
+def disable_camera_frame_cache() -> Generator[None, None, None]:
+    """Fetch a new image for every request as the tests count the fetches."""
+    with patch("homeassistant.components.camera.FRAME_CACHE_TTL", 0):
+        yield
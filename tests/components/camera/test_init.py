@@ -222,6 +222,88 @@ async def test_get_image_fails(hass: HomeAssistant, image_mock_url) -> None:
         await camera.async_get_image(hass, "camera.demo_camera")
 
 
+async def test_get_image_shared(hass: HomeAssistant, image_mock_url) -> None:
+    """Test concurrent and recent requests share the image fetched from the camera."""
+    fetched = asyncio.Event()
+
+    async def _async_camera_image(*args, **kwargs) -> bytes:
+        await fetched.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_async_camera_image,
+    ) as mock_camera_image:
+        requests = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        fetched.set()
+        images = await asyncio.gather(*requests)
+        assert all(image.content == b"Test" for image in images)
+        assert mock_camera_image.call_count == 1
+
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera_image.call_count == 1
+
+        # Each size is fetched separately
+        await camera.async_get_image(hass, "camera.demo_camera", width=4, height=3)
+        await camera.async_get_image(hass, "camera.demo_camera", width=4, height=3)
+        assert mock_camera_image.call_count == 2
+
+        with patch("homeassistant.components.camera.FRAME_CACHE_TTL", 0):
+            await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera_image.call_count == 3
+
+
+async def test_get_image_frame_cache_bounded(
+    hass: HomeAssistant, image_mock_url
+) -> None:
+    """Test expired frames are dropped and only a few sizes are cached."""
+    entity = hass.data[camera.DOMAIN].get_entity("camera.demo_camera")
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ):
+        for width in range(1, camera.FRAME_CACHE_MAX_SIZES + 3):
+            await camera.async_get_image(
+                hass, "camera.demo_camera", width=width, height=width
+            )
+        assert list(entity._frame_cache) == [
+            (width, width) for width in range(3, camera.FRAME_CACHE_MAX_SIZES + 3)
+        ]
+
+        with patch("homeassistant.components.camera.FRAME_CACHE_TTL", 0):
+            await camera.async_get_image(hass, "camera.demo_camera")
+        assert list(entity._frame_cache) == [(None, None)]
+
+
+async def test_get_image_shared_fetch_cancelled(
+    hass: HomeAssistant, image_mock_url
+) -> None:
+    """Test a request timing out does not cancel the fetch of other requests."""
+    fetched = asyncio.Event()
+
+    async def _async_camera_image(*args, **kwargs) -> bytes:
+        await fetched.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_async_camera_image,
+    ) as mock_camera_image:
+        request = hass.async_create_task(
+            camera.async_get_image(hass, "camera.demo_camera")
+        )
+        with pytest.raises(HomeAssistantError):
+            await camera.async_get_image(hass, "camera.demo_camera", timeout=0)
+        fetched.set()
+        assert (await request).content == b"Test"
+        assert mock_camera_image.call_count == 1
+
+
 async def test_snapshot_service(hass: HomeAssistant, mock_camera) -> None:
     """Test snapshot service."""
     mopen = mock_open()
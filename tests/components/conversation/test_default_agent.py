@@ -1,6 +1,7 @@
 """Test for the default agent."""
 from unittest.mock import patch
 
+from hassil.recognize import recognize_all
 import pytest
 
 from homeassistant.components import conversation
@@ -223,3 +224,47 @@ async def test_unexposed_entities_skipped(
     assert result.response.response_type == intent.IntentResponseType.QUERY_ANSWER
     assert len(result.response.matched_states) == 1
     assert result.response.matched_states[0].entity_id == exposed_light.entity_id
+
+
+async def test_recognize_cached(hass: HomeAssistant, init_components) -> None:
+    """Test recognized sentences are cached until the slot lists change."""
+    hass.states.async_set(
+        "light.kitchen", "off", attributes={ATTR_FRIENDLY_NAME: "Kitchen Light"}
+    )
+    calls = async_mock_service(hass, "light", "turn_on")
+
+    with patch(
+        "homeassistant.components.conversation.default_agent.recognize_all",
+        wraps=recognize_all,
+    ) as mock_recognize_all:
+        for text in ("turn on kitchen light", "Turn on  kitchen light"):
+            result = await conversation.async_converse(
+                hass, text, None, Context(), None
+            )
+            assert (
+                result.response.response_type == intent.IntentResponseType.ACTION_DONE
+            )
+        assert len(calls) == 2
+        assert mock_recognize_all.call_count == 1
+
+        # Entities added to the state machine are added to the slot lists
+        hass.states.async_set(
+            "light.porch", "off", attributes={ATTR_FRIENDLY_NAME: "Porch Light"}
+        )
+        result = await conversation.async_converse(
+            hass, "turn on porch light", None, Context(), None
+        )
+        assert result.response.response_type == intent.IntentResponseType.ACTION_DONE
+        assert calls[-1].data == {"entity_id": ["light.porch"]}
+        assert mock_recognize_all.call_count == 2
+
+        # Entities removed from the state machine are removed from the slot lists
+        hass.states.async_remove("light.kitchen")
+        result = await conversation.async_converse(
+            hass, "turn on kitchen light", None, Context(), None
+        )
+        assert result.response.response_type == intent.IntentResponseType.ERROR
+        assert (
+            result.response.error_code == intent.IntentResponseErrorCode.NO_INTENT_MATCH
+        )
+        assert mock_recognize_all.call_count == 3
@@ -13,6 +13,13 @@ from homeassistant.components.generic.const import DOMAIN
 from tests.common import MockConfigEntry
 
 
+@pytest.fixture(autouse=True)
+def disable_camera_frame_cache():
+    """Fetch a new image for every request as the tests count the fetches."""
+    with patch("homeassistant.components.camera.FRAME_CACHE_TTL", 0):
+        yield
+
+
 @pytest.fixture(scope="package")
 def fakeimgbytes_png():
     """Fake image in RAM for testing."""
@@ -75,11 +75,16 @@ async def test_report_state(
         # New state, so reported
         hass.states.async_set("light.double_report", "on")
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
-        # Changed, but serialize is same, so filtered out by extra check
+        # Changed, but serialize is same, so filtered out
         hass.states.async_set("light.double_report", "off")
+        await hass.async_block_till_done()
         async_fire_time_changed(
-            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW * 2)
         )
         await hass.async_block_till_done()
 
@@ -93,6 +98,7 @@ async def test_report_state(
         BASIC_CONFIG, "async_report_state_all", AsyncMock()
     ) as mock_report:
         hass.states.async_set("switch.ac", "on", {"something": "else"})
+        await hass.async_block_till_done()
         async_fire_time_changed(
             hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
         )
@@ -108,6 +114,7 @@ async def test_report_state(
         side_effect=error.SmartHomeError("mock-error", "mock-msg"),
     ):
         hass.states.async_set("light.kitchen", "off")
+        await hass.async_block_till_done()
         async_fire_time_changed(
             hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
         )
@@ -122,6 +129,7 @@ async def test_report_state(
         BASIC_CONFIG, "async_report_state_all", AsyncMock()
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
+        await hass.async_block_till_done()
         async_fire_time_changed(
             hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
         )
@@ -0,0 +1,44 @@
+"""Tests for Home Assistant system health."""
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.common import MockEntity, MockEntityPlatform, get_system_health_info
+
+
+async def test_system_health_info(hass: HomeAssistant) -> None:
+    """Test system health info endpoint."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(hass, "system_health", {})
+
+    info = await get_system_health_info(hass, "homeassistant")
+    assert info["version"].startswith("core-")
+    assert info["config_dir"] == hass.config.config_dir
+    assert info["polls"] == 0
+    assert info["poll_overruns"] == 0
+    assert info["poll_duration"] == 0
+    assert info["max_poll_duration"] == 0
+    assert "polling_platform_1" not in info
+
+    platform1 = MockEntityPlatform(hass, platform_name="platform1")
+    platform2 = MockEntityPlatform(hass, platform_name="platform2")
+    platform3 = MockEntityPlatform(hass, platform_name="platform3")
+    await platform1.async_add_entities([MockEntity(should_poll=True)])
+    await platform2.async_add_entities([MockEntity(should_poll=True)])
+    await platform3.async_add_entities([MockEntity(should_poll=True)])
+    await platform1._update_entity_states(dt_util.utcnow())
+    await platform1._update_entity_states(dt_util.utcnow())
+    await platform2._update_entity_states(dt_util.utcnow())
+    platform2.poll_metrics.overruns = 1
+    platform2.poll_metrics.record(0.5)
+
+    info = await get_system_health_info(hass, "homeassistant")
+    assert info["polls"] == 4
+    assert info["poll_overruns"] == 1
+    assert 125 <= info["poll_duration"] < 250
+    assert info["max_poll_duration"] == 500
+    assert info["polling_platform_1"].startswith("test_domain.platform2: average 2")
+    assert info["polling_platform_1"].endswith(", max 500.0 ms, 1 overruns")
+    assert info["polling_platform_2"].startswith("test_domain.platform1: average ")
+    assert info["polling_platform_2"].endswith(" ms, 0 overruns")
+    assert "polling_platform_3" not in info
@@ -1751,3 +1751,131 @@ async def test_variables_priority(hass: HomeAssistant, calls) -> None:
         await hass.async_block_till_done()
         assert len(calls) == 2
         assert calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_state_trigger_index(hass: HomeAssistant, calls) -> None:
+    """Test state changes only reach the state triggers which can match."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": ["world", "planet"],
+                    },
+                    "action": {"service": "test.automation", "data": {"id": "to"}},
+                },
+                {
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "from": "world",
+                    },
+                    "action": {"service": "test.automation", "data": {"id": "from"}},
+                },
+                {
+                    "trigger": {"platform": "state", "entity_id": "test.entity"},
+                    "action": {"service": "test.automation", "data": {"id": "all"}},
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+    index = state_trigger.async_get_state_trigger_index(hass)
+
+    hass.states.async_set("test.entity", "moon")
+    await hass.async_block_till_done()
+    assert [call.data["id"] for call in calls] == ["all"]
+    assert index.dispatched_events == 1
+    assert index.invoked_listeners == 1
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert sorted(call.data["id"] for call in calls[1:]) == ["all", "to"]
+    assert index.invoked_listeners == 3
+
+    hass.states.async_set("test.entity", "sun")
+    await hass.async_block_till_done()
+    assert sorted(call.data["id"] for call in calls[3:]) == ["all", "from"]
+    assert index.invoked_listeners == 5
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    hass.states.async_set("test.entity", "planet")
+    await hass.async_block_till_done()
+    assert len(calls) == 5
+    assert index.dispatched_events == 3
+
+
+async def test_state_trigger_index_match_all(hass: HomeAssistant, calls) -> None:
+    """Test state triggers matching any state are not indexed by state."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": "*",
+                    },
+                    "action": {"service": "test.automation", "data": {"id": "to"}},
+                },
+                {
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "from": "*",
+                    },
+                    "action": {"service": "test.automation", "data": {"id": "from"}},
+                },
+                {
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "from": "world",
+                        "to": ["*", "planet"],
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"id": "from_world"},
+                    },
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert sorted(call.data["id"] for call in calls) == ["from", "to"]
+
+    hass.states.async_set("test.entity", "moon")
+    await hass.async_block_till_done()
+    assert sorted(call.data["id"] for call in calls[2:]) == ["from", "to"]
+
+    # Attribute changes don't trigger
+    hass.states.async_set("test.entity", "moon", {"some": "attribute"})
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+    # A "*" in a list only matches the literal state
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    hass.states.async_set("test.entity", "*")
+    await hass.async_block_till_done()
+    assert sorted(call.data["id"] for call in calls[4:]) == [
+        "from",
+        "from",
+        "from_world",
+        "to",
+        "to",
+    ]
@@ -8,6 +8,7 @@ import pytest
 
 import homeassistant.components.influxdb as influxdb
 from homeassistant.components.influxdb.const import DEFAULT_BUCKET
+from homeassistant.components.influxdb.spool import InfluxSpool
 from homeassistant.const import (
     EVENT_STATE_CHANGED,
     PERCENTAGE,
@@ -1815,3 +1816,145 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "get_mock_call"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_spool(
+    hass: HomeAssistant,
+    tmp_path,
+    mock_client,
+    config_ext,
+    get_write_api,
+    get_mock_call,
+) -> None:
+    """Test events are written as line protocol through the spool."""
+    hass.config.config_dir = str(tmp_path)
+    config = {"spool_size": 1, "write_workers": 2}
+    config.update(config_ext)
+    handler_method = await _setup(hass, mock_client, config, get_write_api)
+
+    state = MagicMock(
+        state=1,
+        domain="fake",
+        entity_id="fake.entity_id",
+        object_id="entity_id",
+        attributes={},
+    )
+    event = MagicMock(data={"new_state": state}, time_fired=12345)
+    write_api = get_write_api(mock_client)
+
+    # Old events are kept instead of dropped
+    with patch(
+        f"{INFLUX_PATH}.time.monotonic",
+        side_effect=[0, influxdb.QUEUE_BACKLOG_SECONDS + 1],
+    ):
+        handler_method(event)
+        hass.data[influxdb.DOMAIN].block_till_done()
+    hass.data[influxdb.DOMAIN].spool.block_till_done()
+
+    assert write_api.call_count == 1
+    lines = "fake.entity_id,domain=fake,entity_id=entity_id value=1.0 12345"
+    if config_ext == BASE_V1_CONFIG:
+        assert write_api.call_args == call(
+            [lines], time_precision=None, protocol="line"
+        )
+    else:
+        assert write_api.call_args == call(
+            bucket=DEFAULT_BUCKET, record=f"{lines}\n".encode()
+        )
+    assert not list((tmp_path / ".storage" / "influxdb_spool").iterdir())
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "get_mock_call"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_spool_retry(
+    hass: HomeAssistant,
+    tmp_path,
+    mock_client,
+    config_ext,
+    get_write_api,
+    get_mock_call,
+) -> None:
+    """Test spooled events are kept on disk until they are written."""
+    hass.config.config_dir = str(tmp_path)
+    config = {"spool_size": 1}
+    config.update(config_ext)
+    handler_method = await _setup(hass, mock_client, config, get_write_api)
+    spool = hass.data[influxdb.DOMAIN].spool
+    spool_dir = tmp_path / ".storage" / "influxdb_spool"
+
+    state = MagicMock(
+        state=1,
+        domain="fake",
+        entity_id="fake.entity_id",
+        object_id="entity_id",
+        attributes={},
+    )
+    event = MagicMock(data={"new_state": state}, time_fired=12345)
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = [OSError("foo"), None]
+
+    with patch(f"{INFLUX_PATH}.spool.RETRY_DELAY", 0), patch.object(
+        influxdb.time, "sleep"
+    ) as mock_sleep:
+        handler_method(event)
+        hass.data[influxdb.DOMAIN].block_till_done()
+        spool.block_till_done()
+        assert not mock_sleep.called
+
+    assert write_api.call_count == 2
+    assert write_api.call_args_list[0] == write_api.call_args_list[1]
+    assert not list(spool_dir.iterdir())
+    assert spool.size == 0
+
+
+def test_spool_bounded_and_persistent(tmp_path) -> None:
+    """Test the spool drops the oldest batches and keeps the others on disk."""
+    spool = InfluxSpool(str(tmp_path), 10)
+    spool.load()
+    spool.append(b"first\n")
+    spool.append(b"second\n")
+    assert spool.size == 7
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Batches left by the previous run are loaded
+    spool = InfluxSpool(str(tmp_path), 10)
+    spool.load()
+    assert spool.size == 7
+    batches = spool.claim(2)
+    assert [batch.size for batch in batches] == [7]
+    spool.done(batches, True)
+    assert not list(tmp_path.iterdir())
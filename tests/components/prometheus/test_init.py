@@ -150,6 +150,94 @@ async def test_view_default_namespace(client, sensor_entities) -> None:
     )
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_reuses_unchanged_exposition(
+    hass: HomeAssistant, client, sensor_entities
+) -> None:
+    """Test the exposition is only generated again when a metric changed."""
+    with mock.patch(
+        "prometheus_client.exposition.generate_latest",
+        wraps=prometheus_client.exposition.generate_latest,
+    ) as mock_generate_latest:
+        await generate_latest_metrics(client)
+        body = await generate_latest_metrics(client)
+        assert mock_generate_latest.call_count == 1
+
+        state = hass.states.get("sensor.outside_temperature")
+        hass.states.async_set(state.entity_id, "16.2", state.attributes)
+        await hass.async_block_till_done()
+        body = await generate_latest_metrics(client)
+        assert mock_generate_latest.call_count == 2
+
+    assert (
+        'sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 16.2' in body
+    )
+
+
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_openmetrics(client, sensor_entities) -> None:
+    """Test the OpenMetrics exposition format is negotiated."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT,
+        headers={"Accept": "application/openmetrics-text; version=0.0.1"},
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-type"].startswith("application/openmetrics-text")
+    body = (await resp.text()).split("\n")
+    assert "# EOF" in body
+    assert (
+        'entity_available{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 1.0' in body
+    )
+
+
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_gzip(client, sensor_entities) -> None:
+    """Test the exposition is compressed when the client accepts gzip."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "# HELP python_info Python platform information" in (
+        await resp.text()
+    ).split("\n")
+
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "identity"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert "content-encoding" not in resp.headers
+
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "gzip;q=0, identity"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert "content-encoding" not in resp.headers
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "accepted"),
+    [
+        ("", False),
+        ("gzip", True),
+        ("deflate, GZIP;q=0.5", True),
+        ("gzip;q=0", False),
+        ("gzip; q=0.0, *", False),
+        ("*", True),
+        ("*;q=0", False),
+        ("x-gzip", False),
+        ("gzip;q=invalid", False),
+    ],
+)
+def test_accepts_gzip(accept_encoding: str, accepted: bool) -> None:
+    """Test parsing the Accept-Encoding header."""
+    assert prometheus._accepts_gzip(accept_encoding) is accepted
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_sensor_unit(client, sensor_entities) -> None:
     """Test prometheus metrics for sensors with a unit."""
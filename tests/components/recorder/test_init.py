@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 
 from homeassistant.components import recorder
@@ -202,6 +203,48 @@ async def test_shutdown_closes_connections(
         assert instance.get_session()
 
 
+async def test_read_database(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+) -> None:
+    """Test read only queries from the executor use the read database."""
+    if not recorder_db_url.startswith("sqlite://"):
+        # This test uses a second connection to the same SQLite database
+        return
+    db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    config = {
+        recorder.CONF_DB_URL: db_url,
+        recorder.CONF_DB_READ_URL: db_url,
+        recorder.CONF_DB_EXECUTOR_WORKERS: 8,
+    }
+    instance = await async_setup_recorder_instance(hass, config)
+    await instance.async_db_ready
+    assert instance._db_executor._max_workers == 8
+    assert instance.engine.pool.size == 9
+    assert instance.read_engine is not None
+
+    hass.states.async_set("test.read", "on")
+    await async_wait_recording_done(hass)
+
+    def _read_states() -> tuple[Engine, list[States]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return session.get_bind(), list(session.query(States))
+
+    bind, states = await instance.async_add_executor_job(_read_states)
+    assert bind is instance.read_engine
+    assert len(states) == 1
+
+    def _get_bind_from_recorder_thread() -> Engine:
+        with session_scope(hass=hass, read_only=True) as session:
+            return session.get_bind()
+
+    # The recorder thread always uses the database it writes to
+    with patch.object(instance, "thread_id", threading.get_ident()):
+        assert _get_bind_from_recorder_thread() is instance.engine
+
+
 async def test_state_gets_saved_when_set_before_start_event(
     async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
 ) -> None:
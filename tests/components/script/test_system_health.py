@@ -0,0 +1,51 @@
+"""Tests for script system health."""
+import asyncio
+
+from homeassistant.components import script
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_system_health_info(hass: HomeAssistant) -> None:
+    """Test system health info endpoint."""
+    assert await async_setup_component(hass, "system_health", {})
+    assert await async_setup_component(
+        hass,
+        script.DOMAIN,
+        {
+            script.DOMAIN: {
+                "test": {
+                    "mode": "queued",
+                    "max": 3,
+                    "sequence": [
+                        {"wait_template": "{{ is_state('switch.test', 'on') }}"}
+                    ],
+                }
+            }
+        },
+    )
+    hass.states.async_set("switch.test", "off")
+
+    for _ in range(4):
+        await hass.services.async_call(
+            script.DOMAIN, "turn_on", {"entity_id": "script.test"}
+        )
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    info = await get_system_health_info(hass, script.DOMAIN)
+    assert info == {
+        "queued_runs": 2,
+        "max_queue_depth": 2,
+        "queue_wait_time": 0,
+        "dropped_runs": 1,
+    }
+
+    hass.states.async_set("switch.test", "on")
+    await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, script.DOMAIN)
+    assert info["queued_runs"] == 0
+    assert info["queue_wait_time"] >= 0
@@ -1,6 +1,9 @@
 """Test the SSDP integration."""
 from datetime import datetime, timedelta
+from http import HTTPStatus
 from ipaddress import IPv4Address
+import time
+from typing import Any
 from unittest.mock import ANY, AsyncMock, patch
 
 from async_upnp_client.server import UpnpServer
@@ -169,6 +172,104 @@ async def test_scan_match_upnp_devicedesc_manufacturer(
     }
 
 
+@pytest.mark.usefixtures("mock_get_source_ip")
+@patch(
+    "homeassistant.components.ssdp.async_get_ssdp",
+    return_value={"mock-domain": [{"manufacturer": "Paulus"}]},
+)
+async def test_scan_stores_upnp_devicedesc_with_etag(
+    mock_get_ssdp,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    aioclient_mock: AiohttpClientMocker,
+    mock_flow_init,
+) -> None:
+    """Test descriptions with an ETag are stored."""
+    description = "<root><device><manufacturer>Paulus</manufacturer></device></root>"
+    aioclient_mock.get(
+        "http://1.1.1.1", text=description, headers={"ETag": '"mock-etag"'}
+    )
+    ssdp_listener = await init_ssdp_component(hass)
+    ssdp_listener._on_search(
+        _ssdp_headers(
+            {
+                "st": "mock-st",
+                "location": "http://1.1.1.1",
+                "usn": "uuid:mock-udn::mock-st",
+                "_source": "search",
+            }
+        )
+    )
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=ssdp.STORAGE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    assert len(mock_flow_init.mock_calls) == 1
+    stored = hass_storage[ssdp.STORAGE_KEY]["data"]["http://1.1.1.1"]
+    assert stored["etag"] == '"mock-etag"'
+    assert stored["xml"] == description
+
+
+@pytest.mark.usefixtures("mock_get_source_ip")
+@patch(
+    "homeassistant.components.ssdp.async_get_ssdp",
+    return_value={"mock-domain": [{"manufacturer": "Paulus"}]},
+)
+async def test_scan_revalidates_stored_upnp_devicedesc(
+    mock_get_ssdp,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    aioclient_mock: AiohttpClientMocker,
+    mock_flow_init,
+) -> None:
+    """Test a stored description is used when it is not modified."""
+    hass_storage[ssdp.STORAGE_KEY] = {
+        "version": ssdp.STORAGE_VERSION,
+        "key": ssdp.STORAGE_KEY,
+        "data": {
+            "http://1.1.1.1": {
+                "etag": '"mock-etag"',
+                "xml": (
+                    "<root><device><manufacturer>Paulus</manufacturer>"
+                    "</device></root>"
+                ),
+                "last_seen": time.time(),
+            },
+            "http://2.2.2.2": {
+                "etag": '"old-etag"',
+                "xml": "<root><device></device></root>",
+                "last_seen": 0,
+            },
+        },
+    }
+    aioclient_mock.get("http://1.1.1.1", status=HTTPStatus.NOT_MODIFIED)
+    ssdp_listener = await init_ssdp_component(hass)
+    ssdp_listener._on_search(
+        _ssdp_headers(
+            {
+                "st": "mock-st",
+                "location": "http://1.1.1.1",
+                "usn": "uuid:mock-udn::mock-st",
+                "_source": "search",
+            }
+        )
+    )
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=ssdp.STORAGE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 1
+    assert aioclient_mock.mock_calls[0][3]["If-None-Match"] == '"mock-etag"'
+    assert len(mock_flow_init.mock_calls) == 1
+    assert mock_flow_init.mock_calls[0][1][0] == "mock-domain"
+    # Descriptions of devices not seen for a long time are dropped
+    assert list(hass_storage[ssdp.STORAGE_KEY]["data"]) == ["http://1.1.1.1"]
+
+
 @pytest.mark.usefixtures("mock_get_source_ip")
 @patch(
     "homeassistant.components.ssdp.async_get_ssdp",
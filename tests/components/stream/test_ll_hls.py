@@ -703,3 +703,61 @@ async def test_get_part_segments(
     )
 
     stream_worker_sync.resume()
+
+
+async def test_ll_hls_segment_byte_range(
+    hass: HomeAssistant, hls_stream, stream_worker_sync
+) -> None:
+    """Test that segments and parts can be fetched in byte ranges."""
+    await async_setup_component(
+        hass,
+        "stream",
+        {
+            "stream": {
+                CONF_LL_HLS: True,
+                CONF_SEGMENT_DURATION: SEGMENT_DURATION,
+                CONF_PART_DURATION: TEST_PART_DURATION,
+            }
+        },
+    )
+
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+
+    segment = create_segment(sequence=0)
+    hls.put(segment)
+    for part in create_parts(SEQUENCE_BYTES):
+        segment.async_add_part(part, 0)
+        hls.part_put()
+    complete_segment(segment)
+    await hass.async_block_till_done()
+
+    hls_client = await hls_stream(stream)
+
+    resp = await hls_client.get("/segment/0.m4s")
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Accept-Ranges"] == "bytes"
+    assert await resp.read() == SEQUENCE_BYTES
+
+    resp = await hls_client.get("/segment/0.m4s", headers={"Range": "bytes=2-4"})
+    assert resp.status == HTTPStatus.PARTIAL_CONTENT
+    assert resp.headers["Content-Range"] == f"bytes 2-4/{len(SEQUENCE_BYTES)}"
+    assert await resp.read() == SEQUENCE_BYTES[2:5]
+
+    resp = await hls_client.get("/segment/0.m4s", headers={"Range": "bytes=-3"})
+    assert resp.status == HTTPStatus.PARTIAL_CONTENT
+    assert await resp.read() == SEQUENCE_BYTES[-3:]
+
+    resp = await hls_client.get(
+        "/segment/0.m4s", headers={"Range": f"bytes={len(SEQUENCE_BYTES)}-"}
+    )
+    assert resp.status == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+    assert resp.headers["Content-Range"] == f"bytes */{len(SEQUENCE_BYTES)}"
+
+    resp = await hls_client.get("/segment/0.1.m4s", headers={"Range": "bytes=0-"})
+    assert resp.status == HTTPStatus.PARTIAL_CONTENT
+    assert await resp.read() == segment.parts[1].data
+
+    stream_worker_sync.resume()
+    await stream.stop()
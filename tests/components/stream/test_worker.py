@@ -19,7 +19,8 @@ import logging
 import math
 from pathlib import Path
 import threading
-from unittest.mock import patch
+import time
+from unittest.mock import MagicMock, patch
 
 import av
 import numpy as np
@@ -41,6 +42,7 @@ from homeassistant.components.stream.const import (
 )
 from homeassistant.components.stream.core import Orientation, StreamSettings
 from homeassistant.components.stream.worker import (
+    KeyFrameSnapshotStage,
     StreamEndedError,
     StreamState,
     StreamWorkerError,
@@ -1037,3 +1039,63 @@ async def test_get_image_rotated(hass: HomeAssistant, h264_video, filename) -> N
                 0
             ][0]
         ).all()
+
+
+async def test_get_image_snapshot_stage(hass: HomeAssistant) -> None:
+    """Test that each keyframe is decoded once and images are kept ready."""
+    frame = MagicMock()
+    frame.to_ndarray.return_value = np.zeros((6, 8, 3), dtype=np.uint8)
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        keyframe_converter = KeyFrameConverter(
+            hass, hass.data[DOMAIN][ATTR_SETTINGS], dynamic_stream_settings()
+        )
+    keyframe_converter._codec_context = MagicMock()
+    keyframe_converter._codec_context.decode.return_value = [frame]
+    decode = keyframe_converter._codec_context.decode
+
+    # Keyframes are not decoded before an image has been requested
+    keyframe_converter.packet = MagicMock()
+    keyframe_converter.generate_images()
+    assert decode.call_count == 0
+
+    assert await keyframe_converter.async_get_image() == EMPTY_8_6_JPEG
+    assert decode.call_count == 1
+
+    # The snapshot stage decodes the next keyframe in the requested size
+    keyframe_converter.packet = MagicMock()
+    keyframe_converter.generate_images()
+    assert decode.call_count == 2
+
+    with patch.object(hass, "async_add_executor_job") as mock_executor_job:
+        assert await keyframe_converter.async_get_image() == EMPTY_8_6_JPEG
+    assert not mock_executor_job.called
+    assert decode.call_count == 2
+
+
+def test_snapshot_stage_survives_errors(caplog: pytest.LogCaptureFixture) -> None:
+    """Test the snapshot stage keeps running after an unexpected error."""
+    generated = threading.Event()
+    errors = [RuntimeError("boom")]
+
+    def _generate_images() -> None:
+        if errors:
+            raise errors.pop()
+        generated.set()
+
+    keyframe_converter = MagicMock()
+    keyframe_converter.generate_images.side_effect = _generate_images
+    stage = KeyFrameSnapshotStage(keyframe_converter)
+    stage.start()
+
+    stage.put(MagicMock())
+    while keyframe_converter.generate_images.call_count < 1:
+        time.sleep(0.01)
+    stage.put(MagicMock())
+    assert generated.wait(5)
+    stage.close()
+
+    assert not stage.is_alive()
+    assert "Unexpected error generating snapshot" in caplog.text
@@ -8,9 +8,14 @@ from unittest.mock import patch
 import pytest
 
 from homeassistant.bootstrap import async_setup_component
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace.const import (
+    DATA_TRACE,
+    DATA_TRACE_ELEMENTS,
+    DEFAULT_STORED_TRACES,
+)
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
+from homeassistant.helpers.json import json_dumps_extended
 from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.util.uuid import random_uuid_hex
 
@@ -586,6 +591,145 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize(
+    ("domain", "num_moon_traces"), [("automation", 1), ("script", 2)]
+)
+async def test_trace_memory_budget(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain,
+    num_moon_traces,
+) -> None:
+    """Test the oldest traces are removed when the trace budget is exceeded."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    moon_config = {
+        "id": "moon",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"event": "another_event"},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config, moon_config])
+
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    with patch("homeassistant.components.trace.MAX_STORED_TRACE_ELEMENTS", 3):
+        for _ in range(DEFAULT_STORED_TRACES):
+            await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+            await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    # The newest trace of each script or automation is kept
+    assert len(_find_traces(response["result"], domain, "sun")) == 1
+    moon_traces = _find_traces(response["result"], domain, "moon")
+    assert len(moon_traces) == num_moon_traces
+    # The running total of trace elements matches the stored traces
+    assert hass.data[DATA_TRACE_ELEMENTS] == sum(
+        trace.num_elements
+        for traces_for_key in hass.data[DATA_TRACE].values()
+        for trace in traces_for_key.values()
+    )
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_encoded_when_requested(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain
+) -> None:
+    """Test a finished trace is encoded once, when it is first requested."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config])
+
+    client = await hass_ws_client()
+
+    with patch(
+        "homeassistant.components.trace.models.json_dumps_extended",
+        wraps=json_dumps_extended,
+    ) as mock_json_dumps_extended:
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done()
+        assert mock_json_dumps_extended.call_count == 0
+
+        await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+        response = await client.receive_json()
+        assert response["success"]
+        run_id = _find_run_id(response["result"], domain, "sun")
+
+        for request_id in (2, 3):
+            await client.send_json(
+                {
+                    "id": request_id,
+                    "type": "trace/get",
+                    "domain": domain,
+                    "item_id": "sun",
+                    "run_id": run_id,
+                }
+            )
+            response = await client.receive_json()
+            assert response["success"]
+            assert response["result"]["state"] == "stopped"
+        assert mock_json_dumps_extended.call_count == 1
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_large_integer(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    hass_ws_client: WebSocketGenerator,
+    domain,
+) -> None:
+    """Test traces with integers exceeding 64 bits are returned and saved."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config])
+
+    client = await hass_ws_client()
+
+    if domain == "automation":
+        hass.bus.async_fire("test_event", {"big": 2**70})
+    else:
+        await hass.services.async_call("script", "sun", {"big": 2**70})
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    run_id = _find_run_id(response["result"], domain, "sun")
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "sun",
+            "run_id": run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["script_execution"] == "finished"
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    saved_trace = hass_storage["trace.saved_traces"]["data"][f"{domain}.sun"][0]
+    assert saved_trace["extended_dict"]["run_id"] == run_id
+    assert str(2**70) in json.dumps(saved_trace["extended_dict"]["trace"])
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
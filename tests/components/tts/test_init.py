@@ -1180,6 +1180,67 @@ async def test_service_get_tts_error(
         await get_media_source_url(hass, calls[0].data[ATTR_MEDIA_CONTENT_ID])
 
 
+async def test_identical_requests_share_synthesis(
+    hass: HomeAssistant, mock_provider: MockProvider
+) -> None:
+    """Test concurrent requests for the same message synthesize it once."""
+    await mock_setup(hass, mock_provider)
+    manager: tts.SpeechManager = hass.data[tts.DATA_TTS_MANAGER]
+
+    with patch.object(
+        mock_provider, "get_tts_audio", return_value=("mp3", b"voice")
+    ) as mock_get_tts_audio:
+        results = await asyncio.gather(
+            *(
+                manager.async_get_tts_audio("test", "There is someone at the door.")
+                for _ in range(3)
+            )
+        )
+        await hass.async_block_till_done()
+
+    assert mock_get_tts_audio.call_count == 1
+    assert results == [("mp3", b"voice")] * 3
+
+
+async def test_cache_eviction(
+    hass: HomeAssistant,
+    mock_tts: None,
+    mock_provider: MockProvider,
+    mock_tts_cache_dir,
+    mock_tts_get_cache_files,
+) -> None:
+    """Test the least recently used voices are evicted from memory and disk."""
+    assert await async_setup_component(
+        hass,
+        tts.DOMAIN,
+        {"tts": {"platform": "test", "cache_max_size": 1, "memory_max_size": 1}},
+    )
+    manager: tts.SpeechManager = hass.data[tts.DATA_TTS_MANAGER]
+    assert mock_tts_get_cache_files.call_count == 1
+
+    voice = b"0" * 600 * 1024
+    with patch.object(mock_provider, "get_tts_audio", return_value=("mp3", voice)):
+        for message in ("first", "second"):
+            await manager.async_get_tts_audio("test", message)
+            await hass.async_block_till_done()
+
+    second_key = manager._generate_cache_key("second", "en_US", None, "test")
+    second_file = f"{second_key}.mp3"
+    assert list(manager.mem_cache) == [second_key]
+    assert manager.file_cache == {second_key: second_file}
+    assert sorted(fil.name for fil in mock_tts_cache_dir.iterdir()) == [
+        second_file,
+        tts.CACHE_INDEX_FILE,
+    ]
+
+    # On startup the cache files are read from the index
+    mock_tts_get_cache_files.reset_mock()
+    assert await hass.async_add_executor_job(
+        tts._load_cache_files, str(mock_tts_cache_dir)
+    ) == [(second_key, second_file, len(voice))]
+    assert mock_tts_get_cache_files.call_count == 0
+
+
 async def test_load_cache_legacy_retrieve_without_mem_cache(
     hass: HomeAssistant,
     mock_provider: MockProvider,
@@ -1792,3 +1853,34 @@ async def test_ws_list_voices(
             {"voice_id": "fran_drescher", "name": "Fran Drescher"},
         ]
     }
+
+
+async def test_stream_tts_audio(
+    hass: HomeAssistant, mock_tts_entity: MockTTSEntity
+) -> None:
+    """Test audio is streamed from the entity and cached once complete."""
+    await mock_config_entry_setup(hass, mock_tts_entity)
+
+    async def stream_chunks():
+        for chunk in (b"first", b"second"):
+            yield chunk
+
+    with patch.object(
+        mock_tts_entity,
+        "async_stream_tts_audio",
+        return_value=("mp3", stream_chunks()),
+    ) as mock_stream_tts_audio:
+        extension, chunks = await tts.async_stream_tts_audio(
+            hass, mock_tts_entity.entity_id, "There is someone at the door."
+        )
+        assert extension == "mp3"
+        assert [chunk async for chunk in chunks] == [b"first", b"second"]
+        await hass.async_block_till_done()
+
+        # The complete audio is cached, so it is returned as a single chunk
+        extension, chunks = await tts.async_stream_tts_audio(
+            hass, mock_tts_entity.entity_id, "There is someone at the door."
+        )
+        assert [chunk async for chunk in chunks] == [b"firstsecond"]
+
+    assert mock_stream_tts_audio.call_count == 1
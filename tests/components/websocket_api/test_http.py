@@ -83,6 +83,44 @@ async def test_pending_msg_peak(
     assert "overload" in caplog.text
 
 
+async def test_pending_msg_peak_binary(
+    hass: HomeAssistant,
+    mock_low_peak,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test binary messages are logged by their size on overflow."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    # Fill the queue past the allowed peak
+    for _ in range(10):
+        instance._send_message(b"secret audio")
+
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=const.PENDING_MSG_PEAK_TIME + 1)
+    )
+
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.close
+    assert "Client unable to keep up with pending messages" in caplog.text
+    assert "<12 bytes of binary data>" in caplog.text
+    assert "secret audio" not in caplog.text
+
+
 async def test_pending_msg_peak_recovery(
     hass: HomeAssistant,
     mock_low_peak,
@@ -280,3 +318,27 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+async def test_send_binary_message(hass: HomeAssistant, websocket_client) -> None:
+    """Test binary messages are sent in order and never coalesced."""
+
+    @callback
+    @websocket_command({"type": "send_binary_message"})
+    def send_binary_message(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ):
+        connection.send_result(msg["id"])
+        connection.send_message(b"\x01audio")
+        connection.send_result(msg["id"])
+
+    async_register_command(hass, send_binary_message)
+
+    await websocket_client.send_json({"id": 5, "type": "send_binary_message"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+    assert msg.data == b"\x01audio"
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
@@ -61,6 +61,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import BASE_PLATFORMS, async_setup_component
 from homeassistant.util import dt as dt_util, location
 from homeassistant.util.json import json_loads
+from homeassistant.util.timer_wheel import TimerWheel
 
 from .ignore_uncaught_exceptions import IGNORE_UNCAUGHT_EXCEPTIONS
 from .syrupy import HomeAssistantSnapshotExtension
@@ -310,6 +311,30 @@ def skip_stop_scripts(
         yield
 
 
+@pytest.fixture
+def save_manifest_cache() -> bool:
+    """Add ability to save the integration manifest cache.
+
+    Tests without mocked storage would save the cache in the test config dir.
+
+    Parametrize to True to save the cache.
+    @pytest.mark.parametrize("save_manifest_cache", [True])
+    """
+    return False
+
+
+@pytest.fixture(autouse=True)
+def skip_manifest_cache_save(
+    save_manifest_cache: bool,
+) -> Generator[None, None, None]:
+    """Add ability to bypass saving the integration manifest cache."""
+    if save_manifest_cache:
+        yield
+        return
+    with patch("homeassistant.loader._ManifestCache.async_schedule_save"):
+        yield
+
+
 @pytest.fixture(autouse=True)
 def verify_cleanup(
     event_loop: asyncio.AbstractEventLoop,
@@ -341,7 +366,15 @@ def verify_cleanup(
     if tasks:
         event_loop.run_until_complete(asyncio.wait(tasks))
 
+    handles = []
     for handle in event_loop._scheduled:  # type: ignore[attr-defined]
+        # Check the timers of timer wheels rather than their loop timer
+        if isinstance(wheel := getattr(handle._callback, "__self__", None), TimerWheel):
+            handles.extend(wheel.handles())
+            handle.cancel()
+        else:
+            handles.append(handle)
+    for handle in handles:
         if not handle.cancelled():
             if expected_lingering_timers:
                 _LOGGER.warning("Lingering timer after test %r", handle)
@@ -1477,6 +1477,104 @@ async def test_state_using_input_entities(hass: HomeAssistant) -> None:
     assert test(hass)
 
 
+async def test_state_cached(hass: HomeAssistant) -> None:
+    """Test state checks are reused while their states are unchanged."""
+    config = {
+        "condition": "state",
+        "entity_id": "sensor.salut",
+        "state": ["input_select.wanted", "salut"],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+    # An identical condition shares the cached results
+    test_2 = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.salut", "goodbye")
+    hass.states.async_set("input_select.wanted", "goodbye")
+    with patch(
+        "homeassistant.helpers.condition._state_result",
+        wraps=condition._state_result,
+    ) as mock_check:
+        assert test(hass)
+        assert test_2(hass)
+        assert test(hass)
+        assert mock_check.call_count == 1
+        assert_condition_trace(
+            {
+                "": [{"result": {"result": True}}] * 3,
+                "entity_id/0": [
+                    {
+                        "result": {
+                            "result": True,
+                            "state": "goodbye",
+                            "wanted_state": "goodbye",
+                        }
+                    }
+                ]
+                * 3,
+            }
+        )
+
+        # A change of the input entity invalidates the cached result
+        hass.states.async_set("input_select.wanted", "welcome")
+        assert not test_2(hass)
+        assert not test(hass)
+        assert mock_check.call_count == 2
+
+        hass.states.async_set("sensor.salut", "salut")
+        assert test(hass)
+        assert mock_check.call_count == 3
+
+        hass.states.async_remove("input_select.wanted")
+        with pytest.raises(ConditionError, match="unavailable"):
+            test(hass)
+        with pytest.raises(ConditionError, match="unavailable"):
+            test(hass)
+        assert mock_check.call_count == 5
+
+
+async def test_state_cached_by_value_type(hass: HomeAssistant) -> None:
+    """Test state checks of equal values of different types are cached apart."""
+    tests = []
+    for value in (1, True, {"not": "hashable"}):
+        config = {
+            "condition": "state",
+            "entity_id": "sensor.temperature",
+            "attribute": "attribute1",
+            "state": value,
+        }
+        config = cv.CONDITION_SCHEMA(config)
+        config = await condition.async_validate_condition_config(hass, config)
+        tests.append(await condition.async_from_config(hass, config))
+    test_int, test_bool, test_dict = tests
+
+    hass.states.async_set("sensor.temperature", 100, {"attribute1": True})
+    with patch(
+        "homeassistant.helpers.condition._state_result",
+        wraps=condition._state_result,
+    ) as mock_check:
+        assert test_int(hass)
+        assert test_bool(hass)
+        assert test_bool(hass)
+        assert mock_check.call_count == 2
+        assert_condition_trace(
+            {
+                "": [{"result": {"result": True}}] * 3,
+                "entity_id/0": [
+                    {"result": {"result": True, "state": True, "wanted_state": 1}},
+                    {"result": {"result": True, "state": True, "wanted_state": True}},
+                    {"result": {"result": True, "state": True, "wanted_state": True}},
+                ],
+            }
+        )
+
+        # Checks with unhashable values are not cached
+        assert not test_dict(hass)
+        assert not test_dict(hass)
+        assert mock_check.call_count == 4
+
+
 async def test_numeric_state_known_non_matching(hass: HomeAssistant) -> None:
     """Test that numeric_state doesn't match on known non-matching states."""
     hass.states.async_set("sensor.temperature", "unavailable")
@@ -1682,6 +1780,58 @@ async def test_numeric_state_multiple_entities(hass: HomeAssistant) -> None:
     assert not test(hass)
 
 
+async def test_numeric_state_cached(hass: HomeAssistant) -> None:
+    """Test numeric state checks are reused while their states are unchanged."""
+    config = {
+        "condition": "numeric_state",
+        "entity_id": "sensor.temperature",
+        "below": "input_number.high",
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+    # An identical condition shares the cached results
+    test_2 = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature", 49)
+    hass.states.async_set("input_number.high", 50)
+    with patch(
+        "homeassistant.helpers.condition._async_numeric_state_result",
+        wraps=condition._async_numeric_state_result,
+    ) as mock_check:
+        assert test(hass)
+        assert test_2(hass)
+        assert test(hass)
+        assert mock_check.call_count == 1
+        assert_condition_trace(
+            {
+                "": [{"result": {"result": True}}] * 3,
+                "entity_id/0": [{"result": {"result": True, "state": 49.0}}] * 3,
+            }
+        )
+
+        hass.states.async_set("input_number.high", 40)
+        assert not test_2(hass)
+        assert not test(hass)
+        assert mock_check.call_count == 2
+
+        hass.states.async_set("sensor.temperature", 39)
+        assert test(hass)
+        assert mock_check.call_count == 3
+
+        hass.states.async_set("sensor.temperature", "unavailable")
+        assert not test(hass)
+        assert not test(hass)
+        assert mock_check.call_count == 4
+
+        hass.states.async_remove("sensor.temperature")
+        with pytest.raises(ConditionError, match="unknown entity"):
+            test(hass)
+        with pytest.raises(ConditionError, match="unknown entity"):
+            test(hass)
+        assert mock_check.call_count == 6
+
+
 async def test_numeric_state_attribute(hass: HomeAssistant) -> None:
     """Test with numeric state attribute in condition."""
     config = {
@@ -1954,6 +2104,57 @@ async def test_zone_multiple_entities(hass: HomeAssistant) -> None:
     assert not test(hass)
 
 
+async def test_zone_cached(hass: HomeAssistant) -> None:
+    """Test zone checks are reused while the zone and entity are unchanged."""
+    config = {
+        "condition": "zone",
+        "entity_id": "device_tracker.person",
+        "zone": "zone.home",
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+    # An identical condition shares the cached results
+    test_2 = await condition.async_from_config(hass, config)
+
+    hass.states.async_set(
+        "zone.home",
+        "zoning",
+        {"name": "home", "latitude": 2.1, "longitude": 1.1, "radius": 10},
+    )
+    hass.states.async_set(
+        "device_tracker.person",
+        "home",
+        {"friendly_name": "person", "latitude": 2.1, "longitude": 1.1},
+    )
+    with patch(
+        "homeassistant.helpers.condition.zone", wraps=condition.zone
+    ) as mock_check:
+        assert test(hass)
+        assert test_2(hass)
+        assert test(hass)
+        assert mock_check.call_count == 1
+
+        # A change of the zone invalidates the cached result
+        hass.states.async_set(
+            "zone.home",
+            "zoning",
+            {"name": "home", "latitude": 20.1, "longitude": 10.1, "radius": 10},
+        )
+        assert not test(hass)
+        assert not test_2(hass)
+        assert mock_check.call_count == 2
+
+        # A change of the entity invalidates the cached result
+        hass.states.async_set(
+            "device_tracker.person",
+            "home",
+            {"friendly_name": "person", "latitude": 20.1, "longitude": 10.1},
+        )
+        assert test(hass)
+        assert mock_check.call_count == 3
+
+
 async def test_multiple_zones(hass: HomeAssistant) -> None:
     """Test with multiple entities in condition."""
     config = {
@@ -18,12 +18,14 @@ from homeassistant.const import (
 from homeassistant.core import Context, HomeAssistant, HomeAssistantError
 from homeassistant.helpers import device_registry as dr, entity, entity_registry as er
 from homeassistant.helpers.typing import UNDEFINED
+import homeassistant.util.dt as dt_util
 
 from tests.common import (
     MockConfigEntry,
     MockEntity,
     MockEntityPlatform,
     MockPlatform,
+    async_fire_time_changed,
     get_test_home_assistant,
     mock_registry,
 )
@@ -114,11 +116,9 @@ class TestHelpersEntity:
         """Test device class attribute."""
         state = self.hass.states.get(self.entity.entity_id)
         assert state.attributes.get(ATTR_DEVICE_CLASS) is None
-        with patch(
-            "homeassistant.helpers.entity.Entity.device_class", new="test_class"
-        ):
-            self.entity.schedule_update_ha_state()
-            self.hass.block_till_done()
+        self.entity._attr_device_class = "test_class"
+        self.entity.schedule_update_ha_state()
+        self.hass.block_till_done()
         state = self.hass.states.get(self.entity.entity_id)
         assert state.attributes.get(ATTR_DEVICE_CLASS) == "test_class"
 
@@ -1278,3 +1278,130 @@ async def test_warn_no_platform(
     caplog.clear()
     ent.async_write_ha_state()
     assert error_message not in caplog.text
+
+
+async def test_static_attributes_cached(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test static attributes are cached until they are invalidated."""
+
+    class StaticEntity(entity.Entity):
+        """Entity with static attributes."""
+
+        _attr_has_entity_name = True
+        _attr_icon = "mdi:flash"
+        _attr_name = "Power"
+        _attr_unique_id = "qwer"
+        _attr_device_info = {
+            "identifiers": {("hue", "1234")},
+            "name": "Device Bla",
+        }
+
+    class DynamicIconEntity(StaticEntity):
+        """Entity with an icon depending on its state."""
+
+        @property
+        def icon(self) -> str:
+            """Return the icon."""
+            return "mdi:flash"
+
+    assert StaticEntity._static_attributes_cacheable
+    assert not DynamicIconEntity._static_attributes_cacheable
+    # Attribute assignment is not intercepted
+    assert StaticEntity.__setattr__ is object.__setattr__
+
+    ent = StaticEntity()
+
+    async def async_setup_entry(hass, config_entry, async_add_entities):
+        """Mock setup entry method."""
+        async_add_entities([ent])
+        return True
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+    assert await entity_platform.async_setup_entry(config_entry)
+    await hass.async_block_till_done()
+
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes == {
+        ATTR_FRIENDLY_NAME: "Device Bla Power",
+        "icon": "mdi:flash",
+    }
+
+    with patch.object(
+        ent, "_calculate_static_attributes", wraps=ent._calculate_static_attributes
+    ) as calculate_static_attributes:
+        ent._attr_state = "on"
+        ent.async_write_ha_state()
+        assert calculate_static_attributes.call_count == 0
+
+        ent._attr_icon = "mdi:flash-off"
+        ent.async_write_ha_state()
+        assert calculate_static_attributes.call_count == 1
+        assert hass.states.get(ent.entity_id).attributes["icon"] == "mdi:flash-off"
+
+        # Setting the same value keeps the cache
+        ent._attr_icon = "mdi:flash-off"
+        ent.async_write_ha_state()
+        assert calculate_static_attributes.call_count == 1
+
+        ent.entity_description = entity.EntityDescription(key="power")
+        ent.async_write_ha_state()
+        assert calculate_static_attributes.call_count == 2
+
+        entity_registry.async_update_entity(ent.entity_id, name="Energy")
+        await hass.async_block_till_done()
+        assert calculate_static_attributes.call_count == 3
+        state = hass.states.get(ent.entity_id)
+        assert state.attributes[ATTR_FRIENDLY_NAME] == "Energy"
+
+        entity_registry.async_update_entity(ent.entity_id, name=None)
+        await hass.async_block_till_done()
+        device = device_registry.async_get_device(identifiers={("hue", "1234")})
+        device_registry.async_update_device(device.id, name_by_user="Device Bla2")
+        await hass.async_block_till_done()
+        assert calculate_static_attributes.call_count == 5
+        state = hass.states.get(ent.entity_id)
+        assert state.attributes[ATTR_FRIENDLY_NAME] == "Device Bla2 Power"
+
+
+async def test_min_write_interval(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test state writes within the minimum write interval are coalesced."""
+
+    class ChattyEntity(entity.Entity):
+        """Entity writing its state often."""
+
+        _attr_min_write_interval = timedelta(seconds=10)
+        _attr_unique_id = "qwer"
+
+    ent = ChattyEntity()
+    ent._attr_state = 0
+    platform = MockEntityPlatform(hass)
+    await platform.async_add_entities([ent])
+    assert hass.states.get(ent.entity_id).state == "0"
+
+    for value in range(1, 4):
+        ent._attr_state = value
+        ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).state == "0"
+
+    # The latest state is written at the end of the interval
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id).state == "3"
+
+    # The registry options override the interval of the entity
+    entity_registry.async_update_entity_options(
+        ent.entity_id, "homeassistant", {entity.CONF_MIN_WRITE_INTERVAL: 0}
+    )
+    await hass.async_block_till_done()
+    ent._attr_state = 4
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).state == "4"
@@ -132,6 +132,10 @@ async def test_set_scan_interval_via_config(
         {DOMAIN: {"platform": "platform", "scan_interval": timedelta(seconds=30)}}
     )
 
+    await hass.async_block_till_done()
+    # Polling every interval starts with the first poll
+    assert not mock_track.called
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
     await hass.async_block_till_done()
     assert mock_track.called
     assert timedelta(seconds=30) == mock_track.call_args[0][2]
@@ -2,9 +2,11 @@
 import asyncio
 from datetime import timedelta
 import logging
+import threading
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE
@@ -78,6 +80,158 @@ async def test_polling_disabled_by_config_entry(hass: HomeAssistant) -> None:
     assert entity_platform._async_unsub_polling is None
 
 
+async def test_polling_jitter(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the first poll of a platform is moved forward by a jitter."""
+    platform1 = MockEntityPlatform(
+        hass, platform_name="platform1", scan_interval=timedelta(seconds=20)
+    )
+    platform2 = MockEntityPlatform(
+        hass, platform_name="platform2", scan_interval=timedelta(seconds=20)
+    )
+    ent1 = MockEntity(should_poll=True)
+    ent1.update = Mock()
+    ent2 = MockEntity(should_poll=True)
+    ent2.update = Mock()
+
+    with patch.object(entity_platform, "_polling_phase", side_effect=[0.0, 1.0]):
+        await platform1.async_add_entities([ent1])
+        await platform2.async_add_entities([ent2])
+
+    freezer.tick(timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert not ent1.update.called
+    assert len(ent2.update.mock_calls) == 1
+
+    freezer.tick(timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(ent1.update.mock_calls) == 1
+    assert len(ent2.update.mock_calls) == 1
+
+    freezer.tick(timedelta(seconds=10))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(ent1.update.mock_calls) == 1
+    assert len(ent2.update.mock_calls) == 2
+
+    assert entity_platform._polling_phase("light.hue") == pytest.approx(
+        entity_platform._polling_phase("light.hue")
+    )
+    assert 0 <= entity_platform._polling_phase("light.hue") < 1
+
+
+async def test_polling_executor_budget(hass: HomeAssistant) -> None:
+    """Test entities updating in the executor share a global budget."""
+    updating = 0
+    peak_update_count = 0
+    lock = threading.Lock()
+    all_updating = threading.Event()
+    wait_timeout = 5.0
+
+    class SyncEntity(MockEntity):
+        """Mock entity that has update."""
+
+        def update(self):
+            nonlocal updating, peak_update_count
+            with lock:
+                updating += 1
+                peak_update_count = max(updating, peak_update_count)
+                if updating == 4:
+                    all_updating.set()
+            all_updating.wait(wait_timeout)
+            with lock:
+                updating -= 1
+
+    async def poll_platforms(max_polls: int) -> None:
+        """Poll two platforms set up with a budget of max_polls."""
+        hass.data.pop(entity_platform.DATA_POLLING_SCHEDULER, None)
+        with patch.object(entity_platform, "MAX_PARALLEL_EXECUTOR_POLLS", max_polls):
+            platform1 = MockEntityPlatform(hass, platform_name=f"p1_{max_polls}")
+            platform2 = MockEntityPlatform(hass, platform_name=f"p2_{max_polls}")
+            await platform1.async_add_entities([SyncEntity(), SyncEntity()])
+            await platform2.async_add_entities([SyncEntity(), SyncEntity()])
+
+        await asyncio.gather(
+            platform1._update_entity_states(dt_util.utcnow()),
+            platform2._update_entity_states(dt_util.utcnow()),
+        )
+
+    await poll_platforms(4)
+    assert peak_update_count == 4
+
+    peak_update_count = 0
+    all_updating.clear()
+    wait_timeout = 0.01
+    await poll_platforms(1)
+    assert peak_update_count == 1
+
+
+async def test_polling_executor_budget_after_parallel_updates(
+    hass: HomeAssistant,
+) -> None:
+    """Test entities waiting for parallel updates don't hold the budget."""
+    updated = []
+
+    class SyncEntity(MockEntity):
+        """Mock entity that has update."""
+
+        def update(self):
+            updated.append(self.entity_id)
+
+    with patch.object(entity_platform, "MAX_PARALLEL_EXECUTOR_POLLS", 1):
+        platform1 = MockEntityPlatform(hass, platform_name="platform1")
+        platform2 = MockEntityPlatform(hass, platform_name="platform2")
+        await platform1.async_add_entities([SyncEntity(entity_id="test.blocked")])
+        await platform2.async_add_entities([SyncEntity(entity_id="test.free")])
+
+    # The update of the first platform waits for its parallel updates
+    blocked = platform1.entities["test.blocked"]
+    blocked.parallel_updates = asyncio.Semaphore(0)
+    poll = hass.async_create_task(platform1._update_entity_states(dt_util.utcnow()))
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(platform2._update_entity_states(dt_util.utcnow()), 1)
+    assert updated == ["test.free"]
+
+    blocked.parallel_updates.release()
+    await poll
+    assert updated == ["test.free", "test.blocked"]
+
+
+async def test_poll_metrics(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the poll duration and overruns are recorded."""
+    platform = MockEntityPlatform(hass)
+    release = asyncio.Event()
+
+    async def async_update() -> None:
+        await release.wait()
+
+    ent = MockEntity(should_poll=True)
+    ent.async_update = async_update
+    await platform.async_add_entities([ent])
+    assert platform.poll_metrics == entity_platform.PollMetrics()
+    assert platform.poll_metrics.average_duration is None
+
+    poll = hass.async_create_task(platform._update_entity_states(dt_util.utcnow()))
+    await asyncio.sleep(0)
+    await platform._update_entity_states(dt_util.utcnow())
+    assert platform.poll_metrics.overruns == 1
+    assert platform.poll_metrics.polls == 0
+    assert "took longer than the scheduled update interval" in caplog.text
+
+    release.set()
+    await poll
+    assert platform.poll_metrics.polls == 1
+    assert platform.poll_metrics.last_duration is not None
+    assert platform.poll_metrics.max_duration == platform.poll_metrics.last_duration
+    assert platform.poll_metrics.average_duration == platform.poll_metrics.last_duration
+
+
 async def test_polling_updates_entities_with_exception(hass: HomeAssistant) -> None:
     """Test the updated entities that not break with an exception."""
     component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
@@ -192,6 +346,10 @@ async def test_set_scan_interval_via_platform(
 
     component.setup({DOMAIN: {"platform": "platform"}})
 
+    await hass.async_block_till_done()
+    # Polling every interval starts with the first poll
+    assert not mock_track.called
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
     await hass.async_block_till_done()
     assert mock_track.called
     assert timedelta(seconds=30) == mock_track.call_args[0][2]
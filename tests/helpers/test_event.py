@@ -3446,7 +3446,7 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
     """Test tracking time interval name.
 
     This test is to ensure that when a name is passed to async_track_time_interval,
-    that the name can be found in the TimerHandle when stringified.
+    that the name can be found in the TimerWheelHandle when stringified.
     """
     specific_runs = []
     unique_string = "xZ13"
@@ -3456,10 +3456,11 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
         timedelta(seconds=10),
         name=unique_string,
     )
-    scheduled = getattr(hass.loop, "_scheduled")
+    scheduled = hass.timer_wheel.handles()
     assert any(handle for handle in scheduled if unique_string in str(handle))
     unsub()
 
+    scheduled = hass.timer_wheel.handles()
     assert all(handle for handle in scheduled if unique_string not in str(handle))
     await hass.async_block_till_done()
 
@@ -18,6 +18,7 @@ from homeassistant.helpers.json import (
     find_paths_unserializable_data,
     json_bytes_strip_null,
     json_dumps,
+    json_dumps_extended,
     json_dumps_sorted,
     save_json,
 )
@@ -88,6 +89,34 @@ def test_extended_json_encoder(hass: HomeAssistant) -> None:
     assert ha_json_enc.default(o) == {"__type": str(type(o)), "repr": repr(o)}
 
 
+def test_json_dumps_extended(hass: HomeAssistant) -> None:
+    """Test the json dumps extended function matches the extended JSON encoder."""
+    state = State("test.test", "hello")
+    data = {
+        "datetime": dt_util.utcnow(),
+        "timedelta": datetime.timedelta(minutes=5),
+        "time": datetime.time(7, 20),
+        "date": datetime.date(2021, 12, 24),
+        "object": object(),
+        "state": state,
+        "set": {"milk"},
+        1: "int key",
+    }
+    assert json.loads(json_dumps_extended(data)) == json.loads(
+        json.dumps(data, cls=ExtendedJSONEncoder)
+    )
+    # The cached JSON of the state is reused
+    assert state.as_dict_json() in json_dumps_extended(data)
+
+
+def test_json_dumps_extended_large_integer() -> None:
+    """Test the json dumps extended function encodes integers over 64 bits."""
+    data = {"big": 2**70, "date": datetime.date(2021, 12, 24)}
+    assert json.loads(json_dumps_extended(data)) == json.loads(
+        json.dumps(data, cls=ExtendedJSONEncoder)
+    )
+
+
 def test_json_dumps_sorted() -> None:
     """Test the json dumps sorted function."""
     data = {"c": 3, "a": 1, "b": 2}
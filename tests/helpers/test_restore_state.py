@@ -13,10 +13,12 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.json import json_bytes, json_dumps
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
     STORAGE_KEY,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -25,6 +27,7 @@ from homeassistant.helpers.restore_state import (
 )
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from tests.common import (
     MockEntityPlatform,
@@ -40,6 +43,11 @@ DOMAIN = "test_domain"
 PLATFORM = "test_platform"
 
 
+def _written_states(mock_write_data: Mock) -> list[dict[str, Any]]:
+    """Return the states passed to the mocked store as they are stored."""
+    return json_loads(json_dumps(mock_write_data.mock_calls[0][1][0]))
+
+
 async def test_caching_data(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     now = dt_util.utcnow()
@@ -124,6 +132,18 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
+        await hass.async_block_till_done()
+
+    # Nothing changed since the startup save
+    assert not mock_write_data.called
+
+    data.last_states["input_boolean.b2"] = StoredState(
+        State("input_boolean.b2", "on"), None, dt_util.utcnow()
+    )
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -190,6 +210,9 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    data.last_states["input_boolean.b2"] = StoredState(
+        State("input_boolean.b2", "on"), None, dt_util.utcnow()
+    )
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -299,8 +322,7 @@ async def test_dump_data(hass: HomeAssistant) -> None:
         await data.async_dump_states()
 
     assert mock_write_data.called
-    args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = _written_states(mock_write_data)
 
     # b0 should not be written, since it didn't extend RestoreEntity
     # b1 should be written, since it is present in the current run
@@ -325,8 +347,7 @@ async def test_dump_data(hass: HomeAssistant) -> None:
         await data.async_dump_states()
 
     assert mock_write_data.called
-    args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = _written_states(mock_write_data)
     assert len(written_states) == 2
     assert written_states[0]["state"]["entity_id"] == "input_boolean.b3"
     assert written_states[0]["state"]["state"] == "off"
@@ -523,3 +544,85 @@ async def test_restore_entity_end_to_end(
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
+
+
+async def test_dump_reuses_encoded_states(hass: HomeAssistant) -> None:
+    """Test only changed states are encoded and unchanged dumps are skipped."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for idx in range(2):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        entity._attr_state = "on"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+
+    data = async_get(hass)
+    with patch("homeassistant.helpers.restore_state.Store.async_save"):
+        await data.async_dump_states()
+
+    # Unchanged states are not written periodically
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states(skip_unchanged=True)
+    assert not mock_write_data.called
+
+    entities[1]._attr_state = "off"
+    entities[1].async_write_ha_state()
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data, patch(
+        "homeassistant.core.json_dumps", wraps=json_dumps
+    ) as mock_json_dumps:
+        await data.async_dump_states(skip_unchanged=True)
+    assert mock_write_data.called
+    # Only the changed state was encoded
+    assert mock_json_dumps.call_count == 1
+    assert [
+        (stored["state"]["entity_id"], stored["state"]["state"])
+        for stored in _written_states(mock_write_data)
+    ] == [("input_boolean.b0", "on"), ("input_boolean.b1", "off")]
+
+
+async def test_dump_reuses_encoded_extra_data(hass: HomeAssistant) -> None:
+    """Test extra data is only encoded again when it changes."""
+
+    class MockRestoreEntity(RestoreEntity):
+        """Mock restore entity with extra data."""
+
+        extra_value = 1
+
+        @property
+        def extra_restore_state_data(self) -> RestoredExtraData:
+            """Return entity specific state data to be restored."""
+            return RestoredExtraData({"value": self.extra_value})
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = MockRestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b0"
+    await platform.async_add_entities([entity])
+
+    data = async_get(hass)
+    with patch("homeassistant.helpers.restore_state.Store.async_save"), patch(
+        "homeassistant.helpers.restore_state.json_bytes", wraps=json_bytes
+    ) as mock_json_bytes:
+        await data.async_dump_states()
+        assert mock_json_bytes.call_count == 1
+
+        # Equal extra data reuses the encoded JSON
+        await data.async_dump_states()
+        assert mock_json_bytes.call_count == 1
+
+    entity.extra_value = 2
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data, patch(
+        "homeassistant.helpers.restore_state.json_bytes", wraps=json_bytes
+    ) as mock_json_bytes:
+        await data.async_dump_states(skip_unchanged=True)
+    assert mock_json_bytes.call_count == 1
+    assert mock_write_data.called
+    assert _written_states(mock_write_data)[0]["extra_data"] == {"value": 2}
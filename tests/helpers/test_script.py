@@ -926,6 +926,37 @@ async def test_wait_for_trigger_variables(hass: HomeAssistant) -> None:
         assert script_obj.last_action is None
 
 
+async def test_wait_for_trigger_single_entity_id(hass: HomeAssistant) -> None:
+    """Test wait_for_trigger with a state trigger for an entity id string."""
+    wait_alias = "wait step"
+    # Not validated, the entity_id is not turned into a list
+    sequence = [
+        {
+            "alias": wait_alias,
+            "wait_for_trigger": [
+                {"platform": "state", "entity_id": "switch.test", "to": "off"}
+            ],
+        }
+    ]
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+    wait_started_flag = async_watch_for_action(script_obj, wait_alias)
+
+    try:
+        hass.states.async_set("switch.test", "on")
+        hass.async_create_task(script_obj.async_run(context=Context()))
+        await asyncio.wait_for(wait_started_flag.wait(), 1)
+        assert script_obj.is_running
+        assert script_obj.last_action == wait_alias
+        hass.states.async_set("switch.test", "off")
+        await hass.async_block_till_done()
+    except (AssertionError, asyncio.TimeoutError):
+        await script_obj.async_stop()
+        raise
+    else:
+        assert not script_obj.is_running
+        assert script_obj.last_action is None
+
+
 @pytest.mark.parametrize("action_type", ["template", "trigger"])
 async def test_wait_basic_times_out(hass: HomeAssistant, action_type) -> None:
     """Test wait actions times out when the action does not happen."""
@@ -4208,6 +4239,36 @@ async def test_script_mode_queued_cancel(hass: HomeAssistant) -> None:
         raise
 
 
+async def test_script_mode_queued_cancel_then_stop(hass: HomeAssistant) -> None:
+    """Test stopping after cancelling a queued run before it resumes."""
+    script_obj = script.Script(
+        hass,
+        cv.SCRIPT_SCHEMA({"wait_template": "{{ false }}"}),
+        "Test Name",
+        "test_domain",
+        script_mode="queued",
+        max_runs=2,
+    )
+    wait_started_flag = async_watch_for_action(script_obj, "wait")
+
+    task1 = hass.async_create_task(script_obj.async_run(context=Context()))
+    await asyncio.wait_for(wait_started_flag.wait(), 1)
+    task2 = hass.async_create_task(script_obj.async_run(context=Context()))
+    await asyncio.sleep(0)
+    assert script_obj.queued_runs == 1
+
+    # The queue is drained before the cancelled run resumes
+    task2.cancel()
+    await script_obj.async_stop()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task2
+    await task1
+
+    assert not script_obj.is_running
+    assert script_obj.runs == 0
+
+
 async def test_script_mode_queued_stop(hass: HomeAssistant) -> None:
     """Test stopping with a queued run."""
     script_obj = script.Script(
@@ -4239,6 +4300,51 @@ async def test_script_mode_queued_stop(hass: HomeAssistant) -> None:
     assert script_obj.runs == 0
 
 
+async def test_script_mode_queued_burst(hass: HomeAssistant) -> None:
+    """Test a burst of queued runs only creates runs when they start."""
+    event = "test_event"
+    events = async_capture_events(hass, event)
+    script_obj = script.Script(
+        hass,
+        cv.SCRIPT_SCHEMA(
+            [
+                {"wait_template": "{{ states.switch.test.state == 'on' }}"},
+                {"event": event},
+            ]
+        ),
+        "Test Name",
+        "test_domain",
+        script_mode="queued",
+        max_runs=10,
+    )
+    wait_started_flag = async_watch_for_action(script_obj, "wait")
+    hass.states.async_set("switch.test", "off")
+
+    hass.async_create_task(script_obj.async_run(context=Context()))
+    await asyncio.wait_for(wait_started_flag.wait(), 1)
+    tasks_before = len(asyncio.all_tasks())
+    for _ in range(14):
+        hass.async_create_task(script_obj.async_run(context=Context()))
+    await asyncio.sleep(0)
+
+    assert script_obj.runs == 10
+    assert script_obj.queued_runs == 9
+    assert script_obj.max_queue_depth == 9
+    assert script_obj.dropped_runs == 5
+    assert len(script_obj._runs) == 1
+    # The queued runs wait without creating tasks of their own
+    assert len(asyncio.all_tasks()) == tasks_before + 9
+
+    hass.states.async_set("switch.test", "on")
+    await hass.async_block_till_done()
+
+    assert not script_obj.is_running
+    assert len(events) == 10
+    assert script_obj.queued_runs == 0
+    assert script_obj.queued_runs_started == 9
+    assert script_obj.queue_wait_time > 0
+
+
 async def test_script_logging(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1,10 +1,15 @@
 """Test significant change helper."""
+from datetime import timedelta
+
 import pytest
 
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import ATTR_DEVICE_CLASS, STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers import significant_change
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
 
 
 @pytest.fixture(name="checker")
@@ -72,3 +77,53 @@ async def test_significant_change_extra(hass: HomeAssistant, checker) -> None:
         State(ent_id, "200", attrs), extra_arg=1
     )
     assert checker.async_is_significant_change(State(ent_id, "200", attrs), extra_arg=2)
+
+
+async def test_significant_change_feed(hass: HomeAssistant, checker) -> None:
+    """Test the feed checks once and coalesces changes per subscriber."""
+    feed = await significant_change.async_get_feed(hass)
+    assert await significant_change.async_get_feed(hass) is feed
+    immediate: list[significant_change.StateChanges] = []
+    windowed: list[significant_change.StateChanges] = []
+
+    unsub_immediate = feed.async_subscribe(
+        callback(lambda state: state.domain == "test_domain"), immediate.append
+    )
+    unsub_windowed = feed.async_subscribe(
+        callback(lambda state: True), windowed.append, 5
+    )
+
+    hass.states.async_set("test_domain.test_entity", "100")
+    hass.states.async_set("test_domain.test_entity", "110")
+    # Under 5 difference is not significant (per test mock)
+    hass.states.async_set("test_domain.test_entity", "112")
+    hass.states.async_set("other_domain.entity", "on")
+    await hass.async_block_till_done()
+
+    assert [
+        {entity_id: (old.state if old else None, new.state)}
+        for changes in immediate
+        for entity_id, (old, new) in changes.items()
+    ] == [
+        {"test_domain.test_entity": (None, "100")},
+        {"test_domain.test_entity": ("100", "110")},
+    ]
+    assert windowed == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+
+    assert len(windowed) == 1
+    assert {
+        entity_id: (old.state if old else None, new.state)
+        for entity_id, (old, new) in windowed[0].items()
+    } == {
+        "test_domain.test_entity": (None, "110"),
+        "other_domain.entity": (None, "on"),
+    }
+
+    unsub_immediate()
+    unsub_windowed()
+    hass.states.async_set("test_domain.test_entity", "200")
+    await hass.async_block_till_done()
+    assert len(immediate) == 2
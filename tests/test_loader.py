@@ -1,4 +1,7 @@
 """Test to verify that we can load components."""
+from datetime import timedelta
+import pathlib
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -6,9 +9,16 @@ import pytest
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__
 from homeassistant.core import HomeAssistant, callback
+import homeassistant.util.dt as dt_util
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_component_dependencies(hass: HomeAssistant) -> None:
@@ -726,3 +736,83 @@ async def test_loggers(hass: HomeAssistant) -> None:
         },
     )
     assert integration.loggers == ["name1", "name2"]
+
+
+@pytest.mark.parametrize("save_manifest_cache", [True])
+async def test_manifest_cache_saved(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test parsed manifests and dependencies are persisted."""
+    integration = await loader.async_get_integration(hass, "mobile_app")
+    assert await integration.resolve_dependencies()
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    assert data["ha_version"] == __version__
+    manifest_path = str(integration.file_path / "manifest.json")
+    assert data["manifests"][manifest_path]["manifest"]["domain"] == "mobile_app"
+    assert "is_built_in" not in data["manifests"][manifest_path]["manifest"]
+    assert data["dependencies"]["mobile_app"] == sorted(integration.all_dependencies)
+
+
+@pytest.mark.parametrize(
+    ("mtime_offset", "name"), [(0, "Cached Hue"), (1, "Philips Hue")]
+)
+async def test_manifest_cache_validated(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mtime_offset: int,
+    name: str,
+) -> None:
+    """Test cached manifests are only used if the file did not change."""
+    manifest_path = pathlib.Path(hue.__file__).parent / "manifest.json"
+    stat = manifest_path.stat()
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "data": {
+            "ha_version": __version__,
+            "manifests": {
+                str(manifest_path): {
+                    "mtime": stat.st_mtime_ns + mtime_offset,
+                    "size": stat.st_size,
+                    "manifest": {"domain": "hue", "name": "Cached Hue"},
+                }
+            },
+            "directories": {},
+            "dependencies": {},
+        },
+    }
+
+    integration = await loader.async_get_integration(hass, "hue")
+    assert integration.name == name
+
+
+async def test_manifest_cache_copies(hass: HomeAssistant) -> None:
+    """Test manifests are cached after the executor job and handed out as copies."""
+    manifest_path = pathlib.Path(hue.__file__).parent / "manifest.json"
+    manifest_cache = await loader._async_get_manifest_cache(hass)
+    updates = loader._ManifestCacheUpdates()
+
+    manifest = await hass.async_add_executor_job(
+        manifest_cache.get_manifest, manifest_path, updates
+    )
+    assert manifest["domain"] == "hue"
+    assert str(manifest_path) in updates.manifests
+    assert str(manifest_path) not in manifest_cache._manifests
+
+    manifest_cache.async_merge(updates)
+    manifest["codeowners"].append("@someone")
+
+    updates = loader._ManifestCacheUpdates()
+    cached = manifest_cache.get_manifest(manifest_path, updates)
+    assert not updates.manifests
+    assert "@someone" not in cached["codeowners"]
+    cached["codeowners"].append("@someone")
+    assert (
+        "@someone"
+        not in manifest_cache.get_manifest(manifest_path, updates)["codeowners"]
+    )
@@ -0,0 +1,125 @@
+"""Test the timer wheel."""
+import asyncio
+import contextvars
+
+from homeassistant.util.timer_wheel import TimerWheel
+
+
+async def test_timers_run_in_order() -> None:
+    """Test timers in different buckets run in order on a single loop timer."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, tick=0.01)
+    calls = []
+    now = loop.time()
+
+    wheel.call_at(now + 0.05, calls.append, 3)
+    wheel.call_at(now + 0.02, calls.append, 1)
+    wheel.call_at(now + 0.021, calls.append, 2)
+    assert len(wheel) == 3
+    timers = [
+        handle
+        for handle in loop._scheduled
+        if getattr(handle._callback, "__self__", None) is wheel
+    ]
+    assert len(timers) == 1
+
+    await asyncio.sleep(0.1)
+    assert calls == [1, 2, 3]
+    assert len(wheel) == 0
+    assert not any(
+        getattr(handle._callback, "__self__", None) is wheel
+        for handle in loop._scheduled
+        if not handle.cancelled()
+    )
+
+
+async def test_cancel() -> None:
+    """Test cancelled timers are removed and do not run."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, tick=0.01)
+    calls = []
+    now = loop.time()
+
+    first = wheel.call_at(now + 0.02, calls.append, 1)
+    second = wheel.call_at(now + 0.02, calls.append, 2)
+    first.cancel()
+    assert first.cancelled()
+    assert wheel.handles() == [second]
+
+    second.cancel()
+    assert len(wheel) == 0
+    # The loop timer is cancelled once no timers are left
+    assert all(
+        handle.cancelled()
+        for handle in loop._scheduled
+        if getattr(handle._callback, "__self__", None) is wheel
+    )
+
+    await asyncio.sleep(0.05)
+    assert calls == []
+
+
+async def test_run_due() -> None:
+    """Test running the timers due at a given loop time."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, tick=1)
+    calls = []
+    now = loop.time()
+
+    wheel.call_at(now + 10.2, calls.append, 1)
+    wheel.call_at(now + 10.6, calls.append, 2)
+    wheel.call_at(now + 30, calls.append, 3)
+
+    wheel.run_due(now + 10.5)
+    assert calls == [1]
+    assert len(wheel) == 2
+
+    wheel.run_due(now + 30)
+    assert calls == [1, 2, 3]
+    assert len(wheel) == 0
+
+
+async def test_schedule_while_running() -> None:
+    """Test timers scheduled by a running timer run on a later pass."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, tick=0.01)
+    calls = []
+
+    def reschedule() -> None:
+        calls.append(1)
+        wheel.call_at(loop.time(), calls.append, 2)
+
+    wheel.call_at(loop.time(), reschedule)
+    wheel.run_due(loop.time())
+    assert calls == [1]
+
+    await asyncio.sleep(0.05)
+    assert calls == [1, 2]
+
+
+async def test_handle_matches_timer_handle() -> None:
+    """Test wheel handles are initialized like asyncio timer handles."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop, tick=0.01)
+    context = contextvars.copy_context()
+
+    def callback() -> None:
+        """Test callback."""
+
+    handle = wheel.call_at(loop.time() + 10, callback, context=context)
+    timer_handle = asyncio.TimerHandle(handle.when(), callback, (), loop, context)
+    assert repr(handle) == repr(timer_handle).replace("TimerHandle", "TimerWheelHandle")
+    assert handle._context is context
+    assert handle._source_traceback is None
+    handle.cancel()
+    assert handle.cancelled()
+    assert "cancelled" in repr(handle)
+
+    loop.set_debug(True)
+    try:
+        handle = wheel.call_at(loop.time() + 10, callback)
+        assert handle._source_traceback
+        handle.cancel()
+    finally:
+        loop.set_debug(False)
+    assert len(wheel) == 0
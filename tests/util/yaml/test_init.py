@@ -549,3 +549,127 @@ async def test_loading_actual_file_with_syntax(
             "fixtures", "bad.yaml.txt"
         )
         await hass.async_add_executor_job(load_yaml_config_file, fixture_path)
+
+
+def _write_yaml(path: pathlib.Path, content: str) -> None:
+    """Write a YAML file and make sure its modification time changes."""
+    mtime_ns = path.stat().st_mtime_ns + 1_000_000_000 if path.exists() else None
+    path.write_text(content)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_yaml_cache(try_both_loaders, tmp_path: pathlib.Path) -> None:
+    """Test only changed files and the files including them are re-parsed."""
+    config_path = tmp_path / YAML_CONFIG_FILE
+    _write_yaml(config_path, "a: !include a.yaml\nb: !include b.yaml")
+    _write_yaml(tmp_path / "a.yaml", "value: 1")
+    _write_yaml(tmp_path / "b.yaml", "value: 2")
+    cache = yaml.YamlCache()
+
+    with patch.object(
+        yaml_loader, "_load_yaml", wraps=yaml_loader._load_yaml
+    ) as mock_load:
+        config = load_yaml_config_file(str(config_path), cache=cache)
+        assert config == {"a": {"value": 1}, "b": {"value": 2}}
+        assert mock_load.call_count == 3
+
+        # Mutating the result does not change the cached tree
+        config["a"]["value"] = 3
+        mock_load.reset_mock()
+        config = load_yaml_config_file(str(config_path), cache=cache)
+        assert config == {"a": {"value": 1}, "b": {"value": 2}}
+        assert mock_load.call_count == 0
+
+        _write_yaml(tmp_path / "b.yaml", "value: 22")
+        config = load_yaml_config_file(str(config_path), cache=cache)
+        assert config == {"a": {"value": 1}, "b": {"value": 22}}
+        assert [call.args[0] for call in mock_load.call_args_list] == [
+            str(config_path),
+            str(tmp_path / "b.yaml"),
+        ]
+
+
+def test_yaml_cache_evicts_unused_files(
+    try_both_loaders, tmp_path: pathlib.Path
+) -> None:
+    """Test entries of files that are no longer loaded are removed."""
+    config_path = tmp_path / YAML_CONFIG_FILE
+    _write_yaml(config_path, "a: !include a.yaml\nb: !include b.yaml")
+    _write_yaml(tmp_path / "a.yaml", "value: 1")
+    _write_yaml(tmp_path / "b.yaml", "value: 2")
+    cache = yaml.YamlCache()
+
+    load_yaml_config_file(str(config_path), cache=cache)
+    assert {fname for fname, _ in cache._entries} == {
+        str(config_path),
+        str(tmp_path / "a.yaml"),
+        str(tmp_path / "b.yaml"),
+    }
+
+    # Included files of a cached tree are kept
+    load_yaml_config_file(str(config_path), cache=cache)
+    assert len(cache._entries) == 3
+
+    _write_yaml(config_path, "a: !include a.yaml")
+    (tmp_path / "b.yaml").unlink()
+    assert load_yaml_config_file(str(config_path), cache=cache) == {"a": {"value": 1}}
+    assert {fname for fname, _ in cache._entries} == {
+        str(config_path),
+        str(tmp_path / "a.yaml"),
+    }
+
+
+def test_yaml_cache_secrets(try_both_loaders, tmp_path: pathlib.Path) -> None:
+    """Test files using secrets are re-parsed when secrets.yaml changes."""
+    config_path = tmp_path / YAML_CONFIG_FILE
+    _write_yaml(config_path, "password: !secret password")
+    cache = yaml.YamlCache()
+
+    with pytest.raises(HomeAssistantError):
+        load_yaml_config_file(str(config_path), yaml.Secrets(tmp_path), cache)
+
+    _write_yaml(tmp_path / yaml.SECRET_YAML, "password: old")
+    assert load_yaml_config_file(str(config_path), yaml.Secrets(tmp_path), cache) == {
+        "password": "old"
+    }
+
+    _write_yaml(tmp_path / yaml.SECRET_YAML, "password: new")
+    assert load_yaml_config_file(str(config_path), yaml.Secrets(tmp_path), cache) == {
+        "password": "new"
+    }
+
+
+def test_yaml_cache_include_dir(try_both_loaders, tmp_path: pathlib.Path) -> None:
+    """Test files including a directory are re-parsed when files are added."""
+    config_path = tmp_path / YAML_CONFIG_FILE
+    _write_yaml(config_path, "sensor: !include_dir_merge_list sensors")
+    (tmp_path / "sensors").mkdir()
+    _write_yaml(tmp_path / "sensors" / "one.yaml", "- platform: one")
+    cache = yaml.YamlCache()
+
+    assert load_yaml_config_file(str(config_path), cache=cache) == {
+        "sensor": [{"platform": "one"}]
+    }
+
+    _write_yaml(tmp_path / "sensors" / "two.yaml", "- platform: two")
+    os.utime(tmp_path / "sensors", ns=(0, 0))
+    assert load_yaml_config_file(str(config_path), cache=cache) == {
+        "sensor": [{"platform": "one"}, {"platform": "two"}]
+    }
+
+
+def test_yaml_cache_env_var(try_both_loaders, tmp_path: pathlib.Path) -> None:
+    """Test files using environment variables are not cached."""
+    config_path = tmp_path / YAML_CONFIG_FILE
+    _write_yaml(config_path, "password: !env_var PASSWORD")
+    cache = yaml.YamlCache()
+
+    with patch.dict(os.environ, {"PASSWORD": "old"}):
+        assert load_yaml_config_file(str(config_path), cache=cache) == {
+            "password": "old"
+        }
+    with patch.dict(os.environ, {"PASSWORD": "new"}):
+        assert load_yaml_config_file(str(config_path), cache=cache) == {
+            "password": "new"
+        }